@@ -0,0 +1,20 @@
+bl_info = {
+    "name": "Advanced Cones",
+	"description": "Tool to generate various nose cone shapes",
+	"author": "Mackenzie Crawford",
+	"version": (2, 0, 2),
+	"blender": (2, 93, 0),
+	"location": "View3D > Add > Mesh",
+	"support": "COMMUNITY",
+    "category": "Add Mesh"
+}
+
+#the operators need blender, so they are only imported when the addon is registered. Everything else in the package can be used headless, see batch.py
+
+def register():
+	from . import operators
+	operators.register()
+
+def unregister():
+	from . import operators
+	operators.unregister()
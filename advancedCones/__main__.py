@@ -0,0 +1,7 @@
+import sys
+
+from .batch import main
+
+#guarded, since worker processes started with --jobs may import this module again
+if __name__ == "__main__":
+	sys.exit(main())
@@ -0,0 +1,161 @@
+#batch generator for Advanced Cones. Reads a list of cone specs from a JSON or CSV file and writes each one straight to a mesh file, without starting blender
+#
+#    python -m advancedCones specs.json --output-dir meshes --format stl
+#
+#a spec names its shape and any parameters that differ from the operator defaults, plus optionally segments and an output file name, e.g.
+#    [{"shape": "haack_series", "radius": 0.5, "length": 3, "C": 0.333, "rings": 128, "segments": 128, "output": "lv_haack.stl"}]
+#CSV files have one spec per row, with a header row naming the keys. Empty cells use the defaults
+#--jobs spreads the work over several processes, see also sweep.py for generating specs from parameter grids
+#--stream writes STL and PLY files ring by ring as they are revolved, so even multi-million triangle meshes only need memory for a couple of rings
+#"lods": n in a spec also writes n-1 coarser levels of detail ("lodRatio" times fewer rings and segments each) from the same profile, as name_LOD0 to name_LOD<n-1>
+
+import os
+import sys
+import csv
+import json
+import argparse
+import itertools
+import concurrent.futures
+
+from . import profiles
+from . import revolve
+from . import export
+from . import timing
+
+def read_specs(path):
+	#the list of cone specs in a JSON (a list, or an object with a "cones" list) or CSV file
+	if path.lower().endswith(".csv"):
+		with open(path, newline="") as f:
+			specs = [dict((key.strip(), value.strip()) for key, value in row.items() if key and value and value.strip()) for row in csv.DictReader(f)]
+	else:
+		with open(path) as f:
+			specs = json.load(f)
+		if isinstance(specs, dict):
+			specs = specs["cones"]
+	
+	#profile files of imported shapes are relative to the specs file
+	for spec in specs:
+		if isinstance(spec, dict) and spec.get("filepath"):
+			spec["filepath"] = os.path.join(os.path.dirname(path), spec["filepath"])
+	return specs
+
+def build_mesh(spec):
+	#samples and revolves a single cone spec
+	profile = profiles.profile_from_spec(spec)
+	return revolve.revolve(profile, int(spec.get("segments", 32)))
+
+def output_path(spec, index, outputDir, format):
+	#called before the spec is checked, so a spec with no shape still gets a path, and fails in generate_chunk like any other bad spec
+	if "output" in spec:
+		return os.path.join(outputDir, spec["output"])
+	return os.path.join(outputDir, "%s_%d.%s" % (spec.get("name", spec.get("shape", "cone")), index, format))
+
+def lod_path(path, level):
+	#meshes/cone.stl -> meshes/cone_LOD1.stl
+	root, extension = os.path.splitext(path)
+	return "%s_LOD%d%s" % (root, level, extension)
+
+def generate_chunk(chunk):
+	#builds and writes a chunk of (index, spec, path, format, stream) jobs. Runs in the worker processes, so it returns plain (index, path, vertices, faces, error) tuples
+	#a spec with "lods" writes one file per level of detail, each with its own result
+	#timing hooks are called from whichever process built the cone, so with --jobs they need to be added in the workers (or before they fork)
+	results = []
+	for index, spec, path, format, stream in chunk:
+		timings = timing.Timings()
+		written = []
+		try:
+			with timings.stage("profile") as stage:
+				profile = profiles.profile_from_spec(spec)
+				stage.counts(len(profile), 0)
+			segments = int(spec.get("segments", 32))
+			levels = revolve.lod_levels(profile, segments, int(spec.get("lods", 1)), int(spec.get("lodRatio", 4)), spec["shape"] in profiles.CORNER_STATION_SHAPES)
+			
+			for level, (levelProfile, levelSegments) in enumerate(levels):
+				levelPath = lod_path(path, level) if len(levels) > 1 else path
+				vertices = levelProfile.vertex_count(levelSegments) if len(levelProfile) > 0 else 0
+				faces = levelProfile.face_count(levelSegments)
+				if stream:
+					with timings.stage("stream") as stage:
+						export.stream_mesh(levelPath, levelProfile, levelSegments, format)
+						stage.counts(vertices, faces)
+				else:
+					with timings.stage("revolve") as stage:
+						mesh = revolve.revolve(levelProfile, levelSegments, profiles.geometry_key(spec, level))
+						stage.counts(vertices, faces)
+					with timings.stage("write") as stage:
+						export.write_mesh(levelPath, mesh, format)
+						stage.counts(vertices, faces)
+				written.append((index, levelPath, vertices, faces, None))
+		except (ValueError, KeyError, ZeroDivisionError, OSError) as e:
+			#report bad specs, and files that can't be written (a bad path, a full disk), and carry on with the rest of the batch
+			results.append((index, path, 0, 0, str(e)))
+			continue
+		timing.publish(spec["shape"], timings)
+		results.extend(written)
+	return results
+
+def chunks(iterable, size):
+	iterator = iter(iterable)
+	while True:
+		chunk = list(itertools.islice(iterator, size))
+		if not chunk:
+			return
+		yield chunk
+
+def generate(specs, outputDir=".", format="stl", jobs=1, chunkSize=16, stream=False):
+	#builds and writes every spec, yielding (index, path, vertices, faces, error) as each one completes. Specs can be any iterable, and are consumed lazily
+	#with jobs > 1 (or None for one per cpu), chunks of chunkSize specs are spread over a pool of processes and results arrive in completion order
+	#with stream, STL and PLY files are written ring by ring (see export.stream_mesh). Other formats are still built in memory
+	work = ((index, spec, path, None if "output" in spec else format, stream and os.path.splitext(path)[1][1:].lower() in export.STREAMERS)
+		for index, spec, path in ((index, spec, output_path(spec, index, outputDir, format)) for index, spec in enumerate(specs)))
+	
+	if jobs == 1:
+		for chunk in chunks(work, chunkSize):
+			for result in generate_chunk(chunk):
+				yield result
+		return
+	
+	with concurrent.futures.ProcessPoolExecutor(max_workers=jobs) as pool:
+		#only keep a couple of chunks per worker in flight, so huge sweeps never have all their specs queued at once
+		inFlight = 2*(jobs or os.cpu_count() or 1)
+		pending = set()
+		for chunk in chunks(work, chunkSize):
+			pending.add(pool.submit(generate_chunk, chunk))
+			if len(pending) >= inFlight:
+				done, pending = concurrent.futures.wait(pending, return_when=concurrent.futures.FIRST_COMPLETED)
+				for future in done:
+					for result in future.result():
+						yield result
+		
+		for future in concurrent.futures.as_completed(pending):
+			for result in future.result():
+				yield result
+
+def report(results):
+	#prints each written file, and each failed spec to stderr. Returns the exit code
+	failed = 0
+	for index, path, vertices, faces, error in results:
+		if error is None:
+			print(path)
+		else:
+			sys.stderr.write("spec %d: %s\n" % (index, error))
+			failed = failed+1
+	return 1 if failed else 0
+
+def add_generate_arguments(parser):
+	parser.add_argument("-o", "--output-dir", default=".", help="directory to write meshes to (default: current directory)")
+	parser.add_argument("-f", "--format", default="stl", choices=sorted(export.WRITERS), help="mesh format for specs without an output file name (default: stl)")
+	parser.add_argument("-j", "--jobs", type=int, default=1, help="number of worker processes, 0 for one per cpu (default: 1)")
+	parser.add_argument("--chunk-size", type=int, default=16, help="specs per work unit sent to a worker (default: 16)")
+	parser.add_argument("--stream", action="store_true", help="write STL and PLY files ring by ring instead of building each mesh in memory first")
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(prog="python -m advancedCones", description="Generate Advanced Cones meshes from a JSON or CSV list of cone specs, without blender")
+	parser.add_argument("specs", help="JSON or CSV file of cone specs")
+	add_generate_arguments(parser)
+	args = parser.parse_args(argv)
+
+	if not os.path.isdir(args.output_dir):
+		os.makedirs(args.output_dir)
+
+	return report(generate(read_specs(args.specs), args.output_dir, args.format, args.jobs or None, args.chunk_size, args.stream))
@@ -0,0 +1,292 @@
+#exact radius, slope and curvature of every Advanced Cones shape at arbitrary stations, for tools that need the true shape rather than a mesh of it
+#(panel methods, structural layout). Each evaluator works out its shape's constants once, when it is made, and then answers whole arrays of
+#queries with the same radius functions the profile engine samples. Has no dependency on blender
+#
+#stations are distances from the apex point, as in profiles.Profile: the tip is at start (0, or the top of a blunting cap) and the base at length
+#	shape = evaluators.TangentOgive(1.0, 3.0, blunted=True, sphereRadius=0.2)
+#	r = shape.radius(x)
+#	k = shape.curvature(x)
+
+import math
+import array
+import bisect
+
+from . import profiles
+from .profiles import VectorMath
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+#where a tip meets the axis at right angles (the ellipse, the haack series, power series with n < 1, a blunting cap) the slope is infinite,
+#and the radius functions give nan or raise there. These are the values returned instead, for the radius and its first and second derivatives
+TIP_VALUES = (0.0, float("inf"), float("-inf"))
+
+#the radius of a sphere cap centred on the axis at xc, and its derivatives
+
+def cap_radius(m, x, xc, sphereRadius):
+	return m.sqrt(sphereRadius*sphereRadius - (xc-x)**2)
+
+def cap_slope(m, x, xc, sphereRadius):
+	return (xc-x)/m.sqrt(sphereRadius*sphereRadius - (xc-x)**2)
+
+def cap_second_derivative(m, x, xc, sphereRadius):
+	return -sphereRadius*sphereRadius/m.sqrt(sphereRadius*sphereRadius - (xc-x)**2)**3
+
+CAP_FUNCTIONS = (cap_radius, cap_slope, cap_second_derivative)
+
+class ShapeEvaluator:
+	#subclasses give the shape's radius function and its derivatives (from profiles), and set params to the arguments they take after the station
+	#shapes with no length or no radius raise ValueError, like the generators (see profiles.check_dimensions)
+	#a blunted shape has a cap (xc, xt, sphereRadius): the sphere centred on the axis at xc replaces the shape from the tip to the tangency point xt
+	functions = ()
+
+	#curvature at a tip where the slope is infinite, which the general formula can't give (0/0)
+	tipCurvature = float("-inf")
+
+	def __init__(self, length, params, blunted=False, sphereRadius=0.0):
+		self.length = length
+		self.params = params
+		self.start = 0.0
+		self.cap = None
+		if blunted:
+			self.blunt(self.functions[0], self.functions[1], length, sphereRadius, params)
+
+	def blunt(self, func, slope, end, sphereRadius, params):
+		#fits the sphere to the shape given by func and slope from the tip to end, as the profiles do (see profiles.sphere_tangency)
+		if sphereRadius <= 0:
+			raise ValueError("a blunting sphere needs a radius greater than 0")
+		self.xc, self.xt, self.yt = profiles.sphere_tangency(func, slope, end, sphereRadius, *params)
+		self.cap = (self.xc, self.xt, sphereRadius)
+		self.start = self.xc - sphereRadius
+
+	def radius(self, x):
+		return self.evaluate(0, x)
+
+	def slope(self, x):
+		#dr/dx
+		return self.evaluate(1, x)
+
+	def second_derivative(self, x):
+		#d2r/dx2
+		return self.evaluate(2, x)
+
+	def curvature(self, x):
+		#signed curvature of the profile, r''/(1+r'^2)^1.5. Negative where the surface is convex, as every shape is except the straight n-conic
+		d1 = self.slope(x)
+		d2 = self.second_derivative(x)
+		if numpy is not None:
+			with numpy.errstate(invalid="ignore"):
+				k = numpy.asarray(d2/numpy.sqrt(1+d1*d1)**3)
+			k[numpy.isnan(k)] = self.tipCurvature
+			if self.cap is not None:
+				k[numpy.asarray(x) < self.cap[1]] = -1/self.cap[2]
+			return k
+
+		if isinstance(d1, float):
+			return self.point_curvature(x, d1, d2)
+		return array.array('d', [self.point_curvature(x[i], d1[i], d2[i]) for i in range(len(d1))])
+
+	def point_curvature(self, x, d1, d2):
+		if self.cap is not None and x < self.cap[1]:
+			return -1/self.cap[2]
+		if math.isinf(d1):
+			return self.tipCurvature
+		return d2/math.sqrt(1+d1*d1)**3
+
+	def evaluate(self, order, x):
+		#the order-th derivative of the radius at x, which is either one station or an array of them. Returns a float64 array shaped like x
+		#(or without numpy, a float or an array.array)
+		function = self.functions[order]
+		if numpy is not None:
+			x = numpy.asarray(x, dtype=numpy.float64)
+			with numpy.errstate(divide="ignore", invalid="ignore"):
+				values = numpy.empty(x.shape)
+				#broadcast, so that derivatives that don't depend on x (the parabola's second derivative) still give one value per station
+				values[...] = function(VectorMath, x, *self.params)
+				if self.cap is not None:
+					xc, xt, sphereRadius = self.cap
+					inside = x < xt
+					values[inside] = CAP_FUNCTIONS[order](VectorMath, x[inside], xc, sphereRadius)
+			values[numpy.isnan(values)] = TIP_VALUES[order]
+			return values
+
+		if isinstance(x, (int, float)):
+			return self.point(order, function, x)
+		return array.array('d', [self.point(order, function, station) for station in x])
+
+	def point(self, order, function, x):
+		try:
+			if self.cap is not None and x < self.cap[1]:
+				return CAP_FUNCTIONS[order](math, x, self.cap[0], self.cap[2])
+			return float(function(math, x, *self.params))
+		except (ZeroDivisionError, ValueError):
+			return TIP_VALUES[order]
+		except OverflowError:
+			#far past the base of a steep power series, as numpy gives it
+			return float("inf")
+
+class TangentOgive(ShapeEvaluator):
+	functions = (profiles.tangent_ogive_radius, profiles.tangent_ogive_slope, profiles.tangent_ogive_second_derivative)
+
+	def __init__(self, baseRadius, apexLength, blunted=False, sphereRadius=0.0):
+		profiles.check_dimensions("tangent_ogive", apexLength, baseRadius)
+		profiles.check_tangent_ogive(baseRadius, apexLength)
+		self.ogiveRadius = profiles.ogive_radius(baseRadius, apexLength)
+		ShapeEvaluator.__init__(self, apexLength, (apexLength, baseRadius, self.ogiveRadius), blunted, sphereRadius)
+
+class SecantOgive(ShapeEvaluator):
+	#raises ValueError if the ogive radius is too small for the given base radius and apex length
+	functions = (profiles.secant_ogive_radius, profiles.secant_ogive_slope, profiles.secant_ogive_second_derivative)
+
+	def __init__(self, baseRadius, apexLength, ogiveRadius, blunted=False, sphereRadius=0.0):
+		profiles.check_dimensions("secant_ogive", apexLength, baseRadius)
+		self.ogiveRadius = ogiveRadius
+		self.alpha = profiles.secant_ogive_alpha(baseRadius, apexLength, ogiveRadius)
+		#the slope is only infinite at the minimum ogive radius, where the circle is centred on the axis
+		self.tipCurvature = -1/ogiveRadius
+		ShapeEvaluator.__init__(self, apexLength, (ogiveRadius, self.alpha), blunted, sphereRadius)
+
+class ProlateHemispheroid(ShapeEvaluator):
+	functions = (profiles.prolate_hemispheroid_radius, profiles.prolate_hemispheroid_slope, profiles.prolate_hemispheroid_second_derivative)
+
+	def __init__(self, radius, length, blunted=False, sphereRadius=0.0):
+		profiles.check_dimensions("prolate_hemispheroid", length, radius)
+		#the tip of an ellipse with semi-axes length and radius has radius of curvature radius^2/length
+		self.tipCurvature = -length/(radius*radius)
+		ShapeEvaluator.__init__(self, length, (length, radius), blunted, sphereRadius)
+
+class Parabolic(ShapeEvaluator):
+	functions = (profiles.parabolic_radius, profiles.parabolic_slope, profiles.parabolic_second_derivative)
+
+	def __init__(self, radius, length, K, blunted=False, sphereRadius=0.0):
+		profiles.check_dimensions("parabolic", length, radius)
+		if not 0 <= K <= 1:
+			raise ValueError("K' must be between 0 and 1")
+		ShapeEvaluator.__init__(self, length, (length, radius, K), blunted, sphereRadius)
+
+class PowerSeries(ShapeEvaluator):
+	functions = (profiles.power_series_radius, profiles.power_series_slope, profiles.power_series_second_derivative)
+
+	def __init__(self, radius, length, n, blunted=False, sphereRadius=0.0):
+		#near the tip the curvature goes as x^(1-2n), so for n < 1 the tip is flat below n = 1/2, a parabola with radius of curvature radius^2/(2*length) at n = 1/2,
+		#and a point above that
+		profiles.check_dimensions("power_series", length, radius)
+		if n < 0.5:
+			self.tipCurvature = 0.0
+		elif n == 0.5:
+			self.tipCurvature = -2*length/(radius*radius)
+		ShapeEvaluator.__init__(self, length, (length, radius, n), blunted, sphereRadius)
+
+class HaackSeries(ShapeEvaluator):
+	functions = (profiles.haack_series_radius, profiles.haack_series_slope, profiles.haack_series_second_derivative)
+
+	def __init__(self, radius, length, C, blunted=False, sphereRadius=0.0):
+		profiles.check_dimensions("haack_series", length, radius)
+		ShapeEvaluator.__init__(self, length, (length, radius, C), blunted, sphereRadius)
+
+class NConic(ShapeEvaluator):
+	#straight frustums between the joints, so the slope is constant along each and the curvature is 0, except on a blunting cap
+	#at a joint, the slope and curvature are those of the frustum below it. Frustums of no length (two joints at the same distance from the apex point)
+	#are a flat step in the outline, and are skipped, so the radius just below such a joint is the one above the step
+	def __init__(self, apexLength, radii, lengths, blunted=False, sphereRadius=0.0):
+		#radii and lengths as nconic_profile takes them. The unblunted profile is exactly the joints
+		n = len(radii)
+		profiles.check_dimensions("nconic", apexLength, max(radii))
+		joints = profiles.nconic_profile(apexLength, radii, lengths, n, False, 0, 0)
+		jointX = list(joints.x)
+		jointR = list(joints.r)
+		
+		#each frustum as the distance from the apex point and the radius of its top, and its slope
+		self.jointX = []
+		self.jointR = []
+		self.slopes = []
+		for i in range(len(jointX)-1):
+			if jointX[i+1] > jointX[i]:
+				self.jointX.append(jointX[i])
+				self.jointR.append(jointR[i])
+				self.slopes.append((jointR[i+1]-jointR[i])/(jointX[i+1]-jointX[i]))
+		
+		ShapeEvaluator.__init__(self, apexLength, ())
+		if blunted:
+			#the cap is tangent to the tip frustum
+			tipLength, tipRadius = profiles.nconic_tip_joint(apexLength, radii, lengths, n)
+			if tipLength <= 0 or tipRadius <= 0:
+				raise ValueError("a blunted %s needs a radius and length greater than 0" % profiles.SHAPE_NAMES["nconic"])
+			self.blunt(profiles.cone_radius, profiles.cone_slope, tipLength, sphereRadius, (tipRadius/tipLength,))
+		
+		if numpy is not None:
+			self.jointX = numpy.array(self.jointX)
+			self.jointR = numpy.array(self.jointR)
+			self.slopes = numpy.array(self.slopes)
+	
+	def section(self, x):
+		#index of the frustum each station is on
+		if numpy is not None:
+			return numpy.clip(numpy.searchsorted(self.jointX, x, side="right")-1, 0, len(self.slopes)-1)
+		return min(max(bisect.bisect_right(self.jointX, x)-1, 0), len(self.slopes)-1)
+	
+	def evaluate(self, order, x):
+		if numpy is not None:
+			x = numpy.asarray(x, dtype=numpy.float64)
+			i = self.section(x)
+			if order == 0:
+				values = numpy.asarray(self.jointR[i] + self.slopes[i]*(x-self.jointX[i]))
+			elif order == 1:
+				values = numpy.asarray(self.slopes[i])
+			else:
+				values = numpy.zeros(x.shape)
+			if self.cap is not None:
+				xc, xt, sphereRadius = self.cap
+				inside = x < xt
+				with numpy.errstate(divide="ignore", invalid="ignore"):
+					values[inside] = CAP_FUNCTIONS[order](VectorMath, x[inside], xc, sphereRadius)
+				values[numpy.isnan(values)] = TIP_VALUES[order]
+			return values
+		
+		if isinstance(x, (int, float)):
+			return self.point(order, None, x)
+		return array.array('d', [self.point(order, None, station) for station in x])
+	
+	def point(self, order, function, x):
+		if self.cap is not None and x < self.cap[1]:
+			return ShapeEvaluator.point(self, order, function, x)
+		i = self.section(x)
+		if order == 0:
+			return self.jointR[i] + self.slopes[i]*(x-self.jointX[i])
+		if order == 1:
+			return self.slopes[i]
+		return 0.0
+	
+	def curvature(self, x):
+		if self.cap is None:
+			if numpy is not None:
+				return numpy.zeros(numpy.shape(x))
+			if isinstance(x, (int, float)):
+				return 0.0
+			return array.array('d', bytes(8*len(x)))
+		return ShapeEvaluator.curvature(self, x)
+
+def evaluator_from_spec(spec):
+	#the evaluator for the shape described by a cone spec (see profiles.SPEC_DEFAULTS), with the same corrections to out-of-range parameters as the generators
+	shape = spec.get("shape")
+	p = profiles.corrected_parameters(spec)
+
+	if shape == "tangent_ogive":
+		return TangentOgive(p["baseRadius"], p["apexLength"], p["blunted"], p["sphereRadius"])
+	if shape == "secant_ogive":
+		return SecantOgive(p["baseRadius"], p["apexLength"], p["ogiveRadius"], p["blunted"], p["sphereRadius"])
+	if shape == "prolate_hemispheroid":
+		return ProlateHemispheroid(p["radius"], p["length"], p["blunted"], p["sphereRadius"])
+	if shape == "parabolic":
+		return Parabolic(p["radius"], p["length"], p["K"], p["blunted"], p["sphereRadius"])
+	if shape == "power_series":
+		return PowerSeries(p["radius"], p["length"], p["n"], p["blunted"], p["sphereRadius"])
+	if shape == "haack_series":
+		return HaackSeries(p["radius"], p["length"], p["C"], p["blunted"], p["sphereRadius"])
+	if shape == "imported":
+		raise ValueError("imported profiles have no exact shape to evaluate, sample them with profiles.profile_from_spec instead")
+
+	radii, lengths = profiles.nconic_joints(p)
+	return NConic(p["apexLength"], radii, lengths, p["blunted"], p["sphereRadius"])
@@ -0,0 +1,270 @@
+#mesh file writers for Advanced Cones: binary STL, binary PLY and OBJ
+#the write_ functions take a mesh as returned by revolve.revolve: vertex coordinates, loop vertex indices, polygon loop starts and polygon loop totals
+#the stream_ functions revolve a profile ring by ring as they write, so they never hold more than two rings of the mesh in memory
+
+import os
+import array
+import struct
+
+from . import revolve
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+STL_HEADER = b"Advanced Cones".ljust(80, b" ")
+STL_TRIANGLE = struct.Struct("<12fH")
+
+#size of the write buffer for streamed files
+STREAM_BUFFER_SIZE = 1 << 20
+
+def face_runs(totals):
+	#splits the faces into runs of consecutive faces with the same vertex count, as (first face, end face, vertex count)
+	#revolved meshes only have a couple of runs (the tip, then all the quads), so each run can be written in one go
+	if numpy is not None:
+		totals = numpy.asarray(totals)
+		breaks = [0] + list(numpy.flatnonzero(numpy.diff(totals)) + 1) + [len(totals)]
+		return [(int(breaks[i]), int(breaks[i+1]), int(totals[breaks[i]])) for i in range(len(breaks)-1) if breaks[i] < breaks[i+1]]
+
+	runs = []
+	first = 0
+	for i in range(1, len(totals)+1):
+		if i == len(totals) or totals[i] != totals[first]:
+			runs.append((first, i, totals[first]))
+			first = i
+	return runs
+
+def triangulate(loops, starts, totals):
+	#fan-triangulates every face, returning a flat array of triangle vertex indices. Quads split along their first diagonal
+	if numpy is not None:
+		loops = numpy.asarray(loops)
+		starts = numpy.asarray(starts)
+		counts = numpy.asarray(totals) - 2
+		face = numpy.repeat(numpy.arange(len(counts)), counts)
+		corner = numpy.arange(len(face)) - (numpy.cumsum(counts) - counts)[face] + 1
+		first = starts[face]
+		return numpy.stack((loops[first], loops[first+corner], loops[first+corner+1]), axis=-1).ravel()
+
+	tris = array.array('i')
+	for start, total in zip(starts, totals):
+		for corner in range(1, total-1):
+			tris.extend((loops[start], loops[start+corner], loops[start+corner+1]))
+	return tris
+
+def stl_records(corners):
+	#binary STL triangle records for an array of triangle corners, shaped (triangles, 3, 3)
+	normals = numpy.cross(corners[:, 1]-corners[:, 0], corners[:, 2]-corners[:, 0])
+	lengths = numpy.sqrt((normals*normals).sum(axis=1))
+	lengths[lengths == 0] = 1
+
+	records = numpy.zeros(len(corners), dtype=[("normal", "<f4", 3), ("corners", "<f4", (3, 3)), ("attribute", "<u2")])
+	records["normal"] = normals/lengths[:, None]
+	records["corners"] = corners
+	return records.tobytes()
+
+def stl_triangle(a, b, c):
+	#a single binary STL triangle record, for when numpy isn't available
+	u = (b[0]-a[0], b[1]-a[1], b[2]-a[2])
+	v = (c[0]-a[0], c[1]-a[1], c[2]-a[2])
+	n = (u[1]*v[2]-u[2]*v[1], u[2]*v[0]-u[0]*v[2], u[0]*v[1]-u[1]*v[0])
+	length = (n[0]*n[0] + n[1]*n[1] + n[2]*n[2])**0.5 or 1
+	return STL_TRIANGLE.pack(n[0]/length, n[1]/length, n[2]/length, a[0], a[1], a[2], b[0], b[1], b[2], c[0], c[1], c[2], 0)
+
+def write_stl(path, coords, loops, starts, totals):
+	tris = triangulate(loops, starts, totals)
+
+	with open(path, "wb") as f:
+		f.write(STL_HEADER)
+		f.write(struct.pack("<I", len(tris)//3))
+
+		if numpy is not None:
+			f.write(stl_records(numpy.asarray(coords, dtype=numpy.float32).reshape(-1, 3)[numpy.asarray(tris).reshape(-1, 3)]))
+			return
+
+		for i in range(0, len(tris), 3):
+			f.write(stl_triangle(coords[3*tris[i]:3*tris[i]+3], coords[3*tris[i+1]:3*tris[i+1]+3], coords[3*tris[i+2]:3*tris[i+2]+3]))
+
+def ply_header(vertices, faces, countType):
+	return ("ply\nformat binary_little_endian 1.0\ncomment Advanced Cones\n"
+		"element vertex %d\nproperty float x\nproperty float y\nproperty float z\n"
+		"element face %d\nproperty list %s int vertex_indices\nend_header\n" % (vertices, faces, countType)).encode("ascii")
+
+def ply_faces(indices, countType):
+	#binary PLY face records for faces that all have the same vertex count, given as an array shaped (faces, vertex count)
+	if numpy is not None:
+		records = numpy.empty(len(indices), dtype=[("count", "u1" if countType == "uchar" else "<u4"), ("indices", "<i4", indices.shape[1])])
+		records["count"] = indices.shape[1]
+		records["indices"] = indices
+		return records.tobytes()
+
+	countFormat = "<B" if countType == "uchar" else "<I"
+	return b"".join(struct.pack(countFormat, len(face)) + struct.pack("<%di" % len(face), *face) for face in indices)
+
+def write_ply(path, coords, loops, starts, totals):
+	#binary little-endian PLY, keeping quads and n-gons rather than triangulating
+	countType = "uchar" if max(totals, default=0) <= 255 else "uint"
+
+	with open(path, "wb") as f:
+		f.write(ply_header(len(coords)//3, len(totals), countType))
+
+		if numpy is not None:
+			f.write(numpy.asarray(coords, dtype="<f4").tobytes())
+			loops = numpy.asarray(loops, dtype="<i4")
+			for first, end, total in face_runs(totals):
+				f.write(ply_faces(loops[starts[first]:starts[first]+(end-first)*total].reshape(-1, total), countType))
+			return
+
+		f.write(array.array('f', coords).tobytes())
+		f.write(ply_faces([loops[start:start+total] for start, total in zip(starts, totals)], countType))
+
+def write_obj(path, coords, loops, starts, totals):
+	with open(path, "w") as f:
+		f.write("# Advanced Cones\n")
+
+		if numpy is not None:
+			numpy.savetxt(f, numpy.asarray(coords).reshape(-1, 3), fmt="v %.7g %.7g %.7g")
+			loops = numpy.asarray(loops)
+			for first, end, total in face_runs(totals):
+				#obj indices start at 1
+				numpy.savetxt(f, loops[starts[first]:starts[first]+(end-first)*total].reshape(-1, total)+1, fmt="f" + " %d"*total)
+			return
+
+		for i in range(0, len(coords), 3):
+			f.write("v %.7g %.7g %.7g\n" % (coords[i], coords[i+1], coords[i+2]))
+		for start, total in zip(starts, totals):
+			f.write("f " + " ".join(str(loops[i]+1) for i in range(start, start+total)) + "\n")
+
+def ring_coords(profile, i, cos, sin):
+	#the vertices of station i of a revolved profile, as an array shaped (segments, 3), or a list of (x, y, z) tuples without numpy
+	r = profile.r[i]
+	z = profile.length - profile.x[i]
+	if numpy is not None:
+		ring = numpy.empty((len(cos), 3), dtype=numpy.float32)
+		ring[:, 0] = r*cos
+		ring[:, 1] = r*sin
+		ring[:, 2] = z
+		return ring
+	return [(r*cos[j], r*sin[j], z) for j in range(len(cos))]
+
+def stream_stl(path, profile, segments):
+	#writes the revolved profile as binary STL one band of faces at a time, triangulated the same way as write_stl
+	cos, sin = revolve.ring_angles(segments)
+	pole = profile.pole()
+	if len(profile) == 0:
+		triangles = 0
+	elif pole:
+		triangles = segments + 2*(len(profile)-2)*segments
+	else:
+		triangles = segments-2 + 2*(len(profile)-1)*segments
+
+	with open(path, "wb", buffering=STREAM_BUFFER_SIZE) as f:
+		f.write(STL_HEADER)
+		f.write(struct.pack("<I", triangles))
+		if len(profile) == 0:
+			return
+
+		if pole:
+			upper = None
+			tip = (0.0, 0.0, profile.length - profile.x[0])
+		else:
+			#n-gon closing the tip ring, fanned from its first vertex
+			upper = ring_coords(profile, 0, cos, sin)
+			if numpy is not None:
+				f.write(stl_records(numpy.stack((numpy.repeat(upper[:1], segments-2, axis=0), upper[1:-1], upper[2:]), axis=1)))
+			else:
+				for j in range(1, segments-1):
+					f.write(stl_triangle(upper[0], upper[j], upper[j+1]))
+
+		for i in range(1, len(profile)):
+			lower = ring_coords(profile, i, cos, sin)
+
+			if numpy is not None:
+				nextLower = numpy.roll(lower, -1, axis=0)
+				if upper is None:
+					corners = numpy.stack((lower, nextLower, numpy.repeat(numpy.asarray([tip], dtype=numpy.float32), segments, axis=0)), axis=1)
+				else:
+					#each quad (lower j, lower j+1, upper j+1, upper j) splits into two triangles along its first diagonal
+					nextUpper = numpy.roll(upper, -1, axis=0)
+					corners = numpy.stack((numpy.stack((lower, nextLower, nextUpper), axis=1), numpy.stack((lower, nextUpper, upper), axis=1)), axis=1).reshape(-1, 3, 3)
+				f.write(stl_records(corners))
+			else:
+				for j in range(segments):
+					nextJ = (j+1) % segments
+					if upper is None:
+						f.write(stl_triangle(lower[j], lower[nextJ], tip))
+					else:
+						f.write(stl_triangle(lower[j], lower[nextJ], upper[nextJ]))
+						f.write(stl_triangle(lower[j], upper[nextJ], upper[j]))
+
+			upper = lower
+
+def stream_ply(path, profile, segments):
+	#writes the revolved profile as binary PLY, first its vertices ring by ring and then its faces band by band, with the same layout as write_ply
+	cos, sin = revolve.ring_angles(segments)
+	pole = profile.pole()
+	first = 1 if pole else 0
+	countType = "uchar" if pole or segments <= 255 else "uint"
+
+	with open(path, "wb", buffering=STREAM_BUFFER_SIZE) as f:
+		f.write(ply_header(profile.vertex_count(segments) if len(profile) > 0 else 0, profile.face_count(segments), countType))
+		if len(profile) == 0:
+			return
+
+		if pole:
+			f.write(struct.pack("<3f", 0, 0, profile.length - profile.x[0]))
+		for i in range(first, len(profile)):
+			ring = ring_coords(profile, i, cos, sin)
+			if numpy is not None:
+				f.write(ring.astype("<f4").tobytes())
+			else:
+				f.write(array.array('f', [c for vertex in ring for c in vertex]).tobytes())
+
+		if numpy is not None:
+			j = numpy.arange(segments)
+			nextJ = (j+1) % segments
+			if pole:
+				f.write(ply_faces(numpy.stack((first+j, first+nextJ, numpy.zeros(segments, dtype=j.dtype)), axis=-1), countType))
+			else:
+				f.write(ply_faces(j[None, :], countType))
+			for k in range(len(profile)-first-1):
+				upper = first + k*segments
+				lower = upper + segments
+				f.write(ply_faces(numpy.stack((lower+j, lower+nextJ, upper+nextJ, upper+j), axis=-1), countType))
+			return
+
+		if pole:
+			f.write(ply_faces([(first+j, first+(j+1) % segments, 0) for j in range(segments)], countType))
+		else:
+			f.write(ply_faces([list(range(segments))], countType))
+		for k in range(len(profile)-first-1):
+			upper = first + k*segments
+			lower = upper + segments
+			f.write(ply_faces([(lower+j, lower+(j+1) % segments, upper+(j+1) % segments, upper+j) for j in range(segments)], countType))
+
+STREAMERS = {
+	"stl": stream_stl,
+	"ply": stream_ply,
+}
+
+WRITERS = {
+	"stl": write_stl,
+	"ply": write_ply,
+	"obj": write_obj,
+}
+
+def write_mesh(path, mesh, format=None):
+	#writes a mesh to path, picking the format from the file extension unless one is given
+	if format is None:
+		format = os.path.splitext(path)[1][1:].lower()
+	if format not in WRITERS:
+		raise ValueError("unsupported mesh format %r, expected one of %s" % (format, ", ".join(sorted(WRITERS))))
+	WRITERS[format](path, *mesh)
+
+def stream_mesh(path, profile, segments, format=None):
+	#writes a revolved profile to path without building the whole mesh first, picking the format from the file extension unless one is given
+	if format is None:
+		format = os.path.splitext(path)[1][1:].lower()
+	if format not in STREAMERS:
+		raise ValueError("unsupported format %r for streaming, expected one of %s" % (format, ", ".join(sorted(STREAMERS))))
+	STREAMERS[format](path, profile, segments)
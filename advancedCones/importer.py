@@ -0,0 +1,187 @@
+#profile readers for Advanced Cones: measured or optimized profiles of any length, as (x, radius) stations from a text or binary file
+#text files (.csv, .txt, .dat) have x and radius as the first two columns, separated by commas, semicolons, tabs or spaces. Lines before the first
+#station (a header) are skipped, as are blank lines and # comments after it. Binary files are either raw little-endian float64 x, radius pairs (.bin),
+#or a numpy array with a row per station (.npy)
+#stations are read into flat float arrays a chunk at a time, and simplified to a tolerance before anything is revolved. Has no dependency on blender
+
+import os
+import re
+import sys
+import math
+import array
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+SEPARATORS = re.compile(r"[,;\s]+")
+
+#bytes read at a time from binary files
+READ_CHUNK_SIZE = 1 << 20
+
+def signature(path):
+	#size and modification time of a profile file. Part of the cache key of its profile, so editing the file is picked up
+	try:
+		stat = os.stat(path)
+	except OSError as e:
+		raise ValueError("can't read profile file %r: %s" % (path, e.strerror))
+	return (stat.st_size, stat.st_mtime)
+
+def read_text(path):
+	x = array.array('d')
+	r = array.array('d')
+	with open(path) as f:
+		for number, line in enumerate(f, 1):
+			line = line.split("#", 1)[0].strip()
+			if not line:
+				continue
+			fields = SEPARATORS.split(line, 2)
+			try:
+				station = float(fields[0])
+				radius = float(fields[1])
+			except (ValueError, IndexError):
+				if len(x) == 0:
+					#still in the header
+					continue
+				raise ValueError("%s line %d: expected x and radius, got %r" % (path, number, line))
+			x.append(station)
+			r.append(radius)
+	return x, r
+
+def read_binary(path):
+	if numpy is not None:
+		data = numpy.fromfile(path, dtype="<f8")
+	else:
+		data = array.array('d')
+		with open(path, "rb") as f:
+			chunk = f.read(READ_CHUNK_SIZE)
+			while chunk:
+				data.frombytes(chunk[:len(chunk)//8*8])
+				if len(chunk) % 8:
+					raise ValueError("%s is not a whole number of float64 values" % path)
+				chunk = f.read(READ_CHUNK_SIZE)
+		if sys.byteorder == "big":
+			data.byteswap()
+	if len(data) % 2:
+		raise ValueError("%s has an odd number of values, expected x, radius pairs" % path)
+	return data[0::2], data[1::2]
+
+def read_npy(path):
+	if numpy is None:
+		raise ValueError("reading %s needs numpy" % path)
+	data = numpy.load(path)
+	if data.ndim != 2 or data.shape[1] < 2:
+		raise ValueError("%s should be an array with a row of x, radius per station, not shape %s" % (path, data.shape))
+	return numpy.ascontiguousarray(data[:, 0], dtype=numpy.float64), numpy.ascontiguousarray(data[:, 1], dtype=numpy.float64)
+
+def read_stations(path):
+	#the stations of a profile file as x and radius arrays, ordered from the tip, with x measured from the first station
+	extension = os.path.splitext(path)[1].lower()
+	try:
+		if extension == ".bin":
+			x, r = read_binary(path)
+		elif extension == ".npy":
+			x, r = read_npy(path)
+		else:
+			x, r = read_text(path)
+	except OSError as e:
+		raise ValueError("can't read profile file %r: %s" % (path, e.strerror))
+
+	if numpy is not None:
+		x = numpy.asarray(x, dtype=numpy.float64)
+		r = numpy.asarray(r, dtype=numpy.float64)
+	if len(x) < 2:
+		raise ValueError("%s has %d stations, a profile needs at least 2" % (path, len(x)))
+	if min(r) < 0:
+		raise ValueError("%s has negative radii" % path)
+
+	#profiles may be given from the base up
+	if x[0] > x[-1]:
+		x = x[::-1]
+		r = r[::-1]
+
+	if numpy is not None:
+		return x - x[0], r.copy()
+	return array.array('d', [station - x[0] for station in x]), array.array('d', r)
+
+def simplify(x, r, tolerance):
+	#Douglas-Peucker: the fewest stations such that no dropped station is further than tolerance from the line between the stations either side of it
+	#so the revolved surface stays within tolerance of the imported one. Works on any polyline, so profiles that double back are fine too
+	#a tolerance of 0 keeps every station
+	count = len(x)
+	if tolerance <= 0 or count < 3:
+		return x, r
+
+	if numpy is not None:
+		keep = numpy.zeros(count, dtype=bool)
+	else:
+		keep = [False]*count
+	keep[0] = keep[-1] = True
+
+	sections = [(0, count-1)]
+	while sections:
+		first, last = sections.pop()
+		if last - first < 2:
+			continue
+
+		dx = x[last]-x[first]
+		dr = r[last]-r[first]
+		length = math.hypot(dx, dr)
+		if numpy is not None:
+			px = x[first+1:last]-x[first]
+			pr = r[first+1:last]-r[first]
+			distance = numpy.abs(px*dr - pr*dx)/length if length > 0 else numpy.hypot(px, pr)
+			worst = int(numpy.argmax(distance))
+			furthest = distance[worst]
+		else:
+			furthest = -1
+			for i in range(first+1, last):
+				px = x[i]-x[first]
+				pr = r[i]-r[first]
+				distance = abs(px*dr - pr*dx)/length if length > 0 else math.hypot(px, pr)
+				if distance > furthest:
+					furthest = distance
+					worst = i-first-1
+
+		if furthest > tolerance:
+			split = first+1+worst
+			keep[split] = True
+			sections.append((first, split))
+			sections.append((split, last))
+
+	if numpy is not None:
+		return x[keep], r[keep]
+	return array.array('d', [x[i] for i in range(count) if keep[i]]), array.array('d', [r[i] for i in range(count) if keep[i]])
+
+def polyline_normals(x, r):
+	#(radial, axial) unit normals at each station of a polyline profile, along the bisector of the segments either side, so a simplified smooth
+	#profile still shades smooth. The end stations take the normal of their one segment
+	if numpy is not None:
+		dx = numpy.diff(x)
+		dr = numpy.diff(r)
+		length = numpy.hypot(dx, dr)
+		length[length == 0] = 1
+		tx = numpy.concatenate((dx/length, [0]))
+		tr = numpy.concatenate((dr/length, [0]))
+		#each station's tangent is the sum of its segments' directions
+		tx[1:] = tx[1:] + tx[:-1]
+		tr[1:] = tr[1:] + tr[:-1]
+		norm = numpy.hypot(tx, tr)
+		norm[norm == 0] = 1
+		return tx/norm, tr/norm
+
+	radial = array.array('d')
+	axial = array.array('d')
+	for i in range(len(x)):
+		tx = 0.0
+		tr = 0.0
+		for a, b in ((i-1, i), (i, i+1)):
+			if a >= 0 and b < len(x):
+				length = math.hypot(x[b]-x[a], r[b]-r[a]) or 1
+				tx = tx + (x[b]-x[a])/length
+				tr = tr + (r[b]-r[a])/length
+		norm = math.hypot(tx, tr) or 1
+		radial.append(tx/norm)
+		axial.append(tr/norm)
+	return radial, axial
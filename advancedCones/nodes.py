@@ -0,0 +1,370 @@
+#geometry nodes groups for Advanced Cones' parametric mode. Instead of a mesh, the operators can add an object whose geometry nodes modifier builds the cone,
+#with an input for every parameter, so later edits are evaluated by blender itself and undo only has to store the changed inputs
+#
+#each shape gets one node group, shared by all its cones. The group starts from a mesh cone primitive with a ring per station, a pole vertex at the tip
+#and an open base, which is the topology revolve.py builds, and moves each ring to its station along the axis and to the shape's radius there. The radius
+#functions and shape constants in profiles.py are written against a math namespace m, so here they are run with NodeMath, which builds math nodes instead
+#of computing numbers
+#stations are evenly spaced, adaptive rings and levels of detail need the mesh generators. So does blunting any shape but the tangent ogive and
+#the n-conic, the only ones whose tangency point is closed form (the others are found by profiles.sphere_tangency)
+
+import bpy
+import math
+
+from . import profiles
+
+#the oldest version whose geometry nodes the groups are written for
+MIN_VERSION = (3, 1, 0)
+
+#shapes that have a node group. Imported profiles need their file, so are always built as meshes
+SHAPES = ("tangent_ogive", "secant_ogive", "prolate_hemispheroid", "parabolic", "power_series", "haack_series", "nconic")
+
+#stored on each node group, and bumped whenever the groups change, so groups saved by older versions are rebuilt instead of reused
+GROUP_VERSION = 4
+GROUP_KEY = "advancedConesNodes"
+
+#(parameter, label) of each shape's group inputs, in the order the modifier shows them. Parameters and labels match the operator properties
+#every group also has Segments last
+SHAPE_INPUTS = {
+	"tangent_ogive": (("baseRadius", "Base Radius"), ("apexLength", "Apex Length"), ("blunted", "Spherically Blunted"), ("sphereRadius", "Sphere Radius"),
+		("sphereRings", "Sphere Rings"), ("ogiveRings", "Ogive Rings")),
+	"secant_ogive": (("baseRadius", "Base Radius"), ("apexLength", "Apex Length"), ("ogiveRadius", "Ogive Radius"), ("ogiveRings", "Ogive Rings")),
+	"prolate_hemispheroid": (("radius", "Radius"), ("length", "Length"), ("rings", "Rings"), ("smoothTip", "Smooth tip")),
+	"parabolic": (("radius", "Radius"), ("length", "Length"), ("K", "K'"), ("rings", "Rings")),
+	"power_series": (("radius", "Radius"), ("length", "Length"), ("n", "n"), ("rings", "Rings")),
+	"haack_series": (("radius", "Radius"), ("length", "Length"), ("C", "C"), ("rings", "Rings")),
+	"nconic": (("n", "n"), ("apexLength", "Apex length"), ("radius0", "Base radius")) +
+		tuple(pair for i in range(1, 10) for pair in (("radius" + str(i), "Radius " + str(i)), ("length" + str(i), "Length " + str(i)))) +
+		(("blunted", "Spherically Blunted"), ("sphereRadius", "Sphere Radius"), ("sphereRings", "Sphere Rings")),
+}
+
+#(min, max) of the inputs, as in the operators. Inputs not listed here are at least 0
+INPUT_LIMITS = {"rings": (1, None), "ogiveRings": (1, None), "sphereRings": (1, None), "segments": (3, None), "K": (0, 1)}
+SHAPE_INPUT_LIMITS = {("prolate_hemispheroid", "rings"): (3, None), ("power_series", "n"): (0, 1), ("nconic", "n"): (1, 10)}
+
+class Expression:
+	#a float computed by a node tree. Arithmetic on it adds math nodes, so profiles.py's formulas build the nodes that evaluate them
+	def __init__(self, tree, socket):
+		self.tree = tree
+		self.socket = socket
+
+	def __add__(self, other):
+		return math_node(self.tree, "ADD", self, other)
+
+	def __radd__(self, other):
+		return math_node(self.tree, "ADD", other, self)
+
+	def __sub__(self, other):
+		return math_node(self.tree, "SUBTRACT", self, other)
+
+	def __rsub__(self, other):
+		return math_node(self.tree, "SUBTRACT", other, self)
+
+	def __mul__(self, other):
+		return math_node(self.tree, "MULTIPLY", self, other)
+
+	def __rmul__(self, other):
+		return math_node(self.tree, "MULTIPLY", other, self)
+
+	def __truediv__(self, other):
+		return math_node(self.tree, "DIVIDE", self, other)
+
+	def __rtruediv__(self, other):
+		return math_node(self.tree, "DIVIDE", other, self)
+
+	def __pow__(self, other):
+		return math_node(self.tree, "POWER", self, other)
+
+	def __neg__(self):
+		return math_node(self.tree, "MULTIPLY", self, -1.0)
+
+def math_node(tree, operation, *operands):
+	#blender's math nodes are safe: the square root of a negative number, dividing by zero and so on give 0, never nan
+	node = tree.nodes.new("ShaderNodeMath")
+	node.operation = operation
+	for socket, operand in zip(node.inputs, operands):
+		if isinstance(operand, Expression):
+			tree.links.new(operand.socket, socket)
+		else:
+			socket.default_value = operand
+	return Expression(tree, node.outputs[0])
+
+class NodeMath:
+	#the math namespace the radius functions take (see profiles.VectorMath), building nodes in tree
+	pi = math.pi
+
+	def __init__(self, tree):
+		self.tree = tree
+
+	def sqrt(self, a):
+		return math_node(self.tree, "SQRT", a)
+
+	def sin(self, a):
+		return math_node(self.tree, "SINE", a)
+
+	def cos(self, a):
+		return math_node(self.tree, "COSINE", a)
+
+	def acos(self, a):
+		return math_node(self.tree, "ARCCOSINE", a)
+
+	def atan(self, a):
+		return math_node(self.tree, "ARCTANGENT", a)
+
+	def atan2(self, y, x):
+		return math_node(self.tree, "ARCTAN2", y, x)
+
+	def pow(self, a, b):
+		return math_node(self.tree, "POWER", a, b)
+
+	def min(self, a, b):
+		return math_node(self.tree, "MINIMUM", a, b)
+
+	def max(self, a, b):
+		return math_node(self.tree, "MAXIMUM", a, b)
+
+	def less(self, a, b):
+		#1 where a < b, 0 elsewhere
+		return math_node(self.tree, "LESS_THAN", a, b)
+
+	def equal(self, a, b):
+		#1 where a == b, for whole numbers
+		return math_node(self.tree, "COMPARE", a, b, 0.5)
+
+	def same(self, a, b):
+		#1 where a == b exactly
+		return math_node(self.tree, "COMPARE", a, b, 0.0)
+
+	def round(self, a):
+		return math_node(self.tree, "ROUND", a)
+
+	def select(self, condition, a, b):
+		#a where condition is 1, b where it is 0. Both sides are always evaluated, which is fine since neither can be nan
+		return condition*a + (1-condition)*b
+
+def add_socket(tree, inOut, socketType, name):
+	if (4, 0, 0) <= bpy.app.version:
+		#use the new API
+		return tree.interface.new_socket(name, in_out=inOut, socket_type=socketType)
+	else:
+		#use the old one
+		if inOut == "INPUT":
+			return tree.inputs.new(socketType, name)
+		return tree.outputs.new(socketType, name)
+
+def input_sockets(tree):
+	if (4, 0, 0) <= bpy.app.version:
+		#use the new API
+		return [item for item in tree.interface.items_tree if item.item_type == "SOCKET" and item.in_out == "INPUT"]
+	else:
+		#use the old one
+		return list(tree.inputs)
+
+def group_inputs(shape):
+	#(parameter, label, default) of every input of a shape's group
+	defaults = profiles.SPEC_DEFAULTS[shape]
+	return [(key, label, defaults[key]) for key, label in SHAPE_INPUTS[shape]] + [("segments", "Segments", 32)]
+
+def uniform(i, start, end, rings):
+	#the ith of rings+1 evenly spaced stations from start to end
+	return start + (end-start)*i/rings
+
+def capped(m, i, blunted, sphereRings):
+	#(count, inCap, j) for a shape that may start with a sphere cap: the number of cap stations before the shape's own (0 unblunted), 1 for stations on the cap,
+	#and the index of each station along the rest of the shape, counted from the tangency point
+	#the cap's last station is the tangency point, which is also the shape's first, so a blunted shape skips its first station
+	count = blunted*sphereRings
+	inCap = m.less(i, count + blunted)
+	return count, inCap, i - count
+
+def cap_station(m, i, count, xc, xt, yt, sphereRadius):
+	#(x, r) of the ith of count+1 stations along a sphere cap, evenly spaced by angle from the top of the sphere to the tangency point
+	phi = m.atan2(yt, xc-xt)*i/m.max(count, 1)
+	return profiles.sphere_cap_x(m, phi, xc, sphereRadius), profiles.sphere_cap_r(m, phi, sphereRadius)
+
+def tangent_ogive_stations(m, i, p):
+	L = p["apexLength"]
+	#wider than it is long, the ogive would never reach the axis (see profiles.check_tangent_ogive). The mesh generators refuse it, but modifier inputs
+	#can't raise an error, so the base radius is clamped to the apex length instead, which makes it a hemisphere
+	R = m.min(p["baseRadius"], L)
+	ogiveRadius = profiles.ogive_radius(R, L)
+	sphereRadius = m.min(p["sphereRadius"], profiles.SPHERE_RADIUS_MARGIN*R)
+	xc, xt, yt = profiles.tangent_ogive_cap(R, L, ogiveRadius, sphereRadius, m)
+
+	blunted = p["blunted"]
+	capCount, inCap, j = capped(m, i, blunted, p["sphereRings"])
+	start = blunted*xt
+	ogiveX = uniform(j, start, L, p["ogiveRings"])
+	capX, capR = cap_station(m, i, capCount, xc, xt, yt, sphereRadius)
+	x = m.select(inCap, capX, ogiveX)
+	r = m.select(inCap, capR, profiles.tangent_ogive_radius(m, ogiveX, L, R, ogiveRadius))
+	return capCount + p["ogiveRings"] + 1, L, x, r
+
+def secant_ogive_stations(m, i, p):
+	L = p["apexLength"]
+	R = p["baseRadius"]
+	ogiveRadius = m.max(p["ogiveRadius"], profiles.secant_ogive_min_radius(R, L))
+	alpha = profiles.secant_ogive_angle(m, R, L, ogiveRadius)
+	x = uniform(i, 0, L, p["ogiveRings"])
+	return p["ogiveRings"] + 1, L, x, profiles.secant_ogive_radius(m, x, ogiveRadius, alpha)
+
+def prolate_hemispheroid_stations(m, i, p):
+	#smooth tip divides the first 1/rings-length step into another rings stations
+	L = p["length"]
+	rings = p["rings"]
+	smoothTip = p["smoothTip"]
+	tipCount = smoothTip*rings
+	x = m.select(m.less(i, tipCount), uniform(i, 0, L/rings, rings), uniform(i - tipCount + smoothTip, 0, L, rings))
+	return rings + 1 + smoothTip*(rings-1), L, x, profiles.prolate_hemispheroid_radius(m, x, L, p["radius"])
+
+def series_stations(func, parameter):
+	#stations of the shapes whose radius function takes (length, radius, parameter)
+	def stations(m, i, p):
+		x = uniform(i, 0, p["length"], p["rings"])
+		return p["rings"] + 1, p["length"], x, func(m, x, p["length"], p["radius"], p[parameter])
+	return stations
+
+def power_series_stations(m, i, p):
+	#n = 0 is a cylinder, whose tip is a disc rather than a point. The pole is then an extra station at the centre of the disc, closing it with a flat
+	#triangle fan, where the mesh generators close it with an n-gon
+	flat = m.same(p["n"], 0)
+	x = uniform(m.max(i - flat, 0), 0, p["length"], p["rings"])
+	return p["rings"] + 1 + flat, p["length"], x, profiles.power_series_radius(m, x, p["length"], p["radius"], p["n"])
+
+def nconic_stations(m, i, p):
+	#the tip, then a station per joint working down from the tip, then the base. The nth joint is the tip, so joints past n-1 are left out
+	#like profiles.nconic_profile, a joint on top of the station before it (a zero-length frustum) is skipped, and the stations after it move up one
+	n = p["n"]
+	lengths = [m.less(j, n)*p["length" + str(j)] for j in range(1, 10)]
+	L = m.max(p["apexLength"], sum(lengths[1:], lengths[0]))
+	R = p["radius0"]
+
+	#the cap is tangent to the tip frustum, which ends at the base for n = 1 and at joint n-1 otherwise
+	single = m.equal(n, 1)
+	tipX = single*L
+	tipR = single*R
+	for j in range(1, 10):
+		tipX = tipX + m.equal(j, n-1)*p["length" + str(j)]
+		tipR = tipR + m.equal(j, n-1)*p["radius" + str(j)]
+	blunted = p["blunted"]
+	sphereRadius = m.min(p["sphereRadius"], profiles.SPHERE_RADIUS_MARGIN*tipR*m.sqrt(tipX*tipX + tipR*tipR)/tipX)
+	xc, xt, yt = profiles.cone_cap(tipX, tipR, sphereRadius, m)
+	capCount, inCap, k = capped(m, i, blunted, p["sphereRings"])
+
+	#k counts the stations kept after the tip (the apex point, or the cap's tangency point), which is station 0. The apex point adds nothing to the sums
+	lastX = blunted*xt
+	lastR = blunted*yt
+	kept = 1
+	jointX = 0
+	jointR = 0
+	for j in list(range(9, 0, -1)) + [0]:
+		x = L if j == 0 else p["length" + str(j)]
+		r = R if j == 0 else p["radius" + str(j)]
+		keep = (1 if j == 0 else m.less(j, n))*(1 - m.same(x, lastX)*m.same(r, lastR))
+		station = keep*m.equal(k, kept)
+		jointX = jointX + station*x
+		jointR = jointR + station*r
+		lastX = lastX + keep*(x - lastX)
+		lastR = lastR + keep*(r - lastR)
+		kept = kept + keep
+
+	capX, capR = cap_station(m, i, capCount, xc, xt, yt, sphereRadius)
+	return capCount + kept, L, m.select(inCap, capX, jointX), m.select(inCap, capR, jointR)
+
+STATION_FUNCTIONS = {
+	"tangent_ogive": tangent_ogive_stations,
+	"secant_ogive": secant_ogive_stations,
+	"prolate_hemispheroid": prolate_hemispheroid_stations,
+	"parabolic": series_stations(profiles.parabolic_radius, "K"),
+	"power_series": power_series_stations,
+	"haack_series": series_stations(profiles.haack_series_radius, "C"),
+	"nconic": nconic_stations,
+}
+
+def build_group(shape, name):
+	tree = bpy.data.node_groups.new(name, "GeometryNodeTree")
+	for key, label, default in group_inputs(shape):
+		if isinstance(default, bool):
+			socket = add_socket(tree, "INPUT", "NodeSocketBool", label)
+		elif isinstance(default, int):
+			socket = add_socket(tree, "INPUT", "NodeSocketInt", label)
+		else:
+			socket = add_socket(tree, "INPUT", "NodeSocketFloat", label)
+		socket.default_value = default
+		if not isinstance(default, bool):
+			minimum, maximum = SHAPE_INPUT_LIMITS.get((shape, key), INPUT_LIMITS.get(key, (0, None)))
+			socket.min_value = minimum
+			if maximum is not None:
+				socket.max_value = maximum
+	add_socket(tree, "OUTPUT", "NodeSocketGeometry", "Geometry")
+
+	nodes = tree.nodes
+	links = tree.links
+	inputNode = nodes.new("NodeGroupInput")
+	outputNode = nodes.new("NodeGroupOutput")
+	p = dict((key, Expression(tree, inputNode.outputs[label])) for key, label, default in group_inputs(shape))
+
+	#a cone primitive of count-1 side segments, one unit deep and wide, with its point at the top and no base, is a pole vertex and a ring for every
+	#later station, joined by a triangle fan and quads, as revolve.py builds them. Rings are evenly spaced down it, so a vertex's station is found from its height
+	m = NodeMath(tree)
+	cone = nodes.new("GeometryNodeMeshCone")
+	cone.fill_type = "NONE"
+	links.new(inputNode.outputs["Segments"], cone.inputs["Vertices"])
+	cone.inputs["Radius Top"].default_value = 0
+	cone.inputs["Radius Bottom"].default_value = 1
+	cone.inputs["Depth"].default_value = 1
+
+	position = nodes.new("ShaderNodeSeparateXYZ")
+	links.new(nodes.new("GeometryNodeInputPosition").outputs[0], position.inputs[0])
+	coneX, coneY, coneZ = (Expression(tree, position.outputs[axis]) for axis in "XYZ")
+	#the number of stations doesn't depend on the station, so the rounding node is linked to its input once the count is known
+	i = m.round(0)
+	count, length, x, r = STATION_FUNCTIONS[shape](m, i, p)
+	bands = count - 1
+	links.new(bands.socket, cone.inputs["Side Segments"])
+	links.new(((0.5 - coneZ)*bands).socket, i.socket.node.inputs[0])
+
+	#ring i of the primitive has radius i/bands, so scaling it by r*bands/i puts it at radius r. The pole is at radius 0, where the division gives 0
+	scale = r*bands/i
+	newPosition = nodes.new("ShaderNodeCombineXYZ")
+	links.new((coneX*scale).socket, newPosition.inputs["X"])
+	links.new((coneY*scale).socket, newPosition.inputs["Y"])
+	#from the tip at +z down to the base at the origin, as the mesh generators build them
+	links.new((length - x).socket, newPosition.inputs["Z"])
+	setPosition = nodes.new("GeometryNodeSetPosition")
+	links.new(cone.outputs["Mesh"], setPosition.inputs["Geometry"])
+	links.new(newPosition.outputs[0], setPosition.inputs["Position"])
+
+	smooth = nodes.new("GeometryNodeSetShadeSmooth")
+	links.new(setPosition.outputs["Geometry"], smooth.inputs["Geometry"])
+	links.new(smooth.outputs["Geometry"], outputNode.inputs["Geometry"])
+
+	tree[GROUP_KEY] = GROUP_VERSION
+	return tree
+
+def node_group(shape):
+	#the node group for a shape, built the first time it is needed and shared by every cone of that shape after that
+	name = "Advanced Cones %s" % profiles.SHAPE_NAMES[shape]
+	tree = bpy.data.node_groups.get(name)
+	if tree is not None and tree.get(GROUP_KEY) == GROUP_VERSION:
+		return tree
+	if tree is not None:
+		#left by an older version of the addon, or renamed to this by someone else, so keep it and build a new one alongside
+		tree.name = name + " (old)"
+	return build_group(shape, name)
+
+def add_parametric_object(spec, name):
+	#a new object with an empty mesh and a geometry nodes modifier building the cone of spec, with its inputs set from the spec's (corrected) parameters
+	#raises ValueError for parameters that can't be built. Returns the object, which still has to be linked to the scene
+	shape = spec["shape"]
+	p = profiles.corrected_parameters(spec)
+	p["segments"] = int(spec.get("segments", 32))
+	if p.get("blunted") and "blunted" not in dict(SHAPE_INPUTS[shape]):
+		raise ValueError("Geometry Nodes cones can only be spherically blunted for tangent ogives and n-conics")
+
+	obj = bpy.data.objects.new(name, bpy.data.meshes.new(name))
+	modifier = obj.modifiers.new(name="Advanced Cones", type="NODES")
+	modifier.node_group = node_group(shape)
+	for socket, (key, label, default) in zip(input_sockets(modifier.node_group), group_inputs(shape)):
+		modifier[socket.identifier] = p[key]
+	return obj
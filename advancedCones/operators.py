@@ -0,0 +1,1043 @@
+#blender operators for Advanced Cones. The shape math lives in profiles.py and revolve.py, which don't need blender
+
+import bpy
+import bmesh
+import mathutils
+import math
+import time
+import array
+import hashlib
+
+from . import profiles
+from . import revolve
+from . import properties
+from . import timing
+from . import nodes
+
+def build_mesh(profile, segments, name, timings, buffers=None, key=None):
+	#a new mesh datablock holding the revolved surface, in the cone's own space (base at the origin, tip along +z)
+	#buffers are a finished RevolveJob's buffers (revolve.revolve()'s plus the loop normals, or None in their place), if they have already been built
+	#key is the geometry key of the profile's spec, if known
+	mesh = bpy.data.meshes.new(name)
+	
+	if len(profile) > 0:
+		#the whole revolved surface is computed as flat arrays and loaded in bulk, rather than spinning a 2D profile with bmesh
+		#only the vertex positions depend on the shape, the connectivity comes from the shared template cache
+		if buffers is not None:
+			coords, loops, starts, totals, loopNormals = buffers
+		else:
+			with timings.stage("revolve") as stage:
+				coords, loops, starts, totals = revolve.revolve(profile, segments, key)
+				stage.counts(len(coords)//3, len(totals))
+			loopNormals = None
+		
+		with timings.stage("mesh") as stage:
+			mesh.vertices.add(len(coords)//3)
+			mesh.vertices.foreach_set("co", coords)
+			mesh.loops.add(len(loops))
+			mesh.loops.foreach_set("vertex_index", loops)
+			mesh.polygons.add(len(totals))
+			mesh.polygons.foreach_set("loop_start", starts)
+			mesh.polygons.foreach_set("loop_total", totals)
+			mesh.update(calc_edges=True)
+			stage.counts(len(mesh.vertices), len(mesh.polygons))
+		
+		with timings.stage("normals") as stage:
+			set_normals(mesh, loopNormals if loopNormals is not None else revolve.loop_normals(profile, segments, key))
+			stage.counts(len(mesh.vertices), len(mesh.polygons))
+	
+	return mesh
+
+def set_normals(mesh, normals):
+	#shades the mesh smooth with the exact surface normals of the shape (see revolve.loop_normals) as custom split normals, instead of normals
+	#averaged from the faces, which shade the tip and the edges of a blunting cap faceted unless the mesh is far denser than its shape needs
+	mesh.polygons.foreach_set("use_smooth", [True]*len(mesh.polygons))
+	if bpy.app.version < (4, 1, 0):
+		#custom normals only take effect with auto smooth before 4.1, which removed it
+		mesh.use_auto_smooth = True
+	
+	if hasattr(normals, "reshape"):
+		mesh.normals_split_custom_set(normals.reshape(-1, 3))
+	else:
+		mesh.normals_split_custom_set([normals[i:i+3] for i in range(0, len(normals), 3)])
+
+def cursor_location():
+	if (2, 80, 0) < bpy.app.version:
+		#use the new API
+		return bpy.context.scene.cursor.location
+	else:
+		#use the old one
+		return bpy.context.scene.cursor_location
+
+def placement_matrix(rotation):
+	#world matrix of a cone placed at the 3D cursor with the operator's rotation (in degrees, XYZ order)
+	euler = mathutils.Euler([math.pi * angle/180 for angle in rotation], "XYZ")
+	if (2, 80, 0) < bpy.app.version:
+		#use the new API
+		return mathutils.Matrix.Translation(cursor_location()) @ euler.to_matrix().to_4x4()
+	else:
+		#use the old one
+		return mathutils.Matrix.Translation(cursor_location()) * euler.to_matrix().to_4x4()
+
+def add_to_edit_mesh(coords, loops, starts, totals, rotation):
+	#adds a revolved surface (see revolve.revolve) to the mesh being edited, in the edit object's local space, without leaving edit mode
+	#the vertices and faces are made straight in the edit bmesh, with no temporary mesh datablock. The new geometry ends up as the only selection,
+	#like blender's own add mesh operators, and is shaded smooth
+	editObj = bpy.context.edit_object
+	if (2, 80, 0) < bpy.app.version:
+		#use the new API
+		matrix = editObj.matrix_world.inverted() @ placement_matrix(rotation)
+		verts = [matrix @ mathutils.Vector(coords[i:i+3]) for i in range(0, len(coords), 3)]
+	else:
+		#use the old one
+		matrix = editObj.matrix_world.inverted() * placement_matrix(rotation)
+		verts = [matrix * mathutils.Vector(coords[i:i+3]) for i in range(0, len(coords), 3)]
+	
+	bm = bmesh.from_edit_mesh(editObj.data)
+	for elements in (bm.verts, bm.edges, bm.faces):
+		for element in elements:
+			element.select = False
+	
+	verts = [bm.verts.new(co) for co in verts]
+	for start, total in zip(starts, totals):
+		#selecting a face selects its vertices and edges too
+		face = bm.faces.new([verts[loops[i]] for i in range(start, start+total)])
+		face.select = True
+		face.smooth = True
+	bmesh.update_edit_mesh(editObj.data)
+
+#custom property holding the geometry key (see profiles.geometry_key) of the spec a mesh datablock was built from
+MESH_KEY = "advancedConesKey"
+
+#custom property holding the mesh_digest of a mesh datablock as it was built, so meshes that have been edited since are never reused
+MESH_DIGEST = "advancedConesDigest"
+
+def mesh_digest(mesh):
+	#a digest of a mesh's vertex positions and face corners, read back from the mesh itself
+	coords = array.array('f', bytes(12*len(mesh.vertices)))
+	mesh.vertices.foreach_get("co", coords)
+	loops = array.array('i', bytes(4*len(mesh.loops)))
+	mesh.loops.foreach_get("vertex_index", loops)
+	digest = hashlib.sha1(coords)
+	digest.update(loops)
+	return digest.hexdigest()
+
+#geometry key -> mesh name. Only a cache of the keys stored on the meshes themselves, which is rebuilt whenever it turns out to be stale (after undo, or loading a file)
+meshRegistry = {}
+
+def find_mesh(key, vertices, faces):
+	#an existing mesh datablock built from a spec with the given geometry key, or None
+	#meshes edited since they were built no longer match the digest stored when they were built (checked last, after the cheaper vertex and face counts),
+	#and are never reused. They are the user's own meshes from then on, so they lose their key
+	mesh = bpy.data.meshes.get(meshRegistry.get(key, ""))
+	if mesh is None or mesh.get(MESH_KEY) != key:
+		meshRegistry.clear()
+		for someMesh in bpy.data.meshes:
+			someKey = someMesh.get(MESH_KEY)
+			if someKey is not None:
+				meshRegistry[someKey] = someMesh.name
+		mesh = bpy.data.meshes.get(meshRegistry.get(key, ""))
+	
+	if mesh is None:
+		return None
+	if len(mesh.vertices) != vertices or len(mesh.polygons) != faces or mesh.get(MESH_DIGEST) != mesh_digest(mesh):
+		del mesh[MESH_KEY]
+		if MESH_DIGEST in mesh:
+			del mesh[MESH_DIGEST]
+		meshRegistry.pop(key, None)
+		return None
+	return mesh
+
+def release_orphans():
+	#removes cone meshes that nothing uses any more, such as the meshes of cones deleted while tuning parameters, instead of keeping them until the file is saved and reloaded
+	for mesh in [someMesh for someMesh in bpy.data.meshes if someMesh.users == 0 and someMesh.get(MESH_KEY) is not None]:
+		meshRegistry.pop(mesh[MESH_KEY], None)
+		bpy.data.meshes.remove(mesh)
+
+def build_geometry(profile, segments, rotation, name, timings=None, key=None, share=True, buffers=None):
+	#takes a sampled profile, solid-of-revolutions it, and either makes it into an object at the cursor or adds it to the mesh being edited
+	#each stage is recorded in timings (a timing.Timings), if given. Returns the new object, or None in edit mode
+	#a geometry key (see profiles.geometry_key) is stored on the mesh and names it after its spec. With share, an existing mesh built from the same spec
+	#is linked to the new object instead of building an identical copy
+	if timings is None:
+		timings = timing.Timings()
+	
+	if bpy.context.mode == "EDIT_MESH":
+		#edit meshes don't keep custom split normals, so they aren't worth computing (a RevolveJob skips them too)
+		if buffers is None:
+			with timings.stage("revolve") as stage:
+				buffers = revolve.revolve(profile, segments, key)
+				stage.counts(len(buffers[0])//3, len(buffers[3]))
+		with timings.stage("edit mesh") as stage:
+			add_to_edit_mesh(buffers[0], buffers[1], buffers[2], buffers[3], rotation)
+			stage.counts(len(buffers[0])//3, len(buffers[3]))
+		return None
+	
+	mesh = cone_mesh(profile, segments, name, timings, key, share, buffers)
+	with timings.stage("object"):
+		return place_object(mesh, rotation, name)
+
+def cone_mesh(profile, segments, name, timings, key=None, share=True, buffers=None):
+	#the mesh of a revolved profile: with share, an existing mesh built from a spec with the same geometry key, otherwise a new one named after its key
+	mesh = None
+	if key is not None and share:
+		with timings.stage("find mesh"):
+			mesh = find_mesh(key, profile.vertex_count(segments) if len(profile) > 0 else 0, profile.face_count(segments))
+	if mesh is None:
+		mesh = build_mesh(profile, segments, "%s %s" % (name, key[:8]) if key is not None else name, timings, buffers, key)
+		if key is not None:
+			mesh[MESH_KEY] = key
+			mesh[MESH_DIGEST] = mesh_digest(mesh)
+			meshRegistry[key] = mesh.name
+	return mesh
+
+#custom properties of a generated object holding the spec it was built from, and which of the spec's levels of detail it is
+#they stay with the object (and its duplicates) after the operator is done, so the cone can be rebuilt later, see RegenerateCones
+OBJECT_SPEC = "advancedConesSpec"
+OBJECT_LEVEL = "advancedConesLevel"
+
+def store_spec(obj, spec, level=0):
+	obj[OBJECT_SPEC] = spec
+	obj[OBJECT_LEVEL] = level
+
+def stored_spec(obj):
+	#the spec an object was generated from, or None if it wasn't generated by Advanced Cones
+	spec = obj.get(OBJECT_SPEC)
+	if spec is None or obj.type != "MESH":
+		return None
+	return dict(spec.items())
+
+def place_object(mesh, rotation, name):
+	return link_object(bpy.data.objects.new(name, mesh), rotation)
+
+def link_object(obj, rotation):
+	#adds an object to the scene at the cursor, with the operator's rotation
+	if (2, 80, 0) < bpy.app.version:
+		#use the new API
+		bpy.context.collection.objects.link(obj)
+	else:
+		#use the old one
+		bpy.context.scene.objects.link(obj)
+	
+	obj.location = cursor_location()
+	obj.rotation_euler[0] = math.pi * rotation[0]/180
+	obj.rotation_euler[1] = math.pi * rotation[1]/180
+	obj.rotation_euler[2] = math.pi * rotation[2]/180
+	return obj
+
+class AdvancedConesPreferences(bpy.types.AddonPreferences):
+	bl_idname = __package__
+	
+	reportTimings: bpy.props.BoolProperty(name="Report Timings", description="Show how long each stage of generating a cone took, with its vertex and face counts, in the info bar", default=False)
+	shareMeshes: bpy.props.BoolProperty(name="Share Identical Meshes", description="Give cones with exactly the same shape, parameters and segments a linked copy of one mesh, instead of building a mesh for each", default=True)
+	modalVertices: bpy.props.IntProperty(name="Build in Background Above", description="Cones with more vertices than this are built a few rings at a time, with a progress bar, and can be cancelled with Esc", default=1000000, min=0)
+	memoryLimit: bpy.props.IntProperty(name="Memory Limit (MB)", description="Refuse to build cones estimated to need more memory than this", default=8192, min=1)
+	timeLimit: bpy.props.FloatProperty(name="Time Limit (s)", description="Refuse to build cones estimated to take longer than this", default=600, min=1)
+	draftResolution: bpy.props.FloatProperty(name="Draft Resolution", description="Rings and segments of cones regenerated at draft resolution, as a fraction of those they were generated with", default=0.25, min=0.01, max=1, subtype="FACTOR")
+	finalResolution: bpy.props.FloatProperty(name="Final Resolution", description="Rings and segments of cones regenerated at final resolution, as a multiple of those they were generated with", default=1, min=0.01, max=16)
+	
+	def draw(self, context):
+		self.layout.prop(self, "reportTimings")
+		self.layout.prop(self, "shareMeshes")
+		self.layout.prop(self, "modalVertices")
+		self.layout.prop(self, "memoryLimit")
+		self.layout.prop(self, "timeLimit")
+		self.layout.prop(self, "draftResolution")
+		self.layout.prop(self, "finalResolution")
+
+def preference(name, default):
+	if (2, 80, 0) < bpy.app.version:
+		#use the new API
+		addons = bpy.context.preferences.addons
+	else:
+		#use the old one
+		addons = bpy.context.user_preferences.addons
+	
+	#the preferences only exist when the package is enabled as an addon, not when the operators are registered from a script
+	if __package__ not in addons:
+		return default
+	return getattr(addons[__package__].preferences, name)
+
+#rough memory cost of a vertex and of a face: blender's own mesh storage (positions, loops, edges, polygons, custom normals) plus the buffers it is loaded from
+VERTEX_BYTES = 48
+FACE_BYTES = 160
+
+def set_status(context, text):
+	#status bar text, or None to clear it
+	if (2, 80, 0) < bpy.app.version:
+		#use the new API
+		context.workspace.status_text_set(text)
+	elif context.area is not None:
+		#use the old one
+		context.area.header_text_set(text)
+
+def spec_estimate(spec):
+	#(vertices, faces, bytes, seconds) a spec is expected to need, worked out without sampling the profile
+	vertices = profiles.station_estimate(spec)*int(spec.get("segments", 32))
+	faces = vertices
+	return vertices, faces, vertices*VERTEX_BYTES + faces*FACE_BYTES, vertices*timing.seconds_per_vertex()
+
+def budget_problem(spec):
+	#why a spec would take too much memory or time to build, or None if it won't
+	#imported profiles are read to count their stations, so a file that can't be read is reported here too
+	try:
+		vertices, faces, size, seconds = spec_estimate(spec)
+	except ValueError as error:
+		return str(error)
+	if size > preference("memoryLimit", 8192)*1048576:
+		return "%d vertices would need about %d MB, more than the %d MB memory limit" % (vertices, size//1048576, preference("memoryLimit", 8192))
+	if seconds > preference("timeLimit", 600):
+		return "%d vertices would take about %d s to build, more than the %d s time limit" % (vertices, seconds, preference("timeLimit", 600))
+	return None
+
+class ConeGenerator:
+	#shared behaviour of the cone operators. Each one sets shape to its key in profiles.SPEC_DEFAULTS, and has a property for every parameter of that shape
+	shape = None
+	
+	def spec(self):
+		#the cone spec matching the operator's current properties
+		spec = dict((key, getattr(self, key)) for key in profiles.SPEC_DEFAULTS[self.shape])
+		spec["shape"] = self.shape
+		spec["segments"] = self.segments
+		if self.lodLevels > 1:
+			spec["lods"] = self.lodLevels
+			spec["lodRatio"] = self.lodRatio
+		return spec
+	
+	def profile(self):
+		return profiles.profile_from_spec(self.spec())
+	
+	def validate(self):
+		#moves out-of-range parameters to the nearest buildable values (see profiles.corrected_parameters), so the redo panel shows what is actually built
+		#this is closed form for every shape but the blunting sphere, whose solver is cached, so an invalid redo-panel state costs next to nothing to fix
+		#returns why the parameters can't be built, or None
+		spec = self.spec()
+		try:
+			corrected = profiles.corrected_parameters(spec)
+		except ValueError as error:
+			return str(error)
+		
+		for key, value in corrected.items():
+			if spec[key] != value:
+				setattr(self, key, value)
+		return None
+	
+	def estimate(self):
+		return spec_estimate(self.spec())
+	
+	def over_budget(self):
+		return budget_problem(self.spec())
+	
+	def generate(self, name, sample=None, buffers=None, timings=None):
+		#samples the profile (with sample(), or from the spec) and builds it, timing each stage. The timings go to every timing hook, and
+		#are also reported in the info bar if the Report Timings preference is on. Returns the operator result
+		#parameters that can't be built, and cones over the memory or time limit, are refused before anything is sampled
+		#buffers are the finest level's, when a RevolveJob already built them
+		problem = self.validate() or self.over_budget()
+		if problem is not None:
+			self.report({'ERROR'}, problem)
+			return {'CANCELLED'}
+		if getattr(self, "parametric", False) and bpy.context.mode != "EDIT_MESH":
+			return self.generate_parametric(name)
+		
+		if timings is None:
+			timings = timing.Timings()
+		with timings.stage("profile") as stage:
+			profile = sample() if sample is not None else self.profile()
+			stage.counts(len(profile), 0)
+		
+		#levels of detail become sibling objects named name_LOD0 (the finest), name_LOD1 and so on, all from the one sampled profile
+		#in edit mode there is only the one mesh to add to, so only the finest level is built
+		#each object keeps the spec it was built from, so it can be regenerated later
+		spec = self.spec()
+		levels = revolve.lod_levels(profile, self.segments, self.lodLevels, self.lodRatio, self.shape in profiles.CORNER_STATION_SHAPES)
+		share = preference("shareMeshes", True)
+		if bpy.context.mode != "EDIT_MESH":
+			release_orphans()
+		if len(levels) == 1 or bpy.context.mode == "EDIT_MESH":
+			obj = build_geometry(profile, self.segments, self.rotation, name, timings, profiles.geometry_key(spec), share, buffers)
+			if obj is not None:
+				store_spec(obj, spec)
+		else:
+			for i, (levelProfile, levelSegments) in enumerate(levels):
+				obj = build_geometry(levelProfile, levelSegments, self.rotation, "%s_LOD%d" % (name, i), timings, profiles.geometry_key(spec, i), share, buffers if i == 0 else None)
+				store_spec(obj, spec, i)
+		
+		timing.publish(self.shape, timings)
+		if preference("reportTimings", False):
+			self.report({'INFO'}, "%s: %s" % (name, timings.summary()))
+		return {'FINISHED'}
+	
+	def generate_parametric(self, name):
+		#a cone built by a geometry nodes modifier (see nodes.py) instead of a mesh. There is nothing to sample or revolve here, blender evaluates the nodes itself
+		#it keeps no spec, since its parameters are the modifier's inputs
+		if bpy.app.version < nodes.MIN_VERSION:
+			self.report({'ERROR'}, "Geometry Nodes cones need Blender %d.%d or newer" % nodes.MIN_VERSION[:2])
+			return {'CANCELLED'}
+		
+		timings = timing.Timings()
+		with timings.stage("object"):
+			try:
+				obj = nodes.add_parametric_object(self.spec(), name)
+			except ValueError as error:
+				self.report({'ERROR'}, str(error))
+				return {'CANCELLED'}
+			link_object(obj, self.rotation)
+		timing.publish(self.shape, timings)
+		return {'FINISHED'}
+	
+	def invoke(self, context, event):
+		#small cones are built straight away. Big ones are revolved a chunk of rings per timer tick by modal(), with a progress bar and Esc to cancel
+		#redo, and calls from scripts, always go through execute
+		problem = self.validate() or self.over_budget()
+		if problem is not None:
+			self.report({'ERROR'}, problem)
+			return {'CANCELLED'}
+		if getattr(self, "parametric", False) or self.estimate()[0] <= preference("modalVertices", 1000000):
+			return self.execute(context)
+		
+		profile = self.profile()
+		if preference("shareMeshes", True) and bpy.context.mode != "EDIT_MESH" and find_mesh(profiles.geometry_key(self.spec()), profile.vertex_count(self.segments), profile.face_count(self.segments)) is not None:
+			#an identical mesh already exists, so there is nothing to build
+			return self.execute(context)
+		
+		#edit mode has no use for the normals, see build_geometry
+		self.job = revolve.RevolveJob(profile, self.segments, normals=bpy.context.mode != "EDIT_MESH")
+		self.loading = False
+		self.jobStart = time.perf_counter()
+		windowManager = context.window_manager
+		self.timer = windowManager.event_timer_add(0.01, window=context.window)
+		windowManager.modal_handler_add(self)
+		windowManager.progress_begin(0, 100)
+		return {'RUNNING_MODAL'}
+	
+	def modal(self, context, event):
+		if event.type == 'ESC':
+			self.end_job(context)
+			self.report({'WARNING'}, "Cancelled %s" % profiles.SHAPE_NAMES[self.shape])
+			return {'CANCELLED'}
+		if event.type != 'TIMER':
+			return {'PASS_THROUGH'}
+		
+		#do as many chunks as fit in a tenth of a second, so the interface keeps responding
+		tick = time.perf_counter()
+		while not self.job.done() and time.perf_counter() - tick < 0.1:
+			self.job.step()
+		
+		progress = self.job.progress()
+		context.window_manager.progress_update(int(100*progress))
+		if not self.job.done():
+			set_status(context, "Building %s: %d%% (Esc to cancel)" % (profiles.SHAPE_NAMES[self.shape], 100*progress))
+			return {'RUNNING_MODAL'}
+		set_status(context, "Loading %s: %d%%" % (profiles.SHAPE_NAMES[self.shape], 100*progress))
+		if not self.loading:
+			#loading the buffers into a mesh is the job's last step, and blocks until it is done, so wait a tick for the status bar to show it first
+			self.loading = True
+			return {'RUNNING_MODAL'}
+		
+		job = self.job
+		self.end_job(context)
+		buffers = job.result()
+		timings = timing.Timings()
+		timings.add("revolve", time.perf_counter() - self.jobStart, len(buffers[0])//3, len(buffers[3]))
+		return self.generate(profiles.SHAPE_NAMES[self.shape], lambda: job.profile, buffers, timings)
+	
+	def end_job(self, context):
+		context.window_manager.event_timer_remove(self.timer)
+		context.window_manager.progress_end()
+		set_status(context, None)
+		#let go of the partly built buffers straight away
+		self.job = None
+	
+	def draw_properties(self, layout):
+		#read-only geometric properties of the current shape, computed from its profile rather than from the mesh
+		layout.prop(self, "showProperties", icon="TRIA_DOWN" if self.showProperties else "TRIA_RIGHT", emboss=False)
+		if (self.showProperties == False):
+			return
+		
+		try:
+			values = properties.profile_properties(self.profile())
+		except ValueError as error:
+			layout.label(text=str(error))
+			return
+		
+		column = layout.column(align=True)
+		for label, key in properties.PROPERTY_LABELS:
+			column.label(text="%s: %.5g" % (label, values[key]))
+
+#shared by every shape with adaptive rings. The rings are placed from an estimate of the chord error (see profiles.adaptive_stations), which can overshoot
+#Max Deviation by about a fifth, and the segments around the axis are chosen separately, so their chords aren't included
+ADAPTIVE_DESCRIPTION = "Place rings by curvature, so the profile deviates from the true shape by about Max Deviation, instead of spacing them evenly"
+MAX_DEVIATION_DESCRIPTION = "Roughly how far the profile may deviate from the true shape between rings, not counting the segments around the axis"
+
+class TangentOgiveGen(ConeGenerator, bpy.types.Operator):
+	#Tangent Ogive Generator
+	bl_idname = "mesh.add_tangent_ogive"
+	bl_label = "Add Tangent Ogive"
+	bl_menulabel = "Tangent Ogive"
+	bl_options = {'REGISTER', 'UNDO'}
+	shape = "tangent_ogive"
+
+	baseRadius: bpy.props.FloatProperty(name="Base Radius", default=1, min=0, max=2147483647, step=1)
+	apexLength: bpy.props.FloatProperty(name="Apex Length", default=2, min=0, max=2147483647, step=1)
+	sphereRadius: bpy.props.FloatProperty(name="Sphere Radius", default=0.2, min=0, max=2147483647, step=1)
+	sphereRings: bpy.props.IntProperty(name="Sphere Rings", default=32, min=1, max=2147483647)
+	ogiveRings: bpy.props.IntProperty(name="Ogive Rings", default=32, min=1, max=2147483647)
+	adaptive: bpy.props.BoolProperty(name="Adaptive Rings", description=ADAPTIVE_DESCRIPTION, default=False)
+	maxDeviation: bpy.props.FloatProperty(name="Max Deviation", description=MAX_DEVIATION_DESCRIPTION, default=0.001, min=0.000001, max=2147483647, step=1, precision=5)
+	segments: bpy.props.IntProperty(name="Segments", default=32, min=3, max=2147483647)
+	lodLevels: bpy.props.IntProperty(name="LOD Levels", description="Number of levels of detail to build, each a separate object with fewer rings and segments than the last", default=1, min=1, max=8)
+	lodRatio: bpy.props.IntProperty(name="LOD Ratio", description="How many times fewer rings and segments each level of detail has than the one before", default=4, min=2, max=16)
+	rotation: bpy.props.FloatVectorProperty(name="Rotation", default=(0,0,0), min=-2147483648, max=2147483647, step=10, subtype="XYZ")
+	showProperties: bpy.props.BoolProperty(name="Properties", description="Show volume, areas and other properties of the shape", default=False)
+	parametric: bpy.props.BoolProperty(name="Geometry Nodes", description="Build the cone with a geometry nodes modifier whose inputs are its parameters, so it can be changed later without rebuilding the mesh. Rings are evenly spaced, and levels of detail aren't built", default=False)
+	blunted: bpy.props.BoolProperty(name="Spherically Blunted", default=False)
+	
+	def draw(self, context):
+		box = self.layout.column()
+		box.prop(self, "baseRadius")
+		box.prop(self, "apexLength")
+		box.prop(self, "blunted")
+		if (self.blunted == True):
+			box.prop(self, "sphereRadius")
+		if (self.parametric == False):
+			box.prop(self, "adaptive")
+		if (self.adaptive == True and self.parametric == False):
+			box.prop(self, "maxDeviation")
+		else:
+			if (self.blunted == True):
+				box.prop(self, "sphereRings")
+			box.prop(self, "ogiveRings")
+		box.prop(self, "segments")
+		if (self.parametric == False):
+			box.prop(self, "lodLevels")
+			if (self.lodLevels > 1):
+				box.prop(self, "lodRatio")
+		if nodes.MIN_VERSION <= bpy.app.version:
+			box.prop(self, "parametric")
+		box.prop(self, "rotation")
+		self.draw_properties(box)
+	
+	def execute(self, context):
+		return self.generate("Tangent Ogive")
+		
+class SecantOgiveGen(ConeGenerator, bpy.types.Operator):
+	#Secant Ogive Generator
+	bl_idname = "mesh.add_secant_ogive"
+	bl_label = "Add Secant Ogive"
+	bl_menulabel = "Secant Ogive"
+	bl_options = {'REGISTER', 'UNDO'}
+	shape = "secant_ogive"
+	
+	baseRadius: bpy.props.FloatProperty(name="Base Radius", default=1, min=0, max=2147483647, step=1)
+	apexLength: bpy.props.FloatProperty(name="Apex Length", default=2, min=0, max=2147483647, step=1)
+	ogiveRadius: bpy.props.FloatProperty(name="Ogive Radius", default=2.5, min=0, max=2147483647, step=1)
+	sphereRadius: bpy.props.FloatProperty(name="Sphere Radius", default=0.2, min=0, max=2147483647, step=1)
+	sphereRings: bpy.props.IntProperty(name="Sphere Rings", default=32, min=1, max=2147483647)
+	ogiveRings: bpy.props.IntProperty(name="Ogive Rings", default=32, min=1, max=2147483647)
+	adaptive: bpy.props.BoolProperty(name="Adaptive Rings", description=ADAPTIVE_DESCRIPTION, default=False)
+	maxDeviation: bpy.props.FloatProperty(name="Max Deviation", description=MAX_DEVIATION_DESCRIPTION, default=0.001, min=0.000001, max=2147483647, step=1, precision=5)
+	segments: bpy.props.IntProperty(name="Segments", default=32, min=3, max=2147483647)
+	lodLevels: bpy.props.IntProperty(name="LOD Levels", description="Number of levels of detail to build, each a separate object with fewer rings and segments than the last", default=1, min=1, max=8)
+	lodRatio: bpy.props.IntProperty(name="LOD Ratio", description="How many times fewer rings and segments each level of detail has than the one before", default=4, min=2, max=16)
+	rotation: bpy.props.FloatVectorProperty(name="Rotation", default=(0,0,0), min=-2147483648, max=2147483647, step=10, subtype="XYZ")
+	showProperties: bpy.props.BoolProperty(name="Properties", description="Show volume, areas and other properties of the shape", default=False)
+	parametric: bpy.props.BoolProperty(name="Geometry Nodes", description="Build the cone with a geometry nodes modifier whose inputs are its parameters, so it can be changed later without rebuilding the mesh. Rings are evenly spaced, and levels of detail aren't built", default=False)
+	blunted: bpy.props.BoolProperty(name="Spherically Blunted", default=False)
+	
+	def draw(self, context):
+		box = self.layout.column()
+		box.prop(self, "baseRadius")
+		box.prop(self, "apexLength")
+		box.prop(self, "ogiveRadius")
+		box.prop(self, "blunted")
+		if (self.blunted == True):
+			box.prop(self, "sphereRadius")
+		if (self.parametric == False):
+			box.prop(self, "adaptive")
+		if (self.adaptive == True and self.parametric == False):
+			box.prop(self, "maxDeviation")
+		else:
+			if (self.blunted == True):
+				box.prop(self, "sphereRings")
+			box.prop(self, "ogiveRings")
+		box.prop(self, "segments")
+		if (self.parametric == False):
+			box.prop(self, "lodLevels")
+			if (self.lodLevels > 1):
+				box.prop(self, "lodRatio")
+		if nodes.MIN_VERSION <= bpy.app.version:
+			box.prop(self, "parametric")
+		box.prop(self, "rotation")
+		self.draw_properties(box)
+
+	def execute(self, context):
+		return self.generate("Secant Ogive")
+		
+class ProlateHemispheroidGen(ConeGenerator, bpy.types.Operator):
+	#Prolate Hemispheroid Generator
+	bl_idname = "mesh.add_prolate_hemispheroid"
+	bl_label = "Add Prolate Hemispheroid"
+	bl_menulabel = "Prolate Hemispheroid"
+	bl_options = {'REGISTER', 'UNDO'}
+	shape = "prolate_hemispheroid"
+	
+	radius: bpy.props.FloatProperty(name="Radius", default=1, min=0, max=2147483647, step=1)
+	length: bpy.props.FloatProperty(name="Length", default=2, min=0, max=2147483647, step=1)
+	sphereRadius: bpy.props.FloatProperty(name="Sphere Radius", default=0.2, min=0, max=2147483647, step=1)
+	sphereRings: bpy.props.IntProperty(name="Sphere Rings", default=32, min=1, max=2147483647)
+	rings: bpy.props.IntProperty(name="Rings", default=32, min=3, max=2147483647)
+	adaptive: bpy.props.BoolProperty(name="Adaptive Rings", description=ADAPTIVE_DESCRIPTION, default=False)
+	maxDeviation: bpy.props.FloatProperty(name="Max Deviation", description=MAX_DEVIATION_DESCRIPTION, default=0.001, min=0.000001, max=2147483647, step=1, precision=5)
+	segments: bpy.props.IntProperty(name="Segments", default=32, min=1, max=2147483647)
+	lodLevels: bpy.props.IntProperty(name="LOD Levels", description="Number of levels of detail to build, each a separate object with fewer rings and segments than the last", default=1, min=1, max=8)
+	lodRatio: bpy.props.IntProperty(name="LOD Ratio", description="How many times fewer rings and segments each level of detail has than the one before", default=4, min=2, max=16)
+	smoothTip: bpy.props.BoolProperty(name="Smooth tip", description="Takes the final 1/n-length step, and further divides it into an additional n rings", default=True)
+	rotation: bpy.props.FloatVectorProperty(name="Rotation", default=(0,0,0), min=-2147483648, max=2147483647, step=10, subtype="XYZ")
+	showProperties: bpy.props.BoolProperty(name="Properties", description="Show volume, areas and other properties of the shape", default=False)
+	parametric: bpy.props.BoolProperty(name="Geometry Nodes", description="Build the cone with a geometry nodes modifier whose inputs are its parameters, so it can be changed later without rebuilding the mesh. Rings are evenly spaced, and levels of detail aren't built", default=False)
+	blunted: bpy.props.BoolProperty(name="Spherically Blunted", default=False)
+	
+	def draw(self, context):
+		box = self.layout.column()
+		box.prop(self, "radius")
+		box.prop(self, "length")
+		box.prop(self, "blunted")
+		if (self.blunted == True):
+			box.prop(self, "sphereRadius")
+		if (self.parametric == False):
+			box.prop(self, "adaptive")
+		if (self.adaptive == True and self.parametric == False):
+			box.prop(self, "maxDeviation")
+		else:
+			if (self.blunted == True):
+				box.prop(self, "sphereRings")
+			box.prop(self, "rings")
+		box.prop(self, "segments")
+		if (self.parametric == False):
+			box.prop(self, "lodLevels")
+			if (self.lodLevels > 1):
+				box.prop(self, "lodRatio")
+		if ((self.adaptive == False or self.parametric == True) and self.blunted == False):
+			box.prop(self, "smoothTip")
+		if nodes.MIN_VERSION <= bpy.app.version:
+			box.prop(self, "parametric")
+		box.prop(self, "rotation")
+		self.draw_properties(box)
+
+	def execute(self, context):
+		return self.generate("Prolate Hemispheroid")
+		
+class ParabolicConeGen(ConeGenerator, bpy.types.Operator):
+	#Parabolic Cone Generator
+	bl_idname = "mesh.add_parabolic_cone"
+	bl_label = "Add Parabolic Cone"
+	bl_menulabel = "Parabolic Cone"
+	bl_options = {'REGISTER', 'UNDO'}
+	shape = "parabolic"
+	
+	radius: bpy.props.FloatProperty(name="Radius", default=1, min=0, max=2147483647, step=1)
+	length: bpy.props.FloatProperty(name="Length", default=2, min=0, max=2147483647, step=1)
+	K: bpy.props.FloatProperty(name="K'", default=0.5, min=0, max=1, step=1)
+	sphereRadius: bpy.props.FloatProperty(name="Sphere Radius", default=0.2, min=0, max=2147483647, step=1)
+	sphereRings: bpy.props.IntProperty(name="Sphere Rings", default=32, min=1, max=2147483647)
+	rings: bpy.props.IntProperty(name="Rings", default=32, min=1, max=2147483647)
+	adaptive: bpy.props.BoolProperty(name="Adaptive Rings", description=ADAPTIVE_DESCRIPTION, default=False)
+	maxDeviation: bpy.props.FloatProperty(name="Max Deviation", description=MAX_DEVIATION_DESCRIPTION, default=0.001, min=0.000001, max=2147483647, step=1, precision=5)
+	segments: bpy.props.IntProperty(name="Segments", default=32, min=3, max=2147483647)
+	lodLevels: bpy.props.IntProperty(name="LOD Levels", description="Number of levels of detail to build, each a separate object with fewer rings and segments than the last", default=1, min=1, max=8)
+	lodRatio: bpy.props.IntProperty(name="LOD Ratio", description="How many times fewer rings and segments each level of detail has than the one before", default=4, min=2, max=16)
+	rotation: bpy.props.FloatVectorProperty(name="Rotation", default=(0,0,0), min=-2147483648, max=2147483647, step=10, subtype="XYZ")
+	showProperties: bpy.props.BoolProperty(name="Properties", description="Show volume, areas and other properties of the shape", default=False)
+	parametric: bpy.props.BoolProperty(name="Geometry Nodes", description="Build the cone with a geometry nodes modifier whose inputs are its parameters, so it can be changed later without rebuilding the mesh. Rings are evenly spaced, and levels of detail aren't built", default=False)
+	blunted: bpy.props.BoolProperty(name="Spherically Blunted", default=False)
+	
+	def draw(self, context):
+		box = self.layout.column()
+		box.prop(self, "radius")
+		box.prop(self, "length")
+		box.prop(self, "K")
+		box.prop(self, "blunted")
+		if (self.blunted == True):
+			box.prop(self, "sphereRadius")
+		if (self.parametric == False):
+			box.prop(self, "adaptive")
+		if (self.adaptive == True and self.parametric == False):
+			box.prop(self, "maxDeviation")
+		else:
+			if (self.blunted == True):
+				box.prop(self, "sphereRings")
+			box.prop(self, "rings")
+		box.prop(self, "segments")
+		if (self.parametric == False):
+			box.prop(self, "lodLevels")
+			if (self.lodLevels > 1):
+				box.prop(self, "lodRatio")
+		if nodes.MIN_VERSION <= bpy.app.version:
+			box.prop(self, "parametric")
+		box.prop(self, "rotation")
+		self.draw_properties(box)
+
+	def execute(self, context):
+		return self.generate("Parabolic Cone")
+
+class PowerSeriesConeGen(ConeGenerator, bpy.types.Operator):
+	#Power Series Cone Generator
+	bl_idname = "mesh.add_power_series_cone"
+	bl_label = "Add Power Series Cone"
+	bl_menulabel = "Power Series Cone"
+	bl_options = {'REGISTER', 'UNDO'}
+	shape = "power_series"
+
+	radius: bpy.props.FloatProperty(name="Radius", default=1, min=0, max=2147483647, step=1)
+	length: bpy.props.FloatProperty(name="Length", default=2, min=0, max=2147483647, step=1)
+	n: bpy.props.FloatProperty(name="n", default=0.5, min=0, max=1, step=1)
+	sphereRadius: bpy.props.FloatProperty(name="Sphere Radius", default=0.2, min=0, max=2147483647, step=1)
+	sphereRings: bpy.props.IntProperty(name="Sphere Rings", default=32, min=1, max=2147483647)
+	rings: bpy.props.IntProperty(name="Rings", default=32, min=1, max=2147483647)
+	adaptive: bpy.props.BoolProperty(name="Adaptive Rings", description=ADAPTIVE_DESCRIPTION, default=False)
+	maxDeviation: bpy.props.FloatProperty(name="Max Deviation", description=MAX_DEVIATION_DESCRIPTION, default=0.001, min=0.000001, max=2147483647, step=1, precision=5)
+	segments: bpy.props.IntProperty(name="Segments", default=32, min=3, max=2147483647)
+	lodLevels: bpy.props.IntProperty(name="LOD Levels", description="Number of levels of detail to build, each a separate object with fewer rings and segments than the last", default=1, min=1, max=8)
+	lodRatio: bpy.props.IntProperty(name="LOD Ratio", description="How many times fewer rings and segments each level of detail has than the one before", default=4, min=2, max=16)
+	rotation: bpy.props.FloatVectorProperty(name="Rotation", default=(0,0,0), min=-2147483648, max=2147483647, step=10, subtype="XYZ")
+	showProperties: bpy.props.BoolProperty(name="Properties", description="Show volume, areas and other properties of the shape", default=False)
+	parametric: bpy.props.BoolProperty(name="Geometry Nodes", description="Build the cone with a geometry nodes modifier whose inputs are its parameters, so it can be changed later without rebuilding the mesh. Rings are evenly spaced, and levels of detail aren't built", default=False)
+	blunted: bpy.props.BoolProperty(name="Spherically Blunted", default=False)
+	
+	def draw(self, context):
+		box = self.layout.column()
+		box.prop(self, "radius")
+		box.prop(self, "length")
+		box.prop(self, "n")
+		box.prop(self, "blunted")
+		if (self.blunted == True):
+			box.prop(self, "sphereRadius")
+		if (self.parametric == False):
+			box.prop(self, "adaptive")
+		if (self.adaptive == True and self.parametric == False):
+			box.prop(self, "maxDeviation")
+		else:
+			if (self.blunted == True):
+				box.prop(self, "sphereRings")
+			box.prop(self, "rings")
+		box.prop(self, "segments")
+		if (self.parametric == False):
+			box.prop(self, "lodLevels")
+			if (self.lodLevels > 1):
+				box.prop(self, "lodRatio")
+		if nodes.MIN_VERSION <= bpy.app.version:
+			box.prop(self, "parametric")
+		box.prop(self, "rotation")
+		self.draw_properties(box)
+	
+	def execute(self, context):
+		return self.generate("Power Series Cone")
+		
+class HaackSeriesConeGen(ConeGenerator, bpy.types.Operator):
+	#Haack Series Cone Generator"""
+	bl_idname = "mesh.add_haack_series_cone"
+	bl_label = "Add Haack Series Cone"
+	bl_menulabel = "Haack Series Cone"
+	bl_options = {'REGISTER', 'UNDO'}
+	shape = "haack_series"
+
+	radius: bpy.props.FloatProperty(name="Radius", default=1, min=0, max=2147483647, step=1)
+	length: bpy.props.FloatProperty(name="Length", default=2, min=0, max=2147483647, step=1)
+	C: bpy.props.FloatProperty(name="C", default=0.5, min=0, max=2147483647, step=1)
+	sphereRadius: bpy.props.FloatProperty(name="Sphere Radius", default=0.2, min=0, max=2147483647, step=1)
+	sphereRings: bpy.props.IntProperty(name="Sphere Rings", default=32, min=1, max=2147483647)
+	rings: bpy.props.IntProperty(name="Rings", default=32, min=1, max=2147483647)
+	adaptive: bpy.props.BoolProperty(name="Adaptive Rings", description=ADAPTIVE_DESCRIPTION, default=False)
+	maxDeviation: bpy.props.FloatProperty(name="Max Deviation", description=MAX_DEVIATION_DESCRIPTION, default=0.001, min=0.000001, max=2147483647, step=1, precision=5)
+	segments: bpy.props.IntProperty(name="Segments", default=32, min=3, max=2147483647)
+	lodLevels: bpy.props.IntProperty(name="LOD Levels", description="Number of levels of detail to build, each a separate object with fewer rings and segments than the last", default=1, min=1, max=8)
+	lodRatio: bpy.props.IntProperty(name="LOD Ratio", description="How many times fewer rings and segments each level of detail has than the one before", default=4, min=2, max=16)
+	rotation: bpy.props.FloatVectorProperty(name="Rotation", default=(0,0,0), min=-2147483648, max=2147483647, step=10, subtype="XYZ")
+	showProperties: bpy.props.BoolProperty(name="Properties", description="Show volume, areas and other properties of the shape", default=False)
+	parametric: bpy.props.BoolProperty(name="Geometry Nodes", description="Build the cone with a geometry nodes modifier whose inputs are its parameters, so it can be changed later without rebuilding the mesh. Rings are evenly spaced, and levels of detail aren't built", default=False)
+	blunted: bpy.props.BoolProperty(name="Spherically Blunted", default=False)
+	
+	def draw(self, context):
+		box = self.layout.column()
+		box.prop(self, "radius")
+		box.prop(self, "length")
+		box.prop(self, "C")
+		box.prop(self, "blunted")
+		if (self.blunted == True):
+			box.prop(self, "sphereRadius")
+		if (self.parametric == False):
+			box.prop(self, "adaptive")
+		if (self.adaptive == True and self.parametric == False):
+			box.prop(self, "maxDeviation")
+		else:
+			if (self.blunted == True):
+				box.prop(self, "sphereRings")
+			box.prop(self, "rings")
+		box.prop(self, "segments")
+		if (self.parametric == False):
+			box.prop(self, "lodLevels")
+			if (self.lodLevels > 1):
+				box.prop(self, "lodRatio")
+		if nodes.MIN_VERSION <= bpy.app.version:
+			box.prop(self, "parametric")
+		box.prop(self, "rotation")
+		self.draw_properties(box)
+	
+	def execute(self, context):
+		return self.generate("Haack Series Cone")
+		
+class NConicGen(ConeGenerator, bpy.types.Operator):
+	#N-Conic Generator
+	bl_idname = "mesh.add_nconic"
+	bl_label = "Add N-conic"
+	bl_menulabel = "N-conic"
+	bl_options = {'REGISTER', 'UNDO'}
+	shape = "nconic"
+	
+	n: bpy.props.IntProperty(name="n", default=2, min=1, max=10, step=1)
+	
+	apexLength: bpy.props.FloatProperty(name="Apex length", default = 2, min=0, max=2147483647, step=1)
+	
+	#apparently all of these have to be manually declared? Isn't there any way to do this procedurally??
+	radius0: bpy.props.FloatProperty(name="Base radius", default=1, min=0, max=2147483647, step=1)
+	radius1: bpy.props.FloatProperty(name="Radius 1", default=0.75, min=0, max=2147483647, step=1)
+	radius2: bpy.props.FloatProperty(name="Radius 2", default=0.6, min=0, max=2147483647, step=1)
+	radius3: bpy.props.FloatProperty(name="Radius 3", default=0.5, min=0, max=2147483647, step=1)
+	radius4: bpy.props.FloatProperty(name="Radius 4", default=0.3, min=0, max=2147483647, step=1)
+	radius5: bpy.props.FloatProperty(name="Radius 5", default=0.2, min=0, max=2147483647, step=1)
+	radius6: bpy.props.FloatProperty(name="Radius 6", default=0.1, min=0, max=2147483647, step=1)
+	radius7: bpy.props.FloatProperty(name="Radius 7", default=0.05, min=0, max=2147483647, step=1)
+	radius8: bpy.props.FloatProperty(name="Radius 8", default=0.01, min=0, max=2147483647, step=1)
+	radius9: bpy.props.FloatProperty(name="Radius 9", default=0, min=0, max=2147483647, step=1)
+	
+	#we don't actually use length0 for anything, but we will fill a space in the array with Nothing for math reasons
+	length1: bpy.props.FloatProperty(name="Length 1", default=1, min=0, max=2147483647, step=1)
+	length2: bpy.props.FloatProperty(name="Length 2", default=0.5, min=0, max=2147483647, step=1)
+	length3: bpy.props.FloatProperty(name="Length 3", default=0.25, min=0, max=2147483647, step=1)
+	length4: bpy.props.FloatProperty(name="Length 4", default=0.125, min=0, max=2147483647, step=1)
+	length5: bpy.props.FloatProperty(name="Length 5", default=0.0625, min=0, max=2147483647, step=1)
+	length6: bpy.props.FloatProperty(name="Length 6", default=0.03125, min=0, max=2147483647, step=1)
+	length7: bpy.props.FloatProperty(name="Length 7", default=0.015625, min=0, max=2147483647, step=1)
+	length8: bpy.props.FloatProperty(name="Length 8", default=0.0078125, min=0, max=2147483647, step=1)
+	length9: bpy.props.FloatProperty(name="Length 9", default=0.00390625, min=0, max=2147483647, step=1)
+	
+	sphereRadius: bpy.props.FloatProperty(name="Sphere Radius", default=0.2, min=0, max=2147483647, step=1)
+	sphereRings: bpy.props.IntProperty(name="Sphere Rings", default=32, min=1, max=2147483647)
+	blunted: bpy.props.BoolProperty(name="Spherically Blunted", default=False)
+	
+	segments: bpy.props.IntProperty(name="Segments", default=32, min=3, max=2147483647)
+	lodLevels: bpy.props.IntProperty(name="LOD Levels", description="Number of levels of detail to build, each a separate object with fewer rings and segments than the last", default=1, min=1, max=8)
+	lodRatio: bpy.props.IntProperty(name="LOD Ratio", description="How many times fewer rings and segments each level of detail has than the one before", default=4, min=2, max=16)
+	rotation: bpy.props.FloatVectorProperty(name="Rotation", default=(0,0,0), min=-2147483648, max=2147483647, step=10, subtype="XYZ")
+	showProperties: bpy.props.BoolProperty(name="Properties", description="Show volume, areas and other properties of the shape", default=False)
+	parametric: bpy.props.BoolProperty(name="Geometry Nodes", description="Build the cone with a geometry nodes modifier whose inputs are its parameters, so it can be changed later without rebuilding the mesh. Rings are evenly spaced, and levels of detail aren't built", default=False)
+	
+	def draw(self, context):
+		box = self.layout.column()
+		box.prop(self, "n")
+		box.prop(self, "apexLength")
+		box.prop(self, "radius0")
+		for i in range(1, self.n):
+			box.prop(self, "radius" + str(i))
+			box.prop(self, "length" + str(i))
+		
+		box.prop(self, "blunted")
+		if (self.blunted == True):
+			box.prop(self, "sphereRadius")
+			box.prop(self, "sphereRings")
+		
+		box.prop(self, "segments")
+		if (self.parametric == False):
+			box.prop(self, "lodLevels")
+			if (self.lodLevels > 1):
+				box.prop(self, "lodRatio")
+		if nodes.MIN_VERSION <= bpy.app.version:
+			box.prop(self, "parametric")
+		box.prop(self, "rotation")
+		self.draw_properties(box)
+		
+	def execute(self, context):
+		return self.generate("n-conic")
+
+class ImportedProfileGen(ConeGenerator, bpy.types.Operator):
+	#Imported Profile Generator
+	bl_idname = "mesh.add_imported_profile"
+	bl_label = "Add Imported Profile"
+	bl_menulabel = "Imported Profile"
+	bl_options = {'REGISTER', 'UNDO'}
+	shape = "imported"
+	
+	filepath: bpy.props.StringProperty(name="Profile File", description="Text file with x and radius columns (.csv, .txt, .dat), raw little-endian float64 x, radius pairs (.bin), or a numpy array with a row per station (.npy)", subtype="FILE_PATH")
+	filter_glob: bpy.props.StringProperty(default="*.csv;*.txt;*.dat;*.bin;*.npy", options={'HIDDEN'})
+	tolerance: bpy.props.FloatProperty(name="Tolerance", description="Largest allowed distance between the simplified profile and the imported stations. 0 keeps every station", default=0.001, min=0, max=2147483647, step=1, precision=5)
+	segments: bpy.props.IntProperty(name="Segments", default=32, min=3, max=2147483647)
+	lodLevels: bpy.props.IntProperty(name="LOD Levels", description="Number of levels of detail to build, each a separate object with fewer rings and segments than the last", default=1, min=1, max=8)
+	lodRatio: bpy.props.IntProperty(name="LOD Ratio", description="How many times fewer rings and segments each level of detail has than the one before", default=4, min=2, max=16)
+	rotation: bpy.props.FloatVectorProperty(name="Rotation", default=(0,0,0), min=-2147483648, max=2147483647, step=10, subtype="XYZ")
+	showProperties: bpy.props.BoolProperty(name="Properties", description="Show volume, areas and other properties of the shape", default=False)
+	
+	def spec(self):
+		#blender paths can be relative to the blend file
+		spec = ConeGenerator.spec(self)
+		spec["filepath"] = bpy.path.abspath(self.filepath)
+		return spec
+	
+	def draw(self, context):
+		box = self.layout.column()
+		box.prop(self, "filepath")
+		box.prop(self, "tolerance")
+		if self.filepath:
+			try:
+				box.label(text="Stations: %d" % len(self.profile()))
+			except ValueError as error:
+				box.label(text=str(error))
+		box.prop(self, "segments")
+		box.prop(self, "lodLevels")
+		if (self.lodLevels > 1):
+			box.prop(self, "lodRatio")
+		box.prop(self, "rotation")
+		self.draw_properties(box)
+	
+	def invoke(self, context, event):
+		#ask for the file first, blender calls execute once it is chosen
+		if not self.filepath:
+			context.window_manager.fileselect_add(self)
+			return {'RUNNING_MODAL'}
+		return ConeGenerator.invoke(self, context, event)
+	
+	def execute(self, context):
+		return self.generate("Imported Profile")
+
+class RegenerateCones(bpy.types.Operator):
+	#Regenerate Cones
+	bl_idname = "object.advanced_cones_regenerate"
+	bl_label = "Regenerate Cones"
+	bl_description = "Rebuild the cones in the scene from their stored specs, at draft or final resolution"
+	bl_options = {'REGISTER', 'UNDO'}
+	
+	resolution: bpy.props.EnumProperty(name="Resolution", items=(
+		("DRAFT", "Draft", "Fewer rings and segments, to keep the scene light while laying it out (Draft Resolution in the addon preferences)"),
+		("FINAL", "Final", "The rings and segments the cones were generated with, for rendering and export (Final Resolution in the addon preferences)"),
+	), default="DRAFT")
+	selectedOnly: bpy.props.BoolProperty(name="Selected Only", description="Only regenerate the selected cones", default=False)
+	
+	@classmethod
+	def poll(cls, context):
+		return context.mode == "OBJECT"
+	
+	def execute(self, context):
+		#cones that end up with the same spec at this resolution are built together: the profile is sampled once, each of its levels of detail
+		#is revolved once, and every cone of the group gets the result. Cones already at this resolution keep their mesh
+		scale = preference("draftResolution", 0.25) if self.resolution == "DRAFT" else preference("finalResolution", 1.0)
+		objects = context.selected_objects if self.selectedOnly else context.scene.objects
+		
+		groups = {}
+		problems = []
+		for obj in objects:
+			spec = stored_spec(obj)
+			if spec is None:
+				continue
+			try:
+				spec = profiles.scaled_resolution(spec, scale)
+				key = profiles.geometry_key(spec)
+			except ValueError as error:
+				problems.append("%s: %s" % (obj.name, error))
+				continue
+			groups.setdefault(key, (spec, []))[1].append(obj)
+		
+		timings = timing.Timings()
+		share = preference("shareMeshes", True)
+		meshes = set()
+		count = 0
+		for spec, members in groups.values():
+			problem = budget_problem(spec)
+			if problem is not None:
+				problems.append("%s: %s" % (members[0].name, problem))
+				continue
+			
+			with timings.stage("profile") as stage:
+				profile = profiles.profile_from_spec(spec)
+				stage.counts(len(profile), 0)
+			shape = spec["shape"]
+			levels = revolve.lod_levels(profile, spec["segments"], int(spec.get("lods", 1)), int(spec.get("lodRatio", 4)), shape in profiles.CORNER_STATION_SHAPES)
+			
+			levelMeshes = {}
+			for obj in members:
+				level = min(obj.get(OBJECT_LEVEL, 0), len(levels)-1)
+				mesh = levelMeshes.get(level)
+				if mesh is None:
+					levelProfile, levelSegments = levels[level]
+					name = profiles.SHAPE_NAMES[shape] if len(levels) == 1 else "%s_LOD%d" % (profiles.SHAPE_NAMES[shape], level)
+					mesh = cone_mesh(levelProfile, levelSegments, name, timings, profiles.geometry_key(spec, level), share)
+					if share:
+						levelMeshes[level] = mesh
+				
+				if obj.data is not mesh:
+					#materials on the mesh would be lost with it
+					if len(mesh.materials) == 0:
+						for material in obj.data.materials:
+							mesh.materials.append(material)
+					obj.data = mesh
+				meshes.add(mesh.name)
+				count = count+1
+		
+		#the meshes the cones had before are released, unless something else still uses them
+		release_orphans()
+		timing.publish("regenerate", timings)
+		
+		for problem in problems:
+			self.report({'WARNING'}, problem)
+		self.report({'INFO'}, "Regenerated %d cones with %d meshes at %s resolution" % (count, len(meshes), self.resolution.lower()))
+		return {'FINISHED'}
+
+class VIEW3D_MT_mesh_advanced_cones_add(bpy.types.Menu):
+	#define the Advanced Cones menu
+	bl_idname = "VIEW3D_MT_mesh_advanced_cones_add"
+	bl_label = "Advanced Cones"
+	bl_menulabel = "Advanced Cones"
+	
+	def draw(self, context):
+		layout = self.layout
+		layout.operator_context = 'INVOKE_REGION_WIN'
+		
+		for generator in generators:
+			layout.operator(generator.bl_idname, text=generator.bl_menulabel)
+		
+		layout.separator()
+		layout.operator(RegenerateCones.bl_idname, text="Regenerate at Draft Resolution").resolution = "DRAFT"
+		layout.operator(RegenerateCones.bl_idname, text="Regenerate at Final Resolution").resolution = "FINAL"
+
+generators = (TangentOgiveGen, SecantOgiveGen, ProlateHemispheroidGen, ParabolicConeGen, PowerSeriesConeGen, HaackSeriesConeGen, NConicGen, ImportedProfileGen)
+classes = (AdvancedConesPreferences, VIEW3D_MT_mesh_advanced_cones_add, RegenerateCones) + generators
+			
+def menu_func(self, context):
+	layout = self.layout
+	layout.operator_context = 'INVOKE_REGION_WIN'
+	
+	layout.menu("VIEW3D_MT_mesh_advanced_cones_add", text="Advanced Cones", icon="MESH_CONE")
+
+def register():
+	for cls in classes:
+		bpy.utils.register_class(cls)
+	
+	if (2, 80, 0) < bpy.app.version:
+		#use the new API
+		bpy.types.VIEW3D_MT_mesh_add.prepend(menu_func)
+	else:
+		#use the old one
+		bpy.types.INFO_MT_mesh_add.prepend(menu_func)
+
+def unregister():
+	for cls in reversed(classes):
+		bpy.utils.unregister_class(cls)
+	
+	profiles.clear_caches()
+	revolve.clear_caches()
+		
+	if (2, 80, 0) < bpy.app.version:
+		#use the new API
+		bpy.types.VIEW3D_MT_mesh_add.remove(menu_func)
+	else:
+		#use the old one
+		bpy.types.INFO_MT_mesh_add.remove(menu_func)
@@ -0,0 +1,784 @@
+#profile engine for Advanced Cones. Samples the 2D profile of every shape, and has no dependency on blender, so it can also be used headless (see batch.py)
+
+import math
+import json
+import array
+import hashlib
+import functools
+
+from . import importer
+
+try:
+	import numpy
+except ImportError:
+	#numpy ships with Blender 2.8+, older builds fall back to plain python lists of floats
+	numpy = None
+
+class VectorMath:
+	#exposes numpy's element-wise functions under the same names as the math module, so each radius function is written once
+	#and can be evaluated either on a whole array of stations (numpy) or on one float at a time (math)
+	if numpy is not None:
+		pi = math.pi
+		sqrt = numpy.sqrt
+		sin = numpy.sin
+		cos = numpy.cos
+		acos = numpy.arccos
+		atan = numpy.arctan
+		pow = numpy.power
+
+def float_array(values):
+	#compact float64 storage for stations and radii
+	if numpy is not None:
+		return numpy.asarray(values, dtype=numpy.float64)
+	return array.array('d', values)
+
+def join_arrays(*arrays):
+	if numpy is not None:
+		return numpy.concatenate(arrays)
+	joined = array.array('d')
+	for a in arrays:
+		joined.extend(a)
+	return joined
+
+def uniform_stations(start, end, count):
+	#count+1 evenly spaced stations from start to end inclusive. Computed from integer indices rather than by repeatedly adding a step size
+	if numpy is not None:
+		return numpy.linspace(start, end, count+1)
+	stepSize = (end-start)/count
+	return array.array('d', [start + stepSize*i for i in range(count)] + [end])
+
+def evaluate(func, stations, *params):
+	#evaluates func(m, x, *params) for every station, where m is the math namespace to use
+	if numpy is not None:
+		return numpy.asarray(func(VectorMath, stations, *params), dtype=numpy.float64)
+	return array.array('d', [func(math, x, *params) for x in stations])
+
+class Profile:
+	#a sampled 2D profile. x is the distance of each station from the apex point (0 at the tip, length at the base), r is the radius at that station
+	#normals, if known, is a pair of arrays with the radial and axial components of the exact unit surface normal at each station (see slope_normals)
+	#profiles without them (the n-conic's straight frustums) are shaded with the normal of each frustum instead
+	__slots__ = ("x", "r", "length", "normals")
+	
+	def __init__(self, x, r, length, normals=None):
+		self.x = x
+		self.r = r
+		self.length = length
+		self.normals = normals
+		
+	def __len__(self):
+		return len(self.x)
+	
+	def freeze(self):
+		#cached profiles are shared between callers, so make sure nobody modifies them in place
+		if numpy is not None:
+			for a in (self.x, self.r) + tuple(self.normals or ()):
+				a.flags.writeable = False
+	
+	def pole(self):
+		#a tip station exactly on the axis is revolved into a single pole vertex instead of a ring
+		return len(self.x) > 0 and bool(self.r[0] == 0)
+	
+	def subsample(self, step):
+		#every step-th station counted from the tip, plus the base station, as a new profile. A coarser level of detail of the same shape, whose stations are a subset of these
+		if step <= 1 or len(self.x) == 0:
+			return self
+		normals = None
+		if self.normals is not None:
+			normals = tuple(join_arrays(a[:-1:step], a[-1:]) for a in self.normals)
+		return Profile(join_arrays(self.x[:-1:step], self.x[-1:]), join_arrays(self.r[:-1:step], self.r[-1:]), self.length, normals)
+	
+	def vertex_count(self, segments):
+		#known ahead of time, there is no merging pass after the revolve
+		if self.pole():
+			return 1 + (len(self.x)-1)*segments
+		return len(self.x)*segments
+	
+	def face_count(self, segments):
+		if len(self.x) == 0:
+			return 0
+		if self.pole():
+			return (len(self.x)-1)*segments
+		return 1 + (len(self.x)-1)*segments
+
+#radius functions. m is either the math module or VectorMath, x is a float or an array of stations
+
+def tangent_ogive_radius(m, x, length, radius, ogiveRadius):
+	return m.sqrt(ogiveRadius*ogiveRadius - (length-x)**2) + radius - ogiveRadius
+
+def secant_ogive_radius(m, x, ogiveRadius, alpha):
+	return m.sqrt(ogiveRadius*ogiveRadius - (ogiveRadius*m.cos(alpha)-x)**2) + ogiveRadius*m.sin(alpha)
+
+def prolate_hemispheroid_radius(m, x, length, radius):
+	return radius*m.sqrt(1 - ((length-x)/length)**2)
+
+def parabolic_radius(m, x, length, radius, K):
+	return radius*(2*(x/length) - K*(x/length)**2)/(2-K)
+
+def power_series_radius(m, x, length, radius, n):
+	return radius*m.pow(x/length, n)
+
+def haack_series_radius(m, x, length, radius, C):
+	theta = m.acos(1-(2*x/length))
+	return radius/math.sqrt(math.pi)*m.sqrt(theta-(m.sin(2*theta)/2)+(C*m.sin(theta)**3))
+
+def cone_radius(m, x, slope):
+	#a straight cone from the apex point, the tip frustum of an n-conic
+	return slope*x
+
+#constants of each shape that its radius functions take, computed once per set of parameters
+#like the radius functions, the ones that need more than arithmetic take the math namespace m to use, so nodes.py can build them as nodes too
+
+def ogive_radius(baseRadius, apexLength):
+	#radius of the circle a tangent ogive is an arc of
+	return (baseRadius*baseRadius + apexLength*apexLength)/(2*baseRadius)
+
+def check_tangent_ogive(baseRadius, apexLength):
+	#raises ValueError for a tangent ogive wider than it is long. Its arc would turn back before reaching the axis, leaving a flat tip of radius (R^2-L^2)/R
+	if baseRadius > apexLength:
+		raise ValueError("a Tangent Ogive's base radius can't be more than its apex length, or it never reaches the axis. Use a Secant Ogive for blunter shapes")
+
+def tangent_ogive_cap(baseRadius, apexLength, ogiveRadius, sphereRadius, m=math):
+	#centre xc of a sphere cap blunting a tangent ogive, and the point (xt, yt) where it meets the ogive, in closed form for nodes.py
+	#the profiles find the same point with sphere_tangency, like every other shape's
+	xc = apexLength - m.sqrt((ogiveRadius-sphereRadius)**2 - (ogiveRadius-baseRadius)**2) #center point of sphere cap
+	yt = sphereRadius*(ogiveRadius-baseRadius)/(ogiveRadius-sphereRadius) #y coord of tangent point
+	xt = xc-m.sqrt(sphereRadius*sphereRadius - yt*yt) #x coord of tangent point
+	return xc, xt, yt
+
+def secant_ogive_min_radius(baseRadius, apexLength):
+	#smallest ogive radius a secant ogive can be built with. The radius function is the upper half of the ogive's circle, which only passes
+	#through the apex point while the centre of the circle is on or below the axis. At exactly this radius the centre is on the axis, and the tip is blunt
+	return (apexLength*apexLength + baseRadius*baseRadius)/(2*apexLength)
+
+def secant_ogive_angle(m, baseRadius, apexLength, ogiveRadius):
+	#angle between the axis and the line from the apex point to the centre of the ogive's circle, for an ogive radius of at least the minimum
+	return m.atan(baseRadius/apexLength) - m.acos(m.sqrt(apexLength*apexLength + baseRadius*baseRadius)/(2*ogiveRadius))
+
+def secant_ogive_alpha(baseRadius, apexLength, ogiveRadius):
+	#secant_ogive_angle, which raises ValueError if the ogive radius is too small for the given base radius and apex length
+	if ogiveRadius < secant_ogive_min_radius(baseRadius, apexLength):
+		raise ValueError("ogive radius must be at least %g for a base radius of %g and apex length of %g" % (secant_ogive_min_radius(baseRadius, apexLength), baseRadius, apexLength))
+	return secant_ogive_angle(math, baseRadius, apexLength, ogiveRadius)
+
+def cone_cap(apexLength, baseRadius, sphereRadius, m=math):
+	#centre xc of a sphere cap blunting a straight cone, and the point (xt, yt) where it meets the cone, in closed form for nodes.py
+	xt = (apexLength*apexLength/baseRadius) * m.sqrt(sphereRadius*sphereRadius / (baseRadius*baseRadius + apexLength*apexLength))
+	yt = xt * baseRadius / apexLength
+	xc = xt + m.sqrt(sphereRadius*sphereRadius - yt*yt) #center of spherical cap
+	return xc, xt, yt
+
+#first and second derivatives of each radius function with respect to x, used to place stations by curvature
+
+def tangent_ogive_slope(m, x, length, radius, ogiveRadius):
+	return (length-x)/m.sqrt(ogiveRadius*ogiveRadius - (length-x)**2)
+
+def tangent_ogive_second_derivative(m, x, length, radius, ogiveRadius):
+	return -ogiveRadius*ogiveRadius/m.sqrt(ogiveRadius*ogiveRadius - (length-x)**2)**3
+
+def secant_ogive_slope(m, x, ogiveRadius, alpha):
+	return (ogiveRadius*m.cos(alpha)-x)/m.sqrt(ogiveRadius*ogiveRadius - (ogiveRadius*m.cos(alpha)-x)**2)
+
+def secant_ogive_second_derivative(m, x, ogiveRadius, alpha):
+	return -ogiveRadius*ogiveRadius/m.sqrt(ogiveRadius*ogiveRadius - (ogiveRadius*m.cos(alpha)-x)**2)**3
+
+def prolate_hemispheroid_slope(m, x, length, radius):
+	u = (length-x)/length
+	return radius*u/(length*m.sqrt(1 - u*u))
+
+def prolate_hemispheroid_second_derivative(m, x, length, radius):
+	u = (length-x)/length
+	return -radius/(length*length*m.sqrt(1 - u*u)**3)
+
+def parabolic_slope(m, x, length, radius, K):
+	return radius*(2/length - 2*K*x/(length*length))/(2-K)
+
+def parabolic_second_derivative(m, x, length, radius, K):
+	return -2*radius*K/(length*length*(2-K))
+
+def power_series_slope(m, x, length, radius, n):
+	return radius*n/length*m.pow(x/length, n-1)
+
+def power_series_second_derivative(m, x, length, radius, n):
+	return radius*n*(n-1)/(length*length)*m.pow(x/length, n-2)
+
+def haack_series_slope(m, x, length, radius, C):
+	theta = m.acos(1-(2*x/length))
+	g = theta-(m.sin(2*theta)/2)+(C*m.sin(theta)**3)
+	return radius/math.sqrt(math.pi)*m.sin(theta)*(2 + 3*C*m.cos(theta))/(length*m.sqrt(g))
+
+def haack_series_second_derivative(m, x, length, radius, C):
+	#with g = theta - sin(2*theta)/2 + C*sin(theta)^3, r = radius*sqrt(g/pi), so r'' = radius/sqrt(pi) * (g''/(2*sqrt(g)) - g'^2/(4*g^1.5))
+	theta = m.acos(1-(2*x/length))
+	g = theta-(m.sin(2*theta)/2)+(C*m.sin(theta)**3)
+	dg = 2*m.sin(theta)*(2 + 3*C*m.cos(theta))/length
+	d2g = 4*(2*m.cos(theta) + 3*C*m.cos(2*theta))/(length*length*m.sin(theta))
+	return radius/math.sqrt(math.pi)*(d2g/(2*m.sqrt(g)) - dg*dg/(4*m.sqrt(g)**3))
+
+def cone_slope(m, x, slope):
+	return slope + 0*x
+
+def slope_normals(slope, stations, *params):
+	#exact unit normals of the surface at each station, from the slope dr/dx of its radius function, as (radial, axial) component arrays
+	#with the tip pointing up, the outward normal of a radius r(x) revolved about the axis is (1, r')/sqrt(1+r'^2), which is (cos(atan(r')), sin(atan(r')))
+	#the slope is infinite at the tip of the ellipse, the haack series and power series with n < 1, where the normal points straight up the axis
+	if numpy is not None:
+		with numpy.errstate(divide="ignore", invalid="ignore"):
+			angles = numpy.arctan(numpy.asarray(slope(VectorMath, stations, *params), dtype=numpy.float64)*numpy.ones(len(stations)))
+		angles[numpy.isnan(angles)] = math.pi/2
+		return numpy.cos(angles), numpy.sin(angles)
+	
+	angles = []
+	for x in stations:
+		try:
+			angles.append(math.atan(slope(math, x, *params)))
+		except (ZeroDivisionError, ValueError):
+			angles.append(math.pi/2)
+	return array.array('d', [math.cos(a) for a in angles]), array.array('d', [math.sin(a) for a in angles])
+
+def join_normals(*profiles):
+	#the normals of consecutive sections of a profile, as one pair of arrays
+	return join_arrays(*[p[0] for p in profiles]), join_arrays(*[p[1] for p in profiles])
+
+#number of intervals the station density is integrated over in adaptive mode
+ADAPTIVE_SAMPLES = 4096
+
+def adaptive_stations(slope, secondDerivative, start, end, maxDeviation, *params):
+	#places stations so the chord between neighbouring stations deviates from the curve by at most about maxDeviation
+	#a chord spanning arc length ds on a curve of curvature k deviates from it by about k*ds^2/8, so stations need a density of sqrt(k/(8*maxDeviation)) per unit arc length
+	#with k = |r''|/(1+r'^2)^1.5 and ds = sqrt(1+r'^2)*dx, that is sqrt(|r''|/(8*maxDeviation))/(1+r'^2)^0.25 per unit x
+	#the density is integrated with the midpoint rule on a grid clustered towards start, where the curvature of the power series, haack series and ellipse goes to infinity
+	#and stations are then placed at every whole step of the integral
+	if numpy is not None:
+		grid = start + (end-start)*numpy.linspace(0, 1, ADAPTIVE_SAMPLES+1)**2
+		mid = (grid[1:]+grid[:-1])/2
+		d1 = numpy.asarray(slope(VectorMath, mid, *params))
+		d2 = numpy.asarray(secondDerivative(VectorMath, mid, *params))
+		density = numpy.sqrt(numpy.abs(d2)/(8*maxDeviation))/numpy.sqrt(numpy.sqrt(1+d1*d1))*numpy.diff(grid)
+		
+		integral = numpy.concatenate(([0], numpy.cumsum(density)))
+		sections = max(1, int(math.ceil(integral[-1])))
+		stations = numpy.interp(numpy.linspace(0, integral[-1], sections+1), integral, grid)
+	else:
+		grid = [start + (end-start)*math.pow(i/ADAPTIVE_SAMPLES, 2) for i in range(ADAPTIVE_SAMPLES+1)]
+		integral = [0]
+		for i in range(ADAPTIVE_SAMPLES):
+			mid = (grid[i]+grid[i+1])/2
+			d1 = slope(math, mid, *params)
+			d2 = secondDerivative(math, mid, *params)
+			integral.append(integral[-1] + math.sqrt(abs(d2)/(8*maxDeviation))/math.sqrt(math.sqrt(1+d1*d1))*(grid[i+1]-grid[i]))
+		
+		sections = max(1, int(math.ceil(integral[-1])))
+		stations = array.array('d', [start])
+		i = 0
+		for k in range(1, sections):
+			level = integral[-1]*k/sections
+			while integral[i+1] < level:
+				i = i+1
+			stations.append(grid[i] + (grid[i+1]-grid[i])*(level-integral[i])/(integral[i+1]-integral[i]))
+		stations.append(end)
+	
+	stations[0] = start
+	stations[-1] = end
+	return stations
+
+def shape_stations(slope, secondDerivative, start, end, rings, maxDeviation, *params):
+	#rings+1 evenly spaced stations, or curvature-adaptive stations if a maximum deviation is given
+	if maxDeviation > 0:
+		return adaptive_stations(slope, secondDerivative, start, end, maxDeviation, *params)
+	return uniform_stations(start, end, rings)
+
+def sphere_cap_x(m, phi, xc, sphereRadius):
+	return xc - sphereRadius*m.cos(phi)
+
+def sphere_cap_r(m, phi, sphereRadius):
+	return sphereRadius*m.sin(phi)
+
+def sphere_cap(xc, xt, yt, sphereRadius, sphereRings, maxDeviation=0):
+	#stations along a spherical cap centred on the axis at xc, from the top of the sphere down to the tangency point (xt, yt), evenly spaced along the arc
+	#returned as a profile, whose normals point away from the centre of the sphere
+	angle = math.atan2(yt, xc-xt)
+	
+	if maxDeviation > 0:
+		#the chord across an arc step of a on a circle deviates from it by sphereRadius*(1-cos(a/2))
+		if maxDeviation < sphereRadius:
+			sphereRings = max(1, int(math.ceil(angle/(2*math.acos(1 - maxDeviation/sphereRadius)))))
+		else:
+			sphereRings = 1
+	
+	phi = uniform_stations(0, angle, sphereRings)
+	x = evaluate(sphere_cap_x, phi, xc, sphereRadius)
+	r = evaluate(sphere_cap_r, phi, sphereRadius)
+	
+	#pin the final station exactly onto the tangency point, so the next section starts from the same vertex
+	x[-1] = xt
+	r[-1] = yt
+	
+	#at angle phi from the top of the sphere, the normal is (sin(phi), cos(phi))
+	normals = (evaluate(lambda m, a: m.sin(a), phi), evaluate(lambda m, a: m.cos(a), phi))
+	return Profile(x, r, xc, normals)
+
+def sample_profile(func, slope, stations, length, *params):
+	#the shared profile engine: evaluates a shape's radius function and normals over all its stations at once
+	return Profile(stations, evaluate(func, stations, *params), length, slope_normals(slope, stations, *params))
+
+#how many sampled profiles to keep, so redo-panel edits that don't change the profile (rotation, segments) skip the shape math
+PROFILE_CACHE_SIZE = 32
+
+def cached_profile(func):
+	#memoizes a profile function. Its arguments are exactly the parameters that affect the shape's profile, so they make the cache key
+	@functools.lru_cache(maxsize=PROFILE_CACHE_SIZE)
+	@functools.wraps(func)
+	def cached(*args):
+		profile = func(*args)
+		profile.freeze()
+		return profile
+	return cached
+
+#stations each pass of the blunting solver samples, and how many passes it makes. Each pass narrows the tangency point down by a factor of BLUNTING_SAMPLES,
+#so after BLUNTING_PASSES it is as exact as a float allows
+BLUNTING_SAMPLES = 256
+BLUNTING_PASSES = 6
+
+#how far the sphere radius at the tangency point found may be from the one asked for, as a fraction of it, before the solver gives up
+BLUNTING_TOLERANCE = 1e-6
+
+def normal_distance(func, slope, stations, *params):
+	#distance from each station to the axis along the surface normal, r*sqrt(1+r'^2). That is the radius of the sphere centred on the axis
+	#which is tangent to the profile at the station, and 0 at a tip on the axis, even where the slope is infinite
+	radial = slope_normals(slope, stations, *params)[0]
+	r = evaluate(func, stations, *params)
+	if numpy is not None:
+		return r/radial
+	return array.array('d', [r[i]/radial[i] for i in range(len(r))])
+
+def rising_crossings(distance, sphereRadius):
+	#indices of the intervals whose normal distance rises through the sphere radius
+	if numpy is not None:
+		return numpy.flatnonzero((distance[:-1] < sphereRadius) & (distance[1:] >= sphereRadius)).tolist()
+	return [i for i in range(len(distance)-1) if distance[i] < sphereRadius <= distance[i+1]]
+
+@functools.lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def blunting_range(func, slope, end, *params):
+	#about the smallest and exactly the largest normal distance along a shape from its tip to end, leaving out the tip station, which is 0 whatever the shape
+	#spheres in between fit, except that a pointed tip has room for any smaller one too. A blunt tip (the ellipse, power series with n <= 1/2) is already rounder
+	distance = normal_distance(func, slope, uniform_stations(0, end, BLUNTING_SAMPLES), *params)
+	return min((d for d in distance[1:] if d == d), default=0.0), float(distance[-1])
+
+def refine_tangency(func, slope, start, end, below, above, sphereRadius, *params):
+	#narrows the interval from start to end, where the normal distance rises from below to above through the sphere radius, down to the tangency point
+	#each pass samples the interval left at once and keeps the part it crosses in, then the last one is interpolated. Returns (xc, xt, yt),
+	#or None if the crossing isn't a tangency point: a blunt tip jumps from 0 to its radius of curvature, so a smaller sphere seems to cross there
+	for i in range(BLUNTING_PASSES-1):
+		stations = uniform_stations(start, end, BLUNTING_SAMPLES)
+		distance = normal_distance(func, slope, stations, *params)
+		crossings = rising_crossings(distance, sphereRadius)
+		if not crossings:
+			break
+		k = crossings[0]
+		start, end, below, above = stations[k], stations[k+1], distance[k], distance[k+1]
+	
+	xt = start + (end-start)*(sphereRadius-below)/(above-below)
+	try:
+		yt = func(math, xt, *params)
+		d1 = slope(math, xt, *params)
+		tangent = abs(yt*math.sqrt(1+d1*d1) - sphereRadius) <= BLUNTING_TOLERANCE*sphereRadius
+	except (ZeroDivisionError, ValueError, OverflowError):
+		tangent = False
+	if not tangent:
+		return None
+	return xt + yt*d1, xt, yt
+
+@functools.lru_cache(maxsize=PROFILE_CACHE_SIZE)
+def sphere_tangency(func, slope, end, sphereRadius, *params):
+	#centre xc of a sphere cap blunting any shape, and the point (xt, yt) where it meets the shape, for the shape's radius function func and its slope
+	#from the tip to end. The sphere is tangent where the normal distance to the axis equals its radius, which happens first (going down from the tip)
+	#where the normal distance rises through it. The whole shape is sampled at once for where it does, then refine_tangency homes in on it
+	#raises ValueError if no sphere of that radius fits the shape
+	stations = uniform_stations(0, end, BLUNTING_SAMPLES)
+	distance = normal_distance(func, slope, stations, *params)
+	for k in rising_crossings(distance, sphereRadius):
+		tangency = refine_tangency(func, slope, stations[k], stations[k+1], distance[k], distance[k+1], sphereRadius, *params)
+		if tangency is not None:
+			return tangency
+	raise ValueError("a sphere radius of %g can't blunt this shape, it needs to be between about %g and %g" % ((sphereRadius,) + blunting_range(func, slope, end, *params)))
+
+def shape_profile(func, slope, secondDerivative, length, rings, blunted, sphereRadius, sphereRings, maxDeviation, *params):
+	#samples a shape from its tip to its base at length, with its tip replaced by a sphere cap (see sphere_tangency) if blunted
+	if not blunted:
+		stations = shape_stations(slope, secondDerivative, 0, length, rings, maxDeviation, *params)
+		return sample_profile(func, slope, stations, length, *params)
+	
+	xc, xt, yt = sphere_tangency(func, slope, length, sphereRadius, *params)
+	cap = sphere_cap(xc, xt, yt, sphereRadius, sphereRings, maxDeviation)
+	stations = shape_stations(slope, secondDerivative, xt, length, rings, maxDeviation, *params)
+	body = sample_profile(func, slope, stations, length, *params)
+	
+	#the first station of the shape is the tangency point, which the cap already ends on
+	normals = join_normals(cap.normals, (body.normals[0][1:], body.normals[1][1:]))
+	return Profile(join_arrays(cap.x, body.x[1:]), join_arrays(cap.r, body.r[1:]), length, normals)
+
+#how far from the axis rounding can leave an ogive's tip, as a fraction of its base radius. The square root in its radius amplifies rounding to about 1e-8
+TIP_TOLERANCE = 1e-6
+
+def pin_tip(profile, baseRadius):
+	#an ogive meets the axis at the apex point, but rounding leaves a tiny radius there, or nan when the square root's argument rounds below 0.
+	#Pin it, so the tip becomes a single pole vertex rather than a tiny ring. A radius further out than rounding explains is a real ring, and is kept
+	tip = profile.r[0]
+	if math.isnan(tip) or abs(tip) <= TIP_TOLERANCE*baseRadius:
+		profile.r[0] = 0
+
+@cached_profile
+def tangent_ogive_profile(baseRadius, apexLength, ogiveRings, blunted, sphereRadius, sphereRings, maxDeviation=0):
+	if baseRadius <= 0:
+		return Profile(float_array([]), float_array([]), apexLength)
+	
+	ogiveRadius = ogive_radius(baseRadius, apexLength)
+	profile = shape_profile(tangent_ogive_radius, tangent_ogive_slope, tangent_ogive_second_derivative, apexLength, ogiveRings, blunted, sphereRadius, sphereRings, maxDeviation, apexLength, baseRadius, ogiveRadius)
+	if not blunted:
+		pin_tip(profile, baseRadius)
+	
+	profile.r[-1] = baseRadius
+	return profile
+
+@cached_profile
+def secant_ogive_profile(baseRadius, apexLength, ogiveRadius, ogiveRings, blunted, sphereRadius, sphereRings, maxDeviation=0):
+	#raises ValueError if the ogive radius is too small for the given base radius and apex length
+	alpha = secant_ogive_alpha(baseRadius, apexLength, ogiveRadius)
+	
+	profile = shape_profile(secant_ogive_radius, secant_ogive_slope, secant_ogive_second_derivative, apexLength, ogiveRings, blunted, sphereRadius, sphereRings, maxDeviation, ogiveRadius, alpha)
+	if not blunted:
+		pin_tip(profile, baseRadius)
+	profile.r[-1] = baseRadius
+	return profile
+
+@cached_profile
+def prolate_hemispheroid_profile(radius, length, rings, smoothTip, blunted, sphereRadius, sphereRings, maxDeviation=0):
+	if blunted:
+		#the cap replaces the tip the smooth tip would refine
+		profile = shape_profile(prolate_hemispheroid_radius, prolate_hemispheroid_slope, prolate_hemispheroid_second_derivative, length, rings, True, sphereRadius, sphereRings, maxDeviation, length, radius)
+		profile.r[-1] = radius
+		return profile
+	
+	stations = shape_stations(prolate_hemispheroid_slope, prolate_hemispheroid_second_derivative, 0, length, rings, maxDeviation, length, radius)
+	
+	if smoothTip and maxDeviation <= 0:
+		#smooth tip takes the first 1/n-length step, and further divides it into an additional n rings
+		#allows drastic improvement in resolution in the most curved portion, without affecting the rest of the object
+		tip = uniform_stations(0, length/rings, rings)
+		stations = join_arrays(tip[:-1], stations[1:])
+	
+	profile = sample_profile(prolate_hemispheroid_radius, prolate_hemispheroid_slope, stations, length, length, radius)
+	profile.r[-1] = radius
+	return profile
+
+@cached_profile
+def parabolic_profile(radius, length, K, rings, blunted, sphereRadius, sphereRings, maxDeviation=0):
+	profile = shape_profile(parabolic_radius, parabolic_slope, parabolic_second_derivative, length, rings, blunted, sphereRadius, sphereRings, maxDeviation, length, radius, K)
+	profile.r[-1] = radius
+	return profile
+
+@cached_profile
+def power_series_profile(radius, length, n, rings, blunted, sphereRadius, sphereRings, maxDeviation=0):
+	profile = shape_profile(power_series_radius, power_series_slope, power_series_second_derivative, length, rings, blunted, sphereRadius, sphereRings, maxDeviation, length, radius, n)
+	profile.r[-1] = radius
+	return profile
+
+@cached_profile
+def haack_series_profile(radius, length, C, rings, blunted, sphereRadius, sphereRings, maxDeviation=0):
+	profile = shape_profile(haack_series_radius, haack_series_slope, haack_series_second_derivative, length, rings, blunted, sphereRadius, sphereRings, maxDeviation, length, radius, C)
+	profile.r[-1] = radius
+	return profile
+
+def nconic_tip_joint(apexLength, radii, lengths, n):
+	#distance from the apex point and radius of the joint at the bottom of an n-conic's tip frustum
+	if n == 1:
+		return apexLength, radii[0]
+	return lengths[n-1], radii[n-1]
+
+@cached_profile
+def nconic_profile(apexLength, radii, lengths, n, blunted, sphereRadius, sphereRings):
+	#radii[0] is the base radius, radii[j] and lengths[j] are the radius and distance from the apex point of the jth joint. Both are tuples, so they can be part of the cache key
+	if blunted:
+		#the cap is tangent to the tip frustum, the joints below it are unchanged
+		tipLength, tipRadius = nconic_tip_joint(apexLength, radii, lengths, n)
+		xc, xt, yt = sphere_tangency(cone_radius, cone_slope, tipLength, sphereRadius, tipRadius/tipLength)
+		tip = sphere_cap(xc, xt, yt, sphereRadius, sphereRings)
+	else:
+		tip = Profile(float_array([0]), float_array([0]), 0)
+	tipX = tip.x
+	tipR = tip.r
+	
+	#middle joints, working down from the tip, then the cone base
+	x = []
+	r = []
+	lastX = tipX[-1]
+	lastR = tipR[-1]
+	for j in list(range(n-1, 0, -1)) + [0]:
+		jointX = apexLength if j == 0 else lengths[j]
+		
+		#a zero-length frustum would put two stations on top of each other, skip it rather than relying on merging vertices afterwards
+		if jointX == lastX and radii[j] == lastR:
+			continue
+		x.append(jointX)
+		r.append(radii[j])
+		lastX = jointX
+		lastR = radii[j]
+	
+	normals = None
+	if tip.normals is not None and len(x) == 1:
+		#a blunted cone is one frustum tangent to the cap, whose normal is the normal at the end of the cap
+		normals = join_normals(tip.normals, (float_array([tip.normals[0][-1]]), float_array([tip.normals[1][-1]])))
+	
+	return Profile(join_arrays(tipX, float_array(x)), join_arrays(tipR, float_array(r)), apexLength, normals)
+
+@cached_profile
+def imported_profile(path, tolerance, signature):
+	#a profile read from a file (see importer.py) and simplified to tolerance. signature is the file's importer.signature(), so it is re-read when it changes
+	x, r = importer.read_stations(path)
+	x, r = importer.simplify(x, r, tolerance)
+	return Profile(x, r, x[-1], importer.polyline_normals(x, r))
+
+#the shapes a cone spec can name, and the object name each one gets
+SHAPE_NAMES = {
+	"tangent_ogive": "Tangent Ogive",
+	"secant_ogive": "Secant Ogive",
+	"prolate_hemispheroid": "Prolate Hemispheroid",
+	"parabolic": "Parabolic Cone",
+	"power_series": "Power Series Cone",
+	"haack_series": "Haack Series Cone",
+	"nconic": "n-conic",
+	"imported": "Imported Profile",
+}
+
+#parameters of each shape and their defaults. Names and defaults match the properties of the matching operator
+SPEC_DEFAULTS = {
+	"tangent_ogive": {"baseRadius": 1.0, "apexLength": 2.0, "sphereRadius": 0.2, "sphereRings": 32, "ogiveRings": 32, "adaptive": False, "maxDeviation": 0.001, "blunted": False},
+	"secant_ogive": {"baseRadius": 1.0, "apexLength": 2.0, "ogiveRadius": 2.5, "sphereRadius": 0.2, "sphereRings": 32, "ogiveRings": 32, "adaptive": False, "maxDeviation": 0.001, "blunted": False},
+	"prolate_hemispheroid": {"radius": 1.0, "length": 2.0, "sphereRadius": 0.2, "sphereRings": 32, "rings": 32, "adaptive": False, "maxDeviation": 0.001, "smoothTip": True, "blunted": False},
+	"parabolic": {"radius": 1.0, "length": 2.0, "K": 0.5, "sphereRadius": 0.2, "sphereRings": 32, "rings": 32, "adaptive": False, "maxDeviation": 0.001, "blunted": False},
+	"power_series": {"radius": 1.0, "length": 2.0, "n": 0.5, "sphereRadius": 0.2, "sphereRings": 32, "rings": 32, "adaptive": False, "maxDeviation": 0.001, "blunted": False},
+	"haack_series": {"radius": 1.0, "length": 2.0, "C": 0.5, "sphereRadius": 0.2, "sphereRings": 32, "rings": 32, "adaptive": False, "maxDeviation": 0.001, "blunted": False},
+	"nconic": {"n": 2, "apexLength": 2.0,
+		"radius0": 1.0, "radius1": 0.75, "radius2": 0.6, "radius3": 0.5, "radius4": 0.3, "radius5": 0.2, "radius6": 0.1, "radius7": 0.05, "radius8": 0.01, "radius9": 0.0,
+		"length1": 1.0, "length2": 0.5, "length3": 0.25, "length4": 0.125, "length5": 0.0625, "length6": 0.03125, "length7": 0.015625, "length8": 0.0078125, "length9": 0.00390625,
+		"sphereRadius": 0.2, "sphereRings": 32, "blunted": False},
+	"imported": {"filepath": "", "tolerance": 0.001},
+}
+
+#keys a spec can have besides its shape parameters
+SPEC_KEYS = ("shape", "segments", "name", "output", "lods", "lodRatio")
+
+#shapes whose stations are all corners of their outline (the joints of an n-conic, the stations a simplified import kept), so their coarser levels of detail
+#keep every station and only drop segments
+CORNER_STATION_SHAPES = ("nconic", "imported")
+
+def coerce_value(default, value):
+	#converts a spec value (which may be a string when read from CSV) to the type of the parameter's default
+	if isinstance(default, bool):
+		if isinstance(value, str):
+			return value.strip().lower() in ("1", "true", "yes", "on")
+		return bool(value)
+	if isinstance(default, str):
+		return str(value)
+	if isinstance(default, int):
+		return int(value)
+	return float(value)
+
+def spec_parameters(spec):
+	#the shape parameters of a cone spec (a dict with a "shape" key), with defaults filled in for anything it leaves out
+	shape = spec.get("shape")
+	if shape not in SPEC_DEFAULTS:
+		raise ValueError("unknown shape %r, expected one of %s" % (shape, ", ".join(sorted(SPEC_DEFAULTS))))
+	
+	params = dict(SPEC_DEFAULTS[shape])
+	for key, value in spec.items():
+		if key in params:
+			params[key] = coerce_value(params[key], value)
+		elif key not in SPEC_KEYS:
+			raise ValueError("unknown parameter %r for shape %r" % (key, shape))
+	return params
+
+def check_dimensions(shape, length, radius):
+	#raises ValueError for a shape with no length or no radius, which has no surface to build or evaluate
+	if length <= 0:
+		raise ValueError("%s must be longer than 0" % SHAPE_NAMES[shape])
+	if radius <= 0:
+		raise ValueError("%s needs a radius greater than 0" % SHAPE_NAMES[shape])
+
+#how close a blunting sphere may get to the largest radius it can have, as a fraction of it. At the largest radius the cap would cover the whole shape
+SPHERE_RADIUS_MARGIN = 0.999
+
+def corrected_parameters(spec):
+	#the shape parameters of a cone spec, with out-of-range parameters moved to the nearest values the shape can be built with, worked out in closed form
+	#so nothing has to be sampled to find out, except the blunting sphere's tangency point (see sphere_tangency), which is cached. The operators apply
+	#the same corrections to their own properties. Raises ValueError for parameters that can't be corrected (a shape with no length or no radius, or a tangent ogive wider than it is long)
+	shape = spec.get("shape")
+	p = spec_parameters(spec)
+	
+	if shape == "imported":
+		if not p["filepath"]:
+			raise ValueError("no profile file chosen")
+		importer.signature(p["filepath"])
+	elif shape == "nconic":
+		#n goes from 1 to 10, like the operator's property, since there are only 10 joints
+		p["n"] = min(max(p["n"], 1), 10)
+		p["apexLength"] = max(p["apexLength"], sum(p["length" + str(i)] for i in range(1, p["n"])))
+		check_dimensions(shape, p["apexLength"], max(nconic_joints(p)[0]))
+	else:
+		check_dimensions(shape, p.get("apexLength", p.get("length")), p.get("baseRadius", p.get("radius")))
+	
+	if shape == "tangent_ogive":
+		check_tangent_ogive(p["baseRadius"], p["apexLength"])
+	elif shape == "secant_ogive":
+		p["ogiveRadius"] = max(p["ogiveRadius"], secant_ogive_min_radius(p["baseRadius"], p["apexLength"]))
+	elif shape == "parabolic":
+		#K' goes from 0 (a cone) to 1 (a full parabola), like the operator's property. The formula divides by zero at 2
+		p["K"] = min(max(p["K"], 0.0), 1.0)
+	
+	if p.get("blunted"):
+		try:
+			func, slope, end, params = blunting_functions(shape, p)
+			baseRadius = func(math, end, *params) if end > 0 else 0
+		except ZeroDivisionError:
+			baseRadius = 0
+		if baseRadius <= 0:
+			raise ValueError("a blunted %s needs a radius and length greater than 0" % SHAPE_NAMES[shape])
+		#the sphere has to meet the shape above its base (or the n-conic's tip frustum above its joint), so it can be at most the normal distance
+		#there, r*sqrt(1+r'^2). That is the base radius of a tangent ogive, and radius0*sqrt(apexLength^2+radius0^2)/apexLength for a cone
+		smallest, largest = blunting_range(func, slope, end, *params)
+		p["sphereRadius"] = min(p["sphereRadius"], SPHERE_RADIUS_MARGIN*largest)
+		#the tangency point is found now, and cached for sampling the profile. A sphere too small for a blunt tip is moved up to the smallest that fits,
+		#and a shape with no room for any sphere is turned down
+		try:
+			sphere_tangency(func, slope, end, p["sphereRadius"], *params)
+		except ValueError:
+			p["sphereRadius"] = min(max(p["sphereRadius"], smallest/SPHERE_RADIUS_MARGIN), SPHERE_RADIUS_MARGIN*largest)
+			sphere_tangency(func, slope, end, p["sphereRadius"], *params)
+	return p
+
+def blunting_functions(shape, p):
+	#the radius function, slope, end and parameters a blunting sphere is fitted to for a shape's corrected parameters p (see sphere_tangency)
+	#the n-conic's are its tip frustum's
+	if shape == "tangent_ogive":
+		return tangent_ogive_radius, tangent_ogive_slope, p["apexLength"], (p["apexLength"], p["baseRadius"], ogive_radius(p["baseRadius"], p["apexLength"]))
+	if shape == "secant_ogive":
+		return secant_ogive_radius, secant_ogive_slope, p["apexLength"], (p["ogiveRadius"], secant_ogive_alpha(p["baseRadius"], p["apexLength"], p["ogiveRadius"]))
+	if shape == "prolate_hemispheroid":
+		return prolate_hemispheroid_radius, prolate_hemispheroid_slope, p["length"], (p["length"], p["radius"])
+	if shape == "parabolic":
+		return parabolic_radius, parabolic_slope, p["length"], (p["length"], p["radius"], p["K"])
+	if shape == "power_series":
+		return power_series_radius, power_series_slope, p["length"], (p["length"], p["radius"], p["n"])
+	if shape == "haack_series":
+		return haack_series_radius, haack_series_slope, p["length"], (p["length"], p["radius"], p["C"])
+	
+	radii, lengths = nconic_joints(p)
+	tipLength, tipRadius = nconic_tip_joint(p["apexLength"], radii, lengths, p["n"])
+	return cone_radius, cone_slope, tipLength, (tipRadius/tipLength if tipLength > 0 else 0,)
+
+def nconic_joints(p):
+	#radii and distances from the apex point of an n-conic's joints, in the form nconic_profile takes them
+	radii = tuple(p["radius" + str(i)] for i in range(p["n"]))
+	lengths = (None,) + tuple(p["length" + str(i)] for i in range(1, p["n"]))
+	return radii, lengths
+
+def profile_from_spec(spec):
+	#samples the profile of a cone spec, applying the same corrections to out-of-range parameters as the operators do
+	shape = spec.get("shape")
+	p = corrected_parameters(spec)
+	maxDeviation = p.get("maxDeviation") if p.get("adaptive") else 0
+	
+	if shape == "imported":
+		return imported_profile(p["filepath"], p["tolerance"], importer.signature(p["filepath"]))
+	
+	#sphere settings only go into the cache key when they are used
+	if p["blunted"]:
+		blunting = (True, p["sphereRadius"], p["sphereRings"])
+	else:
+		blunting = (False, 0, 0)
+	
+	if shape == "tangent_ogive":
+		return tangent_ogive_profile(p["baseRadius"], p["apexLength"], p["ogiveRings"], *blunting, maxDeviation)
+	
+	if shape == "secant_ogive":
+		return secant_ogive_profile(p["baseRadius"], p["apexLength"], p["ogiveRadius"], p["ogiveRings"], *blunting, maxDeviation)
+	
+	if shape == "prolate_hemispheroid":
+		return prolate_hemispheroid_profile(p["radius"], p["length"], p["rings"], p["smoothTip"], *blunting, maxDeviation)
+	
+	if shape == "parabolic":
+		return parabolic_profile(p["radius"], p["length"], p["K"], p["rings"], *blunting, maxDeviation)
+	
+	if shape == "power_series":
+		return power_series_profile(p["radius"], p["length"], p["n"], p["rings"], *blunting, maxDeviation)
+	
+	if shape == "haack_series":
+		return haack_series_profile(p["radius"], p["length"], p["C"], p["rings"], *blunting, maxDeviation)
+	
+	radii, lengths = nconic_joints(p)
+	return nconic_profile(p["apexLength"], radii, lengths, p["n"], *blunting)
+
+def station_estimate(spec):
+	#how many stations a spec's profile has, without sampling it, so impossibly large cones can be turned down before anything is allocated
+	#adaptive and imported profiles are sampled, since their station count depends on the shape (and sampling them costs the same at any tolerance)
+	#the n-conic's is an upper bound, since joints on top of the station before them are skipped
+	shape = spec.get("shape")
+	if shape == "imported" or spec_parameters(spec).get("adaptive"):
+		return len(profile_from_spec(spec))
+	
+	p = corrected_parameters(spec)
+	cap = p["sphereRings"] if p["blunted"] else 0
+	if shape in ("tangent_ogive", "secant_ogive"):
+		return p["ogiveRings"] + 1 + cap
+	if shape == "prolate_hemispheroid" and p["smoothTip"] and not p["blunted"]:
+		#the smooth tip's rings stations replace the first station
+		return 2*p["rings"]
+	if shape == "nconic":
+		return p["n"] + 1 + cap
+	return p["rings"] + 1 + cap
+
+def geometry_key(spec, level=0):
+	#a digest of everything in a spec that affects the mesh it builds (shape parameters, segments and level of detail), so equal keys mean identical meshes
+	#parameters that a spec's other settings make unused (max deviation without adaptive rings, sphere settings without blunting, joints past n) are left out
+	shape = spec.get("shape")
+	params = spec_parameters(spec)
+	if not params.get("adaptive", True):
+		del params["maxDeviation"]
+	if not params.get("blunted", True):
+		del params["sphereRadius"]
+		del params["sphereRings"]
+	if shape == "nconic":
+		for i in range(params["n"], 10):
+			del params["radius" + str(i)]
+			if i > 0:
+				del params["length" + str(i)]
+	
+	key = [shape, int(spec.get("segments", 32)), sorted(params.items())]
+	if shape == "imported":
+		#the same file name doesn't mean the same profile, once the file is edited
+		key.append(list(importer.signature(params["filepath"])))
+	if level > 0:
+		key.append(["lod", level, int(spec.get("lodRatio", 4))])
+	return hashlib.sha1(json.dumps(key).encode("utf-8")).hexdigest()
+
+#parameters that set how many rings a shape has
+RING_KEYS = ("rings", "ogiveRings", "sphereRings")
+
+def scaled_resolution(spec, scale):
+	#a copy of a cone spec with its rings and segments multiplied by scale, for rebuilding cones at a draft or final resolution. The max deviation of
+	#adaptive rings and the tolerance of imported profiles are divided by scale squared instead, since a chord strays from a curve by the square of its length
+	#counts aren't scaled below 3, unless they already were
+	params = spec_parameters(spec)
+	scaled = dict(spec)
+	for key in [key for key in RING_KEYS if key in params] + ["segments"]:
+		count = int(params[key] if key in params else spec.get(key, 32))
+		scaled[key] = max(min(count, 3), int(round(count*scale)))
+	for key in ("maxDeviation", "tolerance"):
+		if key in params:
+			scaled[key] = params[key]/(scale*scale)
+	return scaled
+
+def clear_caches():
+	#releases all cached profiles
+	for func in (tangent_ogive_profile, secant_ogive_profile, prolate_hemispheroid_profile, parabolic_profile, power_series_profile, haack_series_profile, nconic_profile, imported_profile, blunting_range, sphere_tangency):
+		func.cache_clear()
@@ -0,0 +1,80 @@
+#geometric properties of Advanced Cones shapes, computed straight from the sampled profile without building a mesh
+#between neighbouring stations the surface is a frustum, so summing exact frustum formulas over the stations gives the properties of the
+#surface of revolution the generator would build (with infinitely many segments). Has no dependency on blender
+
+import math
+
+from . import profiles
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+#labels for each property, in the order the operators show them
+PROPERTY_LABELS = (
+	("Volume", "volume"),
+	("Wetted Area", "wettedArea"),
+	("Planform Area", "planformArea"),
+	("Frontal Area", "frontalArea"),
+	("Centroid Height", "centroidHeight"),
+	("Length", "length"),
+	("Max Radius", "maxRadius"),
+	("Fineness Ratio", "fineness"),
+)
+
+def profile_properties(profile):
+	#volume, wetted (lateral) area, planform (side projected) area, frontal (base projected) area, height of the volume centroid above the base,
+	#length, max radius and fineness ratio (length over max diameter), as a dict keyed by the names in PROPERTY_LABELS
+	if len(profile) < 2:
+		return dict((key, 0.0) for label, key in PROPERTY_LABELS)
+
+	x = profile.x
+	r = profile.r
+
+	if numpy is not None:
+		h = numpy.diff(x)
+		r0 = r[:-1]
+		r1 = r[1:]
+		squares = r0*r0 + r0*r1 + r1*r1
+		volume = math.pi*float(numpy.sum(h*squares))/3
+		#first moment of each frustum's volume about x = 0
+		moment = math.pi*float(numpy.sum(x[:-1]*h*squares/3 + h*h*(r0*r0 + 2*r0*r1 + 3*r1*r1)/12))
+		wettedArea = math.pi*float(numpy.sum((r0+r1)*numpy.sqrt(h*h + (r1-r0)**2)))
+		planformArea = float(numpy.sum((r0+r1)*h))
+		maxRadius = float(numpy.max(r))
+	else:
+		volume = 0.0
+		moment = 0.0
+		wettedArea = 0.0
+		planformArea = 0.0
+		for i in range(len(x)-1):
+			h = x[i+1]-x[i]
+			r0 = r[i]
+			r1 = r[i+1]
+			squares = r0*r0 + r0*r1 + r1*r1
+			volume = volume + math.pi*h*squares/3
+			moment = moment + math.pi*(x[i]*h*squares/3 + h*h*(r0*r0 + 2*r0*r1 + 3*r1*r1)/12)
+			wettedArea = wettedArea + math.pi*(r0+r1)*math.sqrt(h*h + (r1-r0)**2)
+			planformArea = planformArea + (r0+r1)*h
+		maxRadius = max(r)
+
+	#a flat tip is closed with a disc
+	if not profile.pole():
+		wettedArea = wettedArea + math.pi*r[0]*r[0]
+
+	length = float(x[-1]-x[0])
+	return {
+		"volume": volume,
+		"wettedArea": wettedArea,
+		"planformArea": planformArea,
+		"frontalArea": math.pi*maxRadius*maxRadius,
+		"centroidHeight": profile.length - moment/volume if volume > 0 else 0.0,
+		"length": length,
+		"maxRadius": maxRadius,
+		"fineness": length/(2*maxRadius) if maxRadius > 0 else 0.0,
+	}
+
+def spec_properties(spec):
+	#properties of the shape described by a cone spec (see profiles.SPEC_DEFAULTS), sampled at the spec's own resolution
+	return profile_properties(profiles.profile_from_spec(spec))
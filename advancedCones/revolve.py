@@ -0,0 +1,437 @@
+#revolves sampled profiles into mesh buffers: flat vertex coordinates plus polygon connectivity in the layout blender's foreach_set expects
+#has no dependency on blender, so it can also be used headless (see batch.py)
+
+import math
+import array
+import functools
+import collections
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+#how many revolved vertex buffers to keep, so redo-panel edits that don't change the geometry (rotation) skip the revolve
+VERTEX_CACHE_SIZE = 4
+
+#most memory the vertex buffer cache and the face template cache may each hold. Buffers bigger than this are never cached, so dragging a
+#redo-panel slider on a multi-million vertex cone doesn't keep several copies of its buffers alive
+CACHE_BYTES = 64*1024*1024
+
+def buffer_bytes(value):
+	#memory used by a buffer, or a tuple of buffers
+	if isinstance(value, tuple):
+		return sum(buffer_bytes(v) for v in value)
+	if numpy is not None and isinstance(value, numpy.ndarray):
+		return value.nbytes
+	return len(value)*value.itemsize
+
+def bounded_cache(maxsize, maxBytes, key=None):
+	#like functools.lru_cache, but also keeps the total size of the cached buffers under maxBytes
+	#key, if given, turns the arguments into the cache key, otherwise the arguments are the key
+	def decorator(func):
+		cache = collections.OrderedDict()
+		
+		@functools.wraps(func)
+		def cached(*args):
+			cacheKey = key(*args) if key is not None else args
+			if cacheKey in cache:
+				cache.move_to_end(cacheKey)
+				return cache[cacheKey][0]
+			
+			result = func(*args)
+			size = buffer_bytes(result)
+			if size <= maxBytes:
+				cache[cacheKey] = (result, size)
+				total = sum(entry[1] for entry in cache.values())
+				while len(cache) > maxsize or total > maxBytes:
+					total = total - cache.popitem(last=False)[1][1]
+			return result
+		
+		cached.cache_clear = cache.clear
+		return cached
+	return decorator
+
+def ring_angles(segments):
+	#cosine and sine of the angle of each segment around the axis
+	if numpy is not None:
+		angles = numpy.arange(segments)*(2*math.pi/segments)
+		return numpy.cos(angles), numpy.sin(angles)
+	angles = [i*2*math.pi/segments for i in range(segments)]
+	return array.array('d', [math.cos(a) for a in angles]), array.array('d', [math.sin(a) for a in angles])
+
+def revolve_vertices(profile, segments):
+	#revolves the profile about the vertical axis, returning a flat x,y,z coordinate array with the base on the origin and the tip pointing up
+	#a tip station with zero radius becomes a single pole vertex (index 0), every other station becomes a ring of segments vertices
+	pole = profile.pole()
+	first = 1 if pole else 0
+	cos, sin = ring_angles(segments)
+	
+	if numpy is not None:
+		r = profile.r[first:, None]
+		z = profile.length - profile.x[first:, None]
+		rings = numpy.empty((len(profile)-first, segments, 3))
+		rings[:, :, 0] = r*cos
+		rings[:, :, 1] = r*sin
+		rings[:, :, 2] = z
+		
+		if pole:
+			return numpy.concatenate(([0, 0, profile.length-profile.x[0]], rings.ravel()))
+		return rings.ravel()
+	
+	coords = array.array('d')
+	if pole:
+		coords.extend((0, 0, profile.length-profile.x[0]))
+	for i in range(first, len(profile)):
+		r = profile.r[i]
+		z = profile.length - profile.x[i]
+		for j in range(segments):
+			coords.extend((r*cos[j], r*sin[j], z))
+	return coords
+
+def tip_faces(segments, pole):
+	#loop vertex indices and vertex counts of the faces closing the tip: a triangle fan around the pole vertex (index 0), or an n-gon closing
+	#a tip ring that isn't on the axis
+	if numpy is not None:
+		j = numpy.arange(segments)
+		if pole:
+			return numpy.stack((1+j, 1+(j+1) % segments, numpy.zeros(segments, dtype=j.dtype)), axis=-1).ravel(), numpy.full(segments, 3)
+		return j, numpy.array([segments])
+	
+	loops = array.array('i')
+	totals = array.array('i')
+	if pole:
+		for j in range(segments):
+			loops.extend((1+j, 1+(j+1) % segments, 0))
+			totals.append(3)
+	else:
+		loops.extend(range(segments))
+		totals.append(segments)
+	return loops, totals
+
+def band_faces(first, start, end, segments):
+	#loop vertex indices of the quads of bands start to end, four per face. Band k joins the rings of stations first+k and first+k+1
+	if numpy is not None:
+		j = numpy.arange(segments)
+		nextJ = (j+1) % segments
+		upper = first + numpy.arange(start, end)[:, None]*segments
+		lower = upper + segments
+		return numpy.stack((lower+j, lower+nextJ, upper+nextJ, upper+j), axis=-1).ravel()
+	
+	loops = array.array('i')
+	for k in range(start, end):
+		upper = first + k*segments
+		lower = upper + segments
+		for j in range(segments):
+			nextJ = (j+1) % segments
+			loops.extend((lower+j, lower+nextJ, upper+nextJ, upper+j))
+	return loops
+
+def revolve_faces(stations, segments, pole):
+	#face connectivity of a revolved profile with the given number of stations, as a flat array of loop vertex indices and the vertex count of each face
+	#the faces closing the tip (see tip_faces), then quads between neighbouring rings. Faces wind so their normals point outwards
+	first = 1 if pole else 0
+	bands = stations - first - 1
+	loops, totals = tip_faces(segments, pole)
+	quads = band_faces(first, 0, bands, segments)
+	
+	if numpy is not None:
+		return numpy.concatenate((loops, quads)), numpy.concatenate((totals, numpy.full(bands*segments, 4)))
+	
+	loops.extend(quads)
+	totals.extend([4]*(bands*segments))
+	return loops, totals
+
+#how many face templates to keep. Each one holds the connectivity for every face at that resolution, so this is kept small
+TOPOLOGY_CACHE_SIZE = 8
+
+@bounded_cache(TOPOLOGY_CACHE_SIZE, CACHE_BYTES)
+def face_template(stations, segments, pole):
+	#connectivity only depends on the number of stations, the number of segments and whether the tip is a pole or a capped ring, never on the shape
+	#so it is computed once per resolution and shared by every generator. Returns loop vertex indices, polygon loop starts and polygon loop totals, ready for foreach_set
+	loops, totals = revolve_faces(stations, segments, pole)
+	
+	if numpy is not None:
+		loops = loops.astype(numpy.int32)
+		totals = totals.astype(numpy.int32)
+		starts = numpy.zeros(len(totals), dtype=numpy.int32)
+		numpy.cumsum(totals[:-1], out=starts[1:])
+		
+		#shared between callers, so make sure nobody modifies it in place
+		for a in (loops, starts, totals):
+			a.flags.writeable = False
+	else:
+		starts = array.array('i', [0])
+		for total in totals[:-1]:
+			starts.append(starts[-1] + total)
+	
+	return loops, starts, totals
+
+def geometry_cache_key(profile, segments, key=None):
+	#cache key of the buffers revolved from a profile: the geometry key of the spec it was sampled from (see profiles.geometry_key) if the caller
+	#knows it, since levels of detail are a new profile object every time (see Profile.subsample). Otherwise the profile itself, which is enough
+	#for the shared profiles profiles.cached_profile returns
+	if key is not None:
+		return (key, segments)
+	return (profile, segments)
+
+@bounded_cache(VERTEX_CACHE_SIZE, CACHE_BYTES, geometry_cache_key)
+def vertex_buffer(profile, segments, key=None):
+	#revolved vertex coordinates, ready for foreach_set. Cached on geometry_cache_key
+	coords = revolve_vertices(profile, segments)
+	if numpy is not None:
+		coords = coords.astype(numpy.float32)
+		coords.flags.writeable = False
+	return coords
+
+def band_normals(profile):
+	#(radial, axial) normal components at the upper (tip side) and lower end of each band of faces between neighbouring stations
+	#from the profile's exact normals if it has them, or else the normal of the straight frustum between the two stations, at both ends
+	if profile.normals is not None:
+		radial, axial = profile.normals
+		return radial[:-1], axial[:-1], radial[1:], axial[1:]
+	
+	if numpy is not None:
+		dx = numpy.diff(profile.x)
+		dr = numpy.diff(profile.r)
+		length = numpy.hypot(dx, dr)
+		return dx/length, dr/length, dx/length, dr/length
+	
+	radial = array.array('d')
+	axial = array.array('d')
+	for i in range(len(profile)-1):
+		dx = profile.x[i+1]-profile.x[i]
+		dr = profile.r[i+1]-profile.r[i]
+		length = math.hypot(dx, dr)
+		radial.append(dx/length)
+		axial.append(dr/length)
+	return radial, axial, radial, axial
+
+def tip_normals(bands, segments, pole, cos, sin):
+	#normals of the corners of the faces closing the tip, for loop_normals. bands are band_normals' arrays
+	#a pole vertex has a different normal in each triangle of its fan (the direction of the middle of that triangle), which keeps pointed tips
+	#from shading flat. The flat disc closing a tip ring that isn't on the axis faces straight up
+	upperR, upperZ, lowerR, lowerZ = bands
+	if numpy is not None:
+		if not pole:
+			tip = numpy.zeros((segments, 3))
+			tip[:, 2] = 1
+			return tip.ravel()
+		
+		middle = (numpy.arange(segments)+0.5)*(2*math.pi/segments)
+		tip = numpy.empty((segments, 3, 3))
+		for corner, (radial, axial, c, s) in enumerate(((lowerR[0], lowerZ[0], cos, sin), (lowerR[0], lowerZ[0], numpy.roll(cos, -1), numpy.roll(sin, -1)),
+				(upperR[0], upperZ[0], numpy.cos(middle), numpy.sin(middle)))):
+			tip[:, corner, 0] = radial*c
+			tip[:, corner, 1] = radial*s
+			tip[:, corner, 2] = axial
+		return tip.ravel()
+	
+	normals = array.array('f')
+	if pole:
+		for j in range(segments):
+			nextJ = (j+1) % segments
+			middle = (j+0.5)*2*math.pi/segments
+			normals.extend((lowerR[0]*cos[j], lowerR[0]*sin[j], lowerZ[0], lowerR[0]*cos[nextJ], lowerR[0]*sin[nextJ], lowerZ[0],
+				upperR[0]*math.cos(middle), upperR[0]*math.sin(middle), upperZ[0]))
+	else:
+		for j in range(segments):
+			normals.extend((0, 0, 1))
+	return normals
+
+def band_loop_normals(bands, start, end, cos, sin):
+	#normals of the quad corners of band_normals' bands start to end, for loop_normals
+	upperR, upperZ, lowerR, lowerZ = bands
+	segments = len(cos)
+	if numpy is not None:
+		nextCos = numpy.roll(cos, -1)
+		nextSin = numpy.roll(sin, -1)
+		#quad corners are (lower j, lower j+1, upper j+1, upper j), see band_faces
+		quads = numpy.empty((end-start, segments, 4, 3))
+		for corner, (radial, axial, c, s) in enumerate(((lowerR, lowerZ, cos, sin), (lowerR, lowerZ, nextCos, nextSin),
+				(upperR, upperZ, nextCos, nextSin), (upperR, upperZ, cos, sin))):
+			quads[:, :, corner, 0] = radial[start:end, None]*c
+			quads[:, :, corner, 1] = radial[start:end, None]*s
+			quads[:, :, corner, 2] = axial[start:end, None]
+		return quads.ravel()
+	
+	normals = array.array('f')
+	for k in range(start, end):
+		for j in range(segments):
+			nextJ = (j+1) % segments
+			normals.extend((lowerR[k]*cos[j], lowerR[k]*sin[j], lowerZ[k], lowerR[k]*cos[nextJ], lowerR[k]*sin[nextJ], lowerZ[k],
+				upperR[k]*cos[nextJ], upperR[k]*sin[nextJ], upperZ[k], upperR[k]*cos[j], upperR[k]*sin[j], upperZ[k]))
+	return normals
+
+@bounded_cache(VERTEX_CACHE_SIZE, CACHE_BYTES, geometry_cache_key)
+def loop_normals(profile, segments, key=None):
+	#a unit normal for every face corner (loop), in face_template's loop order, as a flat x,y,z array ready for normals_split_custom_set. Cached on geometry_cache_key
+	#each corner takes the normal of the surface at its own station and angle, so shading is smooth even where the mesh is coarse
+	pole = profile.pole()
+	cos, sin = ring_angles(segments)
+	bands = band_normals(profile)
+	tip = tip_normals(bands, segments, pole, cos, sin)
+	quads = band_loop_normals(bands, 1 if pole else 0, len(bands[0]), cos, sin)
+	
+	if numpy is not None:
+		normals = numpy.concatenate((tip, quads)).astype(numpy.float32)
+		normals.flags.writeable = False
+		return normals
+	
+	tip.extend(quads)
+	return tip
+
+def revolve(profile, segments, key=None):
+	#the complete mesh for a profile: vertex coordinates, loop vertex indices, polygon loop starts and polygon loop totals
+	#key is the geometry key of the spec the profile was sampled from, if known, see geometry_cache_key
+	if len(profile) == 0:
+		return array.array('f'), array.array('i'), array.array('i'), array.array('i')
+	loops, starts, totals = face_template(len(profile), segments, profile.pole())
+	return vertex_buffer(profile, segments, key), loops, starts, totals
+
+def lod_levels(profile, segments, levels, ratio, keepStations=False):
+	#(profile, segments) for each level of detail, finest first. Level i has 1/ratio^i of the segments and takes every ratio^i-th station of the finest
+	#profile, so the finest profile is only sampled once, and when segments is a multiple of ratio^i every coarse vertex is also a vertex of the finest level
+	#stops early rather than go below 3 segments
+	result = []
+	step = 1
+	for i in range(levels):
+		if segments//step < 3:
+			break
+		result.append((profile if keepStations else profile.subsample(step), segments//step))
+		step = step*ratio
+	return result
+
+#rings revolved, or bands of faces or normals built, per step of a RevolveJob
+JOB_CHUNK_RINGS = 64
+
+class RevolveJob:
+	#builds the same buffers as revolve(), and with normals the same normals as loop_normals(), in steps of a chunk of rings at a time, so a caller
+	#can report progress between steps and stop early. The vertex rings come first, then the faces of the bands between them, then their normals,
+	#each chunk written straight into its place in the finished buffers. The faces and normals are built here rather than taken from the caches,
+	#since buffers as big as a job's are too big to be cached (see CACHE_BYTES)
+	#the last step is left to the caller: loading the finished buffers into a mesh, which can't be split up
+	def __init__(self, profile, segments, chunkRings=JOB_CHUNK_RINGS, normals=True):
+		self.profile = profile
+		self.segments = segments
+		self.pole = profile.pole()
+		first = 1 if self.pole else 0
+		stations = len(profile)
+		
+		#(method, start, end) for each step: the rings of stations start to end, then the faces and the normals of bands start to end (see band_faces)
+		#the tip's faces and normals go with the first band chunk, so there is always one, even for a profile with no bands
+		bands = max(stations-first-1, 0)
+		self.tasks = [(self.vertex_step, i, min(i+chunkRings, stations)) for i in range(first, stations, chunkRings)]
+		if stations > 0:
+			bandChunks = [(k, min(k+chunkRings, bands)) for k in range(0, max(bands, 1), chunkRings)]
+			self.tasks.extend((self.face_step, start, end) for start, end in bandChunks)
+			if normals:
+				self.tasks.extend((self.normal_step, start, end) for start, end in bandChunks)
+		self.task = 0
+		
+		#the tip's loops and faces come first, see revolve_faces
+		self.tipFaces = (segments if self.pole else 1) if stations > 0 else 0
+		self.tipLoops = (3*segments if self.pole else segments) if stations > 0 else 0
+		count = 3*profile.vertex_count(segments) if stations > 0 else 0
+		loopCount = self.tipLoops + 4*segments*bands
+		faceCount = self.tipFaces + segments*bands
+		if numpy is not None:
+			self.coords = numpy.empty(count, dtype=numpy.float32)
+			self.loops = numpy.empty(loopCount, dtype=numpy.int32)
+			self.starts = numpy.empty(faceCount, dtype=numpy.int32)
+			self.totals = numpy.empty(faceCount, dtype=numpy.int32)
+			self.normals = numpy.empty(3*loopCount, dtype=numpy.float32) if normals else None
+		else:
+			self.coords = array.array('d', bytes(8*count))
+			self.loops = array.array('i', bytes(4*loopCount))
+			self.starts = array.array('i', bytes(4*faceCount))
+			self.totals = array.array('i', bytes(4*faceCount))
+			self.normals = array.array('f', bytes(12*loopCount)) if normals else None
+		if self.pole:
+			self.coords[0:3] = float_triple(0, 0, profile.length-profile.x[0])
+		self.cos, self.sin = ring_angles(segments)
+		self.bands = band_normals(profile) if normals and stations > 1 else None
+	
+	def steps(self):
+		#total number of steps, including the caller's loading step
+		return len(self.tasks) + 1
+	
+	def progress(self):
+		#fraction of the steps done
+		return self.task/float(self.steps())
+	
+	def done(self):
+		#whether every step but the caller's loading step is done
+		return self.task >= len(self.tasks)
+	
+	def step(self):
+		method, start, end = self.tasks[self.task]
+		method(start, end)
+		self.task = self.task+1
+	
+	def vertex_step(self, start, end):
+		#rings are written straight into their place in the finished buffer. Stations are revolved one ring each, so unlike revolve_vertices
+		#a chunk never treats its first station as a pole
+		profile = self.profile
+		segments = self.segments
+		offset = 3*((1 if self.pole else 0) + (start-(1 if self.pole else 0))*segments)
+		if numpy is not None:
+			rings = self.coords[offset:offset+3*(end-start)*segments].reshape(end-start, segments, 3)
+			rings[:, :, 0] = profile.r[start:end, None]*self.cos
+			rings[:, :, 1] = profile.r[start:end, None]*self.sin
+			rings[:, :, 2] = profile.length - profile.x[start:end, None]
+		else:
+			for i in range(start, end):
+				r = profile.r[i]
+				z = profile.length - profile.x[i]
+				for j in range(segments):
+					self.coords[offset:offset+3] = array.array('d', (r*self.cos[j], r*self.sin[j], z))
+					offset = offset+3
+	
+	def face_step(self, start, end):
+		#every band is segments quads, so the loop starts of its faces are known without a running sum over the faces before it
+		segments = self.segments
+		if start == 0:
+			loops, totals = tip_faces(segments, self.pole)
+			self.loops[0:self.tipLoops] = loops
+			self.totals[0:self.tipFaces] = totals
+			self.starts[0:self.tipFaces] = sequence(0, self.tipLoops, self.tipLoops//self.tipFaces)
+		
+		offset = self.tipLoops + 4*segments*start
+		face = self.tipFaces + segments*start
+		count = segments*(end-start)
+		self.loops[offset:offset+4*count] = band_faces(1 if self.pole else 0, start, end, segments)
+		self.starts[face:face+count] = sequence(offset, offset+4*count, 4)
+		if numpy is not None:
+			self.totals[face:face+count] = 4
+		else:
+			self.totals[face:face+count] = array.array('i', [4])*count
+	
+	def normal_step(self, start, end):
+		first = 1 if self.pole else 0
+		if start == 0:
+			self.normals[0:3*self.tipLoops] = tip_normals(self.bands, self.segments, self.pole, self.cos, self.sin)
+		offset = 3*(self.tipLoops + 4*self.segments*start)
+		quads = band_loop_normals(self.bands, first+start, first+end, self.cos, self.sin)
+		self.normals[offset:offset+len(quads)] = quads
+	
+	def result(self):
+		#the finished buffers, in the same form as revolve() returns them, followed by the loop normals (None if the job wasn't asked for them)
+		return self.coords, self.loops, self.starts, self.totals, self.normals
+
+def sequence(start, stop, step):
+	#an int32 array of start, start+step, ... below stop
+	if numpy is not None:
+		return numpy.arange(start, stop, step, dtype=numpy.int32)
+	return array.array('i', range(start, stop, step))
+
+def float_triple(x, y, z):
+	if numpy is not None:
+		return numpy.array((x, y, z), dtype=numpy.float32)
+	return array.array('d', (x, y, z))
+
+def clear_caches():
+	#releases all cached vertex buffers, face templates and normals
+	vertex_buffer.cache_clear()
+	face_template.cache_clear()
+	loop_normals.cache_clear()
@@ -0,0 +1,76 @@
+#parameter sweeps for Advanced Cones. Expands grids of parameter values into cone specs, and generates them over a pool of processes (see batch.py)
+#
+#    python -m advancedCones.sweep sweep.json --output-dir meshes --jobs 0
+#
+#a sweep file holds one sweep, or a list of them. Each sweep has a base spec and a grid of values for some of its parameters, and every combination becomes a spec
+#values are either a list, or {"start": a, "stop": b, "count": n} for n evenly spaced values from a to b inclusive
+#    {"base": {"shape": "haack_series", "segments": 64, "output": "haack_C{C}_L{length}.stl"},
+#     "grid": {"C": [0, 0.333, 0.667], "length": {"start": 2, "stop": 4, "count": 5}}}
+#{key} placeholders in the base's output name are filled in from each spec
+
+import os
+import sys
+import json
+import argparse
+import itertools
+
+from . import batch
+
+def grid_values(values):
+	if isinstance(values, dict):
+		count = int(values["count"])
+		#all floats, like the stepped values, so whole-number start and stop values don't name their files differently from the rest
+		if count == 1:
+			return [float(values["start"])]
+		step = (values["stop"]-values["start"])/(count-1)
+		return [values["start"] + step*i for i in range(count-1)] + [float(values["stop"])]
+	return list(values)
+
+def expand(base, grid):
+	#yields a spec for every combination of grid values, in order with the last grid key varying fastest
+	keys = list(grid)
+	for combination in itertools.product(*[grid_values(grid[key]) for key in keys]):
+		spec = dict(base)
+		spec.update(zip(keys, combination))
+		if "output" in base:
+			spec["output"] = base["output"].format(**spec)
+		yield spec
+
+def expand_sweeps(sweeps):
+	#the specs of one sweep, or of a list of sweeps one after the other
+	if isinstance(sweeps, dict):
+		sweeps = [sweeps]
+	return itertools.chain.from_iterable(expand(sweep["base"], sweep.get("grid", {})) for sweep in sweeps)
+
+def sweep_size(sweeps):
+	if isinstance(sweeps, dict):
+		sweeps = [sweeps]
+	total = 0
+	for sweep in sweeps:
+		count = 1
+		for values in sweep.get("grid", {}).values():
+			count = count*len(grid_values(values))
+		total = total+count
+	return total
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(prog="python -m advancedCones.sweep", description="Generate Advanced Cones meshes for every combination of a grid of parameter values, without blender")
+	parser.add_argument("sweep", help="JSON file of one sweep or a list of sweeps")
+	batch.add_generate_arguments(parser)
+	parser.add_argument("-n", "--dry-run", action="store_true", help="only print how many specs the sweep expands to")
+	args = parser.parse_args(argv)
+	
+	with open(args.sweep) as f:
+		sweeps = json.load(f)
+	
+	if args.dry_run:
+		print(sweep_size(sweeps))
+		return 0
+	
+	if not os.path.isdir(args.output_dir):
+		os.makedirs(args.output_dir)
+	
+	return batch.report(batch.generate(expand_sweeps(sweeps), args.output_dir, args.format, args.jobs or None, args.chunk_size, args.stream))
+
+if __name__ == "__main__":
+	sys.exit(main())
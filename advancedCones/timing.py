@@ -0,0 +1,91 @@
+#per-stage timing of cone generation. Has no dependency on blender, so the batch generator can use it too
+#every generation records a Timings, which is passed to each function registered with add_hook, e.g. to feed a metrics collector
+#
+#    def collect(shape, timings):
+#        for name, seconds, vertices, faces in timings.stages:
+#            metrics.record(shape + "." + name, seconds)
+#    advancedCones.timing.add_hook(collect)
+
+import time
+import collections
+
+hooks = []
+
+#(seconds, vertices) of recent generations, to estimate how long the next one will take
+history = collections.deque(maxlen=16)
+
+#seconds per vertex to assume before anything has been timed
+DEFAULT_SECONDS_PER_VERTEX = 0.000001
+
+def add_hook(hook):
+	#hook(shape, timings) is called after every generation
+	if hook not in hooks:
+		hooks.append(hook)
+
+def remove_hook(hook):
+	if hook in hooks:
+		hooks.remove(hook)
+
+def publish(shape, timings):
+	vertices = timings.vertices()
+	if vertices > 0:
+		history.append((timings.total(), vertices))
+	for hook in list(hooks):
+		hook(shape, timings)
+
+def seconds_per_vertex():
+	#average cost of a vertex over the recent generations big enough to time reliably, or the default
+	timed = [(seconds, vertices) for seconds, vertices in history if vertices >= 10000]
+	if not timed:
+		return DEFAULT_SECONDS_PER_VERTEX
+	return sum(seconds for seconds, vertices in timed)/sum(vertices for seconds, vertices in timed)
+
+class Stage:
+	def __init__(self, timings, name):
+		self.timings = timings
+		self.name = name
+		self.vertices = 0
+		self.faces = 0
+	
+	def counts(self, vertices, faces):
+		#vertex and face counts of what the stage produced
+		self.vertices = vertices
+		self.faces = faces
+	
+	def __enter__(self):
+		self.start = time.perf_counter()
+		return self
+	
+	def __exit__(self, *exc):
+		self.timings.stages.append((self.name, time.perf_counter() - self.start, self.vertices, self.faces))
+		return False
+
+class Timings:
+	#wall time and vertex/face counts of each stage of one generation, as (name, seconds, vertices, faces) in the order they ran
+	def __init__(self):
+		self.stages = []
+	
+	def stage(self, name):
+		#with timings.stage("revolve") as stage: ... times the block, stage.counts(vertices, faces) records its output size
+		return Stage(self, name)
+	
+	def add(self, name, seconds, vertices=0, faces=0):
+		#records a stage that was timed some other way
+		self.stages.append((name, seconds, vertices, faces))
+	
+	def total(self):
+		return sum(seconds for name, seconds, vertices, faces in self.stages)
+	
+	def vertices(self):
+		#the most vertices any stage produced
+		return max([vertices for name, seconds, vertices, faces in self.stages] or [0])
+	
+	def summary(self):
+		#one line, e.g. "12.3 ms total: profile 0.4 ms, revolve 3.1 ms (16512 verts, 16384 faces), mesh 8.8 ms"
+		parts = []
+		for name, seconds, vertices, faces in self.stages:
+			if vertices or faces:
+				parts.append("%s %.1f ms (%d verts, %d faces)" % (name, seconds*1000, vertices, faces))
+			else:
+				parts.append("%s %.1f ms" % (name, seconds*1000))
+		return "%.1f ms total: %s" % (self.total()*1000, ", ".join(parts))
@@ -0,0 +1,202 @@
+#accuracy benchmark for the Advanced Cones generators. Measures how far each generated mesh strays from the closed-form shape it approximates,
+#for a range of resolutions, so ring and segment counts can be picked from the error they buy rather than by eye
+#
+#    python benchmarks/bench_accuracy.py -o accuracy.json --plot accuracy.png --target 0.001
+#
+#every face of a revolved profile is a flat trapezoid between two rings, so the mesh surface is known exactly from the profile and the segment count.
+#each trapezoid is sampled on a grid, and the radial distance of every sample from the axis is compared with the analytic radius at the same height
+#errors are reported as the maximum and the area-weighted RMS of that radial deviation, both for the whole mesh and for the profile alone
+#(the meridian edges, which only depend on ring placement, not on the segment count)
+#near a tip where the profile runs perpendicular to the axis (ellipse, power series, sphere caps) a tiny offset of the surface is a large radial one,
+#so the max deviation normal to the surface (the radial deviation times the cosine of the slope angle) is reported too. Adaptive rings bound that one
+#for each shape, rings are swept with evenly spaced rings (uniform) and max deviation is swept with adaptive rings (adaptive)
+#the plot needs matplotlib, everything else needs numpy
+
+import os
+import sys
+import json
+import math
+import argparse
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy
+
+from advancedCones import profiles
+from advancedCones import evaluators
+
+#(name, shape, parameters that differ from the defaults, parameters set to the ring count, whether the shape has adaptive rings)
+CASES = (
+	("tangent_ogive", "tangent_ogive", {}, ("ogiveRings",), True),
+	("tangent_ogive_blunted", "tangent_ogive", {"blunted": True}, ("ogiveRings", "sphereRings"), True),
+	("secant_ogive", "secant_ogive", {}, ("ogiveRings",), True),
+	("prolate_hemispheroid", "prolate_hemispheroid", {}, ("rings",), True),
+	("parabolic", "parabolic", {}, ("rings",), True),
+	("power_series", "power_series", {}, ("rings",), True),
+	("haack_series", "haack_series", {}, ("rings",), True),
+	("nconic_blunted", "nconic", {"n": 1, "blunted": True}, ("sphereRings",), False),
+)
+
+RINGS = (4, 8, 16, 32, 64, 128, 256, 512, 1024, 2048)
+DEVIATIONS = (0.1, 0.03, 0.01, 0.003, 0.001, 0.0003, 0.0001, 0.00003, 0.00001)
+
+#samples per trapezoid along the profile, and across half of it around the axis (the other half mirrors it)
+PROFILE_SAMPLES = 32
+SEGMENT_SAMPLES = 8
+
+def exact_radius(spec):
+	#the exact radius of a spec's shape as a function of x (distance from the apex point), on numpy arrays. Comes from the shape's evaluator, which
+	#corrects the spec's parameters and fits blunting caps exactly as the generators do, so the reference always matches the shape that was sampled
+	return evaluators.evaluator_from_spec(spec).radius
+
+def deviation(profile, segments, radius):
+	#(max, rms, max normal) deviation of the revolved mesh from the exact radius function, and the same for the profile alone
+	x = numpy.asarray(profile.x)
+	r = numpy.asarray(profile.r)
+
+	s = (numpy.arange(PROFILE_SAMPLES)+0.5)/PROFILE_SAMPLES
+	t = numpy.linspace(0, 0.5, SEGMENT_SAMPLES+1)
+	#distance from the axis of a point a fraction t of the way along the straight edge between two vertices of a ring, relative to the ring radius
+	shrink = numpy.sqrt(1 - 2*t*(1-t)*(1 - math.cos(2*math.pi/segments)))
+
+	sampleX = x[:-1,None] + (x[1:]-x[:-1])[:,None]*s
+	sampleR = r[:-1,None] + (r[1:]-r[:-1])[:,None]*s
+	exact = radius(sampleX)
+
+	#each sample stands for a strip of surface whose area is proportional to its radius times the chord length of its interval
+	chord = numpy.sqrt((x[1:]-x[:-1])**2 + (r[1:]-r[:-1])**2)
+	weight = sampleR*chord[:,None]
+
+	#the samples increase along x, so the slope of the exact profile can be taken from them directly
+	cosine = 1/numpy.sqrt(1 + numpy.gradient(exact.ravel(), sampleX.ravel())**2).reshape(exact.shape)
+
+	profileError = exact - sampleR
+	meshError = exact[:,:,None] - sampleR[:,:,None]*shrink
+	meshWeight = weight[:,:,None]*shrink
+
+	def stats(error, weight, cosine):
+		total = numpy.sum(weight)
+		rms = math.sqrt(float(numpy.sum(weight*error*error))/total) if total > 0 else 0.0
+		return float(numpy.max(numpy.abs(error))), rms, float(numpy.max(numpy.abs(error)*cosine))
+
+	return stats(meshError, meshWeight, cosine[:,:,None]), stats(profileError, weight, cosine)
+
+def case_specs(shape, parameters, ringKeys, adaptive, segments, rings, deviations):
+	#(strategy, resolution, spec) for every point of the sweep
+	base = dict(profiles.SPEC_DEFAULTS[shape])
+	base.update(parameters)
+	base["shape"] = shape
+	base["segments"] = segments
+	for count in rings:
+		spec = dict(base)
+		for key in ringKeys:
+			spec[key] = count
+		yield "uniform", count, spec
+	if adaptive:
+		for maxDeviation in deviations:
+			spec = dict(base)
+			spec["adaptive"] = True
+			spec["maxDeviation"] = maxDeviation
+			yield "adaptive", maxDeviation, spec
+
+def run(cases, segments, rings, deviations):
+	results = []
+	for name, shape, parameters, ringKeys, adaptive in CASES:
+		if cases and name not in cases:
+			continue
+		for strategy, resolution, spec in case_specs(shape, parameters, ringKeys, adaptive, segments, rings, deviations):
+			profile = profiles.profile_from_spec(spec)
+			(meshMax, meshRms, meshNormal), (profileMax, profileRms, profileNormal) = deviation(profile, segments, exact_radius(spec))
+			results.append({
+				"case": name,
+				"strategy": strategy,
+				"resolution": resolution,
+				"segments": segments,
+				"stations": len(profile),
+				"vertices": profile.vertex_count(segments),
+				"maxDeviation": meshMax,
+				"rmsDeviation": meshRms,
+				"normalDeviation": meshNormal,
+				"profileMaxDeviation": profileMax,
+				"profileRmsDeviation": profileRms,
+				"profileNormalDeviation": profileNormal,
+			})
+	return results
+
+def budgets(results, target, metric):
+	#the fewest vertices each case and strategy needs for a deviation (metric is maxDeviation or normalDeviation) of target or less, None if no resolution in the sweep got there
+	best = {}
+	for result in results:
+		key = (result["case"], result["strategy"])
+		best.setdefault(key, None)
+		if result[metric] <= target and (best[key] is None or result["vertices"] < best[key]["vertices"]):
+			best[key] = result
+	return best
+
+def plot(results, path):
+	#one log-log panel per case, max radial (solid), max normal (dotted) and RMS radial (dashed) profile deviation against vertex count for each strategy
+	import matplotlib
+	matplotlib.use("Agg")
+	from matplotlib import pyplot
+
+	names = [case[0] for case in CASES if any(result["case"] == case[0] for result in results)]
+	columns = 3
+	rows = int(math.ceil(len(names)/float(columns)))
+	figure, axes = pyplot.subplots(rows, columns, figsize=(5*columns, 4*rows), squeeze=False)
+	for i, name in enumerate(names):
+		ax = axes[i//columns][i%columns]
+		for strategy, colour in (("uniform", "tab:blue"), ("adaptive", "tab:orange")):
+			points = [result for result in results if result["case"] == name and result["strategy"] == strategy]
+			if not points:
+				continue
+			points.sort(key=lambda result: result["vertices"])
+			vertices = [result["vertices"] for result in points]
+			ax.loglog(vertices, [result["profileMaxDeviation"] for result in points], color=colour, marker="o", markersize=3, label=strategy + " max")
+			ax.loglog(vertices, [result["profileNormalDeviation"] for result in points], color=colour, linestyle=":", label=strategy + " max normal")
+			ax.loglog(vertices, [result["profileRmsDeviation"] for result in points], color=colour, linestyle="--", label=strategy + " rms")
+		ax.set_title(name)
+		ax.set_xlabel("vertices")
+		ax.set_ylabel("deviation")
+		ax.grid(True, which="both", alpha=0.3)
+		ax.legend(fontsize="small")
+	for i in range(len(names), rows*columns):
+		axes[i//columns][i%columns].axis("off")
+	figure.tight_layout()
+	figure.savefig(path, dpi=120)
+
+def main(argv):
+	parser = argparse.ArgumentParser(description="Measure how far Advanced Cones meshes deviate from their analytic shapes, against vertex count")
+	parser.add_argument("-o", "--output", default="accuracy.json", help="JSON file to write the results to (default: accuracy.json)")
+	parser.add_argument("--plot", help="image file to plot deviation against vertex count to (needs matplotlib)")
+	parser.add_argument("--cases", nargs="+", choices=[case[0] for case in CASES], help="only run these cases")
+	parser.add_argument("--segments", type=int, default=64, help="segments around the axis for every mesh (default: 64)")
+	parser.add_argument("--rings", type=int, nargs="+", default=RINGS, help="ring counts for uniform rings")
+	parser.add_argument("--deviations", type=float, nargs="+", default=DEVIATIONS, help="max deviations for adaptive rings")
+	parser.add_argument("--target", type=float, help="report the fewest vertices each shape needs to stay within this max deviation")
+	parser.add_argument("--normal", action="store_true", help="measure --target against the deviation normal to the surface instead of the radial one")
+	args = parser.parse_args(argv)
+
+	results = run(args.cases, args.segments, args.rings, args.deviations)
+	for result in results:
+		print("%-22s %-8s %10g  %8d verts  max %.3e  rms %.3e  normal %.3e  profile max %.3e  rms %.3e  normal %.3e" % (result["case"], result["strategy"], result["resolution"],
+			result["vertices"], result["maxDeviation"], result["rmsDeviation"], result["normalDeviation"],
+			result["profileMaxDeviation"], result["profileRmsDeviation"], result["profileNormalDeviation"]))
+
+	with open(args.output, "w") as f:
+		json.dump({"segments": args.segments, "results": results}, f, indent=1)
+
+	if args.target:
+		print("")
+		print("fewest vertices for a max %s deviation of %g with %d segments:" % ("normal" if args.normal else "radial", args.target, args.segments))
+		for (name, strategy), result in sorted(budgets(results, args.target, "normalDeviation" if args.normal else "maxDeviation").items()):
+			if result is None:
+				print("%-22s %-8s not reached" % (name, strategy))
+			else:
+				print("%-22s %-8s %8d verts (%s %g)" % (name, strategy, result["vertices"], "rings" if strategy == "uniform" else "max deviation", result["resolution"]))
+
+	if args.plot:
+		plot(results, args.plot)
+	return 0
+
+if __name__ == "__main__":
+	sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,178 @@
+#speed benchmark for the Advanced Cones generators. Builds every shape through the operators' build_geometry at a grid of ring and segment counts,
+#and records how long sampling the profile and building the mesh took, the peak memory, and the vertex and face counts, to a JSON file
+#
+#outside blender, bpy is replaced by the stand-in in stub_bpy.py (the mesh stage then only measures copying the buffers):
+#    python benchmarks/bench_generators.py -o results.json
+#under blender, the real mesh datablocks are built:
+#    blender --background --factory-startup --python benchmarks/bench_generators.py -- -o results.json
+#compare against an earlier run, exiting with 1 if any case got slower than the tolerance allows:
+#    python benchmarks/bench_generators.py -o new.json --compare results.json
+
+import os
+import sys
+import gc
+import json
+import time
+import argparse
+import platform
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import stub_bpy
+stubbed = stub_bpy.install()
+
+import bpy
+
+from advancedCones import profiles
+from advancedCones import revolve
+from advancedCones import timing
+from advancedCones import operators
+
+#(name, shape, parameters that differ from the defaults, parameters set to the ring count)
+#the unblunted n-conic has no ring parameter, its rings are fixed by n, so only its segments scale
+CASES = (
+	("tangent_ogive", "tangent_ogive", {}, ("ogiveRings",)),
+	("tangent_ogive_blunted", "tangent_ogive", {"blunted": True}, ("ogiveRings", "sphereRings")),
+	("secant_ogive", "secant_ogive", {}, ("ogiveRings",)),
+	("prolate_hemispheroid", "prolate_hemispheroid", {}, ("rings",)),
+	("parabolic", "parabolic", {}, ("rings",)),
+	("power_series", "power_series", {}, ("rings",)),
+	("haack_series", "haack_series", {}, ("rings",)),
+	("haack_series_blunted", "haack_series", {"blunted": True}, ("rings", "sphereRings")),
+	("nconic", "nconic", {"n": 4}, ()),
+	("nconic_blunted", "nconic", {"n": 1, "blunted": True}, ("sphereRings",)),
+)
+
+SIZES = (32, 64, 128, 256, 512, 1024, 2048, 4096)
+
+def case_spec(shape, parameters, ringKeys, rings, segments):
+	spec = dict(profiles.SPEC_DEFAULTS[shape])
+	spec.update(parameters)
+	for key in ringKeys:
+		spec[key] = rings
+	spec["shape"] = shape
+	spec["segments"] = segments
+	return spec
+
+def remove_new(before):
+	#deletes the objects and meshes a run created, so runs don't pile up in the blend data
+	#loops over copies, since removing from a bpy.data collection while iterating over it skips elements
+	for obj in list(bpy.data.objects):
+		if obj.name not in before[0]:
+			bpy.data.objects.remove(obj, do_unlink=True)
+	for mesh in list(bpy.data.meshes):
+		if mesh.name not in before[1]:
+			bpy.data.meshes.remove(mesh)
+
+def run_once(name, spec):
+	#one generation from a cold cache, as (timings, profile stations)
+	profiles.clear_caches()
+	revolve.clear_caches()
+	before = (set(obj.name for obj in bpy.data.objects), set(mesh.name for mesh in bpy.data.meshes))
+
+	timings = timing.Timings()
+	with timings.stage("profile") as stage:
+		profile = profiles.profile_from_spec(spec)
+		stage.counts(len(profile), 0)
+	operators.build_geometry(profile, spec["segments"], (0, 0, 0), name, timings)
+
+	remove_new(before)
+	return timings, len(profile)
+
+def run_case(name, spec, rings, repeat):
+	#the fastest of repeat timed runs, then one more run under tracemalloc for the peak memory
+	#tracemalloc sees python and numpy allocations, but not blender's own mesh storage, so under blender the peak leaves out the mesh datablock
+	best = None
+	for i in range(repeat):
+		gc.collect()
+		timings, stations = run_once(name, spec)
+		if best is None or timings.total() < best.total():
+			best = timings
+
+	gc.collect()
+	tracemalloc.start()
+	run_once(name, spec)
+	peak = tracemalloc.get_traced_memory()[1]
+	tracemalloc.stop()
+
+	stages = dict((stageName, (seconds, vertices, faces)) for stageName, seconds, vertices, faces in best.stages)
+	return {
+		"case": name,
+		"shape": spec["shape"],
+		"rings": rings,
+		"segments": spec["segments"],
+		"stations": stations,
+		"profileTime": stages["profile"][0],
+		"meshTime": best.total() - stages["profile"][0],
+		"totalTime": best.total(),
+		"peakMemory": peak,
+		"vertices": stages["mesh"][1] if "mesh" in stages else 0,
+		"faces": stages["mesh"][2] if "mesh" in stages else 0,
+		"stages": [list(stage) for stage in best.stages],
+	}
+
+def environment():
+	try:
+		import numpy
+		numpyVersion = numpy.__version__
+	except ImportError:
+		numpyVersion = None
+	return {
+		"bpy": "stub" if stubbed else ".".join(str(part) for part in bpy.app.version),
+		"python": platform.python_version(),
+		"numpy": numpyVersion,
+		"platform": platform.platform(),
+		"time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+	}
+
+def compare(results, baselinePath, tolerance):
+	#prints every case whose total time grew by more than the tolerance factor over the baseline. Returns the number of regressions
+	with open(baselinePath) as f:
+		baseline = dict(((result["case"], result["rings"], result["segments"]), result) for result in json.load(f)["results"])
+
+	regressions = 0
+	for result in results:
+		old = baseline.get((result["case"], result["rings"], result["segments"]))
+		if old is not None and result["totalTime"] > tolerance*old["totalTime"]:
+			print("REGRESSION %s %dx%d: %.1f ms, was %.1f ms" % (result["case"], result["rings"], result["segments"], result["totalTime"]*1000, old["totalTime"]*1000))
+			regressions = regressions+1
+	return regressions
+
+def main(argv):
+	parser = argparse.ArgumentParser(description="Benchmark the Advanced Cones generators across ring and segment counts")
+	parser.add_argument("-o", "--output", default="benchmark.json", help="JSON file to write the results to (default: benchmark.json)")
+	parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="ring and segment counts, each run as a square grid (default: 32 to 4096)")
+	parser.add_argument("--cases", nargs="+", choices=[case[0] for case in CASES], help="only run these cases")
+	parser.add_argument("--repeat", type=int, default=1, help="timed runs per case, the fastest is kept (default: 1)")
+	parser.add_argument("--compare", help="earlier results to check for regressions against")
+	parser.add_argument("--tolerance", type=float, default=1.25, help="slowdown factor over --compare that counts as a regression (default: 1.25)")
+	args = parser.parse_args(argv)
+
+	results = []
+	for name, shape, parameters, keys in CASES:
+		if args.cases and name not in args.cases:
+			continue
+		for size in args.sizes:
+			result = run_case(name, case_spec(shape, parameters, keys, size, size), size, args.repeat)
+			results.append(result)
+			print("%-22s %5dx%-5d profile %9.2f ms  mesh %9.2f ms  peak %8.1f MB  %9d verts" % (name, size, size,
+				result["profileTime"]*1000, result["meshTime"]*1000, result["peakMemory"]/1048576.0, result["vertices"]))
+
+	with open(args.output, "w") as f:
+		json.dump({"environment": environment(), "results": results}, f, indent=1)
+
+	if args.compare:
+		return 1 if compare(results, args.compare, args.tolerance) else 0
+	return 0
+
+if __name__ == "__main__":
+	#blender passes its own arguments too, the script's come after "--"
+	argv = sys.argv[sys.argv.index("--")+1:] if "--" in sys.argv else sys.argv[1:]
+	code = main(argv)
+	if not stubbed:
+		#blender ignores the script's return value, so quit explicitly to report it
+		sys.stdout.flush()
+		os._exit(code)
+	sys.exit(code)
@@ -0,0 +1,126 @@
+#a minimal stand-in for blender's bpy, bmesh and mathutils modules, so the benchmarks can run the operators' build_geometry outside blender
+#only covers what building a cone in object mode touches. Mesh data is copied into flat arrays like blender copies it into its own storage,
+#so the mesh and normals stages still have a realistic cost, but nothing else (edges, undo, drawing) is modelled
+
+import sys
+import types
+
+try:
+	import numpy
+except ImportError:
+	numpy = None
+
+def copy_array(seq):
+	if numpy is not None:
+		return numpy.array(seq, copy=True)
+	return list(seq)
+
+class Collection:
+	#a mesh's vertices, loops, polygons or edges, stored as one flat array per attribute
+	def __init__(self):
+		self.count = 0
+		self.attributes = {}
+	
+	def __len__(self):
+		return self.count
+	
+	def add(self, count):
+		self.count = self.count + count
+	
+	def foreach_set(self, attribute, seq):
+		self.attributes[attribute] = copy_array(seq)
+	
+	def foreach_get(self, attribute, seq):
+		seq[:] = self.attributes[attribute]
+
+class ID:
+	def __init__(self, name):
+		self.name = name
+		self.properties = {}
+	
+	def __getitem__(self, key):
+		return self.properties[key]
+	
+	def __setitem__(self, key, value):
+		self.properties[key] = value
+	
+	def __contains__(self, key):
+		return key in self.properties
+	
+	def get(self, key, default=None):
+		return self.properties.get(key, default)
+
+class Mesh(ID):
+	def __init__(self, name):
+		ID.__init__(self, name)
+		self.vertices = Collection()
+		self.edges = Collection()
+		self.loops = Collection()
+		self.polygons = Collection()
+	
+	def update(self, calc_edges=False):
+		pass
+	
+	def normals_split_custom_set(self, normals):
+		self.loops.attributes["normal"] = copy_array(normals)
+
+class Object(ID):
+	def __init__(self, name, data):
+		ID.__init__(self, name)
+		self.data = data
+		self.location = (0, 0, 0)
+		self.rotation_euler = [0, 0, 0]
+
+class IDCollection(dict):
+	#bpy.data.meshes or bpy.data.objects. New datablocks get a .001 style suffix when their name is taken, like in blender
+	def __init__(self, type):
+		dict.__init__(self)
+		self.type = type
+	
+	def new(self, name, *args):
+		base = name
+		i = 0
+		while name in self:
+			i = i+1
+			name = "%s.%03d" % (base, i)
+		self[name] = self.type(name, *args)
+		return self[name]
+	
+	def remove(self, item, **kwargs):
+		del self[item.name]
+	
+	def __iter__(self):
+		return iter(list(self.values()))
+
+class Links(list):
+	def link(self, obj):
+		self.append(obj)
+	
+	def unlink(self, obj):
+		self.remove(obj)
+
+class Properties:
+	#bpy.props: property definitions are just their defaults
+	def __getattr__(self, name):
+		return lambda **kwargs: kwargs.get("default")
+
+def install():
+	#puts the stand-ins in sys.modules, unless the real modules can be imported
+	try:
+		import bpy
+		return False
+	except ImportError:
+		pass
+	
+	bpy = types.ModuleType("bpy")
+	bpy.app = types.SimpleNamespace(version=(2, 93, 0))
+	bpy.props = Properties()
+	bpy.types = types.SimpleNamespace(Operator=object, Menu=object, AddonPreferences=object, PropertyGroup=object)
+	bpy.data = types.SimpleNamespace(meshes=IDCollection(Mesh), objects=IDCollection(Object))
+	bpy.context = types.SimpleNamespace(mode="OBJECT", collection=types.SimpleNamespace(objects=Links()),
+		scene=types.SimpleNamespace(cursor=types.SimpleNamespace(location=(0, 0, 0))), preferences=types.SimpleNamespace(addons={}))
+	
+	sys.modules["bpy"] = bpy
+	sys.modules["bmesh"] = types.ModuleType("bmesh")
+	sys.modules["mathutils"] = types.ModuleType("mathutils")
+	return True
@@ -0,0 +1,118 @@
+#checks the exact shape evaluators against the profiles the generators sample, so the two can't drift apart
+#
+#    python -m unittest discover tests
+
+import os
+import sys
+import math
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advancedCones import profiles
+from advancedCones import evaluators
+
+#every shape with its default parameters, blunted and not, plus a few that exercise other branches
+SPECS = [dict(shape=shape, blunted=blunted) for shape in sorted(profiles.SPEC_DEFAULTS) if shape != "imported" for blunted in (False, True)] + [
+	{"shape": "tangent_ogive", "adaptive": True, "blunted": True, "sphereRadius": 0.5},
+	{"shape": "secant_ogive", "ogiveRadius": 5.0},
+	{"shape": "prolate_hemispheroid", "smoothTip": False},
+	{"shape": "power_series", "n": 0.3},
+	{"shape": "power_series", "n": 0.75, "blunted": True},
+	{"shape": "haack_series", "C": 0.0, "blunted": True},
+	{"shape": "nconic", "n": 1, "blunted": True},
+	{"shape": "nconic", "n": 4, "blunted": True, "sphereRadius": 0.01},
+]
+
+def close(a, b, tolerance=1e-9):
+	#equal to within tolerance, relative to the larger of the two or 1, with infinities of the same sign equal
+	if math.isinf(a) or math.isinf(b):
+		return a == b
+	return abs(a-b) <= tolerance*max(abs(a), abs(b), 1)
+
+class EvaluatorTest(unittest.TestCase):
+	def test_radius_matches_profile(self):
+		for spec in SPECS:
+			profile = profiles.profile_from_spec(spec)
+			shape = evaluators.evaluator_from_spec(spec)
+			radii = shape.radius(list(profile.x))
+			for x, expected, radius in zip(profile.x, profile.r, radii):
+				self.assertTrue(close(float(radius), float(expected)), "%s: radius %r at x=%r, the profile has %r" % (spec, radius, x, expected))
+
+	def test_slope_matches_profile_normals(self):
+		#a profile's exact normals point along (1, r') in (radial, axial), so their angle is the slope's
+		for spec in SPECS:
+			profile = profiles.profile_from_spec(spec)
+			if profile.normals is None:
+				continue
+			shape = evaluators.evaluator_from_spec(spec)
+			slopes = shape.slope(list(profile.x))
+			radial, axial = profile.normals
+			for i in range(len(profile)):
+				self.assertTrue(close(math.atan(float(slopes[i])), math.atan2(float(axial[i]), float(radial[i])), 1e-7),
+					"%s: slope %r at x=%r doesn't match the profile's normal" % (spec, slopes[i], profile.x[i]))
+
+	def test_range_of_blunted_profile(self):
+		for spec in SPECS:
+			if not spec.get("blunted"):
+				continue
+			profile = profiles.profile_from_spec(spec)
+			shape = evaluators.evaluator_from_spec(spec)
+			self.assertTrue(close(shape.start, float(profile.x[0])), spec)
+			self.assertTrue(close(shape.length, float(profile.x[-1])), spec)
+
+	def test_cap_curvature(self):
+		shape = evaluators.evaluator_from_spec({"shape": "parabolic", "blunted": True, "sphereRadius": 0.25})
+		for x in (shape.start, (shape.start+shape.xt)/2):
+			self.assertTrue(close(float(shape.curvature(x)), -4.0))
+
+	def test_scalar_and_array_queries_agree(self):
+		for spec in SPECS:
+			shape = evaluators.evaluator_from_spec(spec)
+			stations = [shape.start + (shape.length-shape.start)*i/10.0 for i in range(11)]
+			for query in (shape.radius, shape.slope, shape.curvature):
+				values = query(stations)
+				for x, value in zip(stations, values):
+					self.assertTrue(close(float(query(x)), float(value)), "%s: %s at x=%r" % (spec, query.__name__, x))
+
+	def test_ogive_tips_are_pinned_to_the_axis(self):
+		#a tangent ogive as wide as it is long is a hemisphere, whose tip radius rounds to nan or a tiny value
+		for baseRadius in (0.3, 0.7, 1.0, 1.1):
+			for spec in ({"shape": "tangent_ogive", "baseRadius": baseRadius, "apexLength": baseRadius}, {"shape": "secant_ogive", "baseRadius": baseRadius, "apexLength": 1.0, "ogiveRadius": 0}):
+				self.assertEqual(float(profiles.profile_from_spec(spec).r[0]), 0.0, spec)
+
+	def test_nconic_skips_zero_length_frustums(self):
+		#joints 1 and 2 are at the same distance from the apex point, a flat step from radius 0.25 out to 0.5
+		shape = evaluators.NConic(2.0, (1.0, 0.5, 0.25), (None, 1.0, 1.0))
+		self.assertTrue(close(float(shape.radius(0.5)), 0.125))
+		self.assertTrue(close(float(shape.radius(1.0)), 0.5))
+		self.assertTrue(close(float(shape.slope(1.5)), 0.5))
+		self.assertEqual(float(shape.curvature(1.0)), 0.0)
+
+		#joints that collapse onto the tip
+		shape = evaluators.evaluator_from_spec({"shape": "nconic", "n": 3, "length1": 0, "length2": 0})
+		self.assertTrue(close(float(shape.radius(1.0)), 0.875))
+
+	def test_degenerate_shapes_raise_value_error(self):
+		for spec in ({"shape": "tangent_ogive", "baseRadius": 0}, {"shape": "secant_ogive", "baseRadius": 0}, {"shape": "prolate_hemispheroid", "radius": 0},
+				{"shape": "parabolic", "length": 0}, {"shape": "power_series", "radius": 0}, {"shape": "haack_series", "length": 0},
+				{"shape": "nconic", "n": 1, "apexLength": 0}, {"shape": "nconic", "n": 2, "radius0": 0, "radius1": 0}):
+			self.assertRaises(ValueError, evaluators.evaluator_from_spec, spec)
+
+		self.assertRaises(ValueError, evaluators.TangentOgive, 0.0, 1.0)
+		self.assertRaises(ValueError, evaluators.TangentOgive, 2.0, 1.0)
+		self.assertRaises(ValueError, profiles.corrected_parameters, {"shape": "tangent_ogive", "baseRadius": 2.0, "apexLength": 1.0, "blunted": True})
+		self.assertRaises(ValueError, evaluators.ProlateHemispheroid, 0.0, 1.0)
+		self.assertRaises(ValueError, evaluators.PowerSeries, 0.0, 1.0, 0.5)
+		self.assertRaises(ValueError, evaluators.Parabolic, 1.0, 1.0, 2.0)
+		self.assertRaises(ValueError, evaluators.NConic, 0.0, (1.0,), (None,))
+		self.assertRaises(ValueError, evaluators.NConic, 1.0, (1.0, 0.5), (None, 0.0), True, 0.1)
+
+	def test_out_of_range_spec_parameters_are_corrected(self):
+		#the same corrections as the generators, so these still evaluate
+		self.assertEqual(len(evaluators.evaluator_from_spec({"shape": "nconic", "n": 0}).slopes), 1)
+		shape = evaluators.evaluator_from_spec({"shape": "parabolic", "K": 2})
+		self.assertTrue(close(float(shape.radius(1.0)), profiles.parabolic_radius(math, 1.0, 2.0, 1.0, 1.0)))
+
+if __name__ == "__main__":
+	unittest.main()
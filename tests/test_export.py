@@ -0,0 +1,65 @@
+#checks the streaming STL and PLY writers against the in-memory ones, which write the same mesh from whole buffers
+#
+#    python -m unittest discover tests
+
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advancedCones import profiles
+from advancedCones import revolve
+from advancedCones import export
+
+#a pointed tip, a blunted tip, a flat tip closed by an n-gon, and one with more segments than a PLY uchar vertex count holds
+SPECS = [
+	{"shape": "parabolic", "rings": 5, "segments": 8},
+	{"shape": "tangent_ogive", "blunted": True, "ogiveRings": 4, "sphereRings": 3, "segments": 6},
+	{"shape": "power_series", "n": 0, "rings": 3, "segments": 5},
+	{"shape": "power_series", "n": 0, "rings": 2, "segments": 300},
+]
+
+class ExportTest(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.TemporaryDirectory()
+		self.addCleanup(self.directory.cleanup)
+
+	def written(self, name, write, *args):
+		path = os.path.join(self.directory.name, name)
+		write(path, *args)
+		with open(path, "rb") as f:
+			return f.read()
+
+	def test_streamed_files_match_in_memory_files(self):
+		for spec in SPECS:
+			profile = profiles.profile_from_spec(spec)
+			mesh = revolve.revolve(profile, spec["segments"])
+			for format in sorted(export.STREAMERS):
+				expected = self.written("mesh." + format, export.write_mesh, mesh)
+				streamed = self.written("stream." + format, export.stream_mesh, profile, spec["segments"])
+				self.assertEqual(streamed, expected, "%s: streamed %s differs" % (spec, format))
+
+	def test_file_sizes_match_counts(self):
+		for spec in SPECS:
+			profile = profiles.profile_from_spec(spec)
+			segments = spec["segments"]
+			coords, loops, starts, totals = revolve.revolve(profile, segments)
+			vertices = profile.vertex_count(segments)
+			self.assertEqual(len(coords), 3*vertices)
+			self.assertEqual(len(totals), profile.face_count(segments))
+
+			#STL: an 80 byte header, a triangle count, then 50 bytes per triangle, with faces fan-triangulated
+			triangles = sum(total-2 for total in totals)
+			self.assertEqual(len(self.written("cone.stl", export.stream_mesh, profile, segments)), 84 + 50*triangles, spec)
+
+			#PLY: the header, 12 bytes per vertex, then each face's vertex count and a 4 byte index per vertex
+			countType = "uchar" if max(totals) <= 255 else "uint"
+			header = export.ply_header(vertices, len(totals), countType)
+			countBytes = 1 if countType == "uchar" else 4
+			size = len(header) + 12*vertices + sum(countBytes + 4*total for total in totals)
+			self.assertEqual(len(self.written("cone.ply", export.stream_mesh, profile, segments)), size, spec)
+
+if __name__ == "__main__":
+	unittest.main()
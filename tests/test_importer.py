@@ -0,0 +1,102 @@
+#checks the profile file readers, and that simplifying a profile keeps it within tolerance
+#
+#    python -m unittest discover tests
+
+import os
+import sys
+import math
+import array
+import bisect
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advancedCones import profiles
+from advancedCones import importer
+
+#a blunt nose with a little measurement noise, from the tip to the base
+STATIONS = [(0.01*i, math.sqrt(0.01*i) + 0.0005*math.sin(7.0*i)) for i in range(201)]
+
+def line_distance(x, r, x0, r0, x1, r1):
+	#distance from (x, r) to the line through (x0, r0) and (x1, r1)
+	return abs((x-x0)*(r1-r0) - (r-r0)*(x1-x0))/math.hypot(x1-x0, r1-r0)
+
+class ImporterTest(unittest.TestCase):
+	def setUp(self):
+		self.directory = tempfile.TemporaryDirectory()
+		self.addCleanup(self.directory.cleanup)
+
+	def path(self, name):
+		return os.path.join(self.directory.name, name)
+
+	def write_text(self, name, text):
+		with open(self.path(name), "w") as f:
+			f.write(text)
+		return self.path(name)
+
+	def test_collinear_stations_collapse_to_endpoints(self):
+		x = profiles.float_array([0.5*i for i in range(11)])
+		r = profiles.float_array([0.25*i for i in range(11)])
+		sx, sr = importer.simplify(x, r, 1e-9)
+		self.assertEqual(list(sx), [0.0, 5.0])
+		self.assertEqual(list(sr), [0.0, 2.5])
+
+	def test_dropped_stations_stay_within_tolerance(self):
+		#in the array type read_stations gives
+		x = profiles.float_array([s[0] for s in STATIONS])
+		r = profiles.float_array([s[1] for s in STATIONS])
+		for tolerance in (0.1, 0.01, 0.001):
+			sx, sr = importer.simplify(x, r, tolerance)
+			sx = list(sx)
+			self.assertTrue(2 <= len(sx) < len(x))
+			self.assertEqual((sx[0], sx[-1]), (x[0], x[-1]))
+			for station, radius in STATIONS:
+				#the kept stations either side of it, which are the same station when it was kept
+				i = bisect.bisect_left(sx, station)
+				if sx[i] == station:
+					continue
+				self.assertLessEqual(line_distance(station, radius, sx[i-1], sr[i-1], sx[i], sr[i]), tolerance, (tolerance, station))
+
+	def test_zero_tolerance_keeps_every_station(self):
+		x = profiles.float_array([s[0] for s in STATIONS])
+		r = profiles.float_array([s[1] for s in STATIONS])
+		sx, sr = importer.simplify(x, r, 0)
+		self.assertEqual(len(sx), len(x))
+
+	def test_text_and_binary_files_read_the_same_stations(self):
+		text = "# measured nose profile\nx, radius\n" + "".join("%r, %r\n" % station for station in STATIONS[:50]) + "\n# end\n"
+		values = array.array('d', [value for station in STATIONS[:50] for value in station])
+		if sys.byteorder == "big":
+			values.byteswap()
+		with open(self.path("nose.bin"), "wb") as f:
+			f.write(values.tobytes())
+
+		x, r = importer.read_stations(self.write_text("nose.csv", text))
+		bx, br = importer.read_stations(self.path("nose.bin"))
+		self.assertEqual(list(x), [s[0] - STATIONS[0][0] for s in STATIONS[:50]])
+		self.assertEqual(list(r), [s[1] for s in STATIONS[:50]])
+		self.assertEqual((list(bx), list(br)), (list(x), list(r)))
+
+		if importer.numpy is not None:
+			importer.numpy.save(self.path("nose.npy"), importer.numpy.array(STATIONS[:50]))
+			nx, nr = importer.read_stations(self.path("nose.npy"))
+			self.assertEqual((list(nx), list(nr)), (list(x), list(r)))
+
+		#space and tab separated, from the base up
+		spaced = "".join("%r\t%r extra\n" % station for station in reversed(STATIONS[:50]))
+		sx, sr = importer.read_stations(self.write_text("nose.txt", spaced))
+		self.assertEqual((list(sx), list(sr)), (list(x), list(r)))
+
+	def test_malformed_files_raise_value_error(self):
+		self.assertRaises(ValueError, importer.read_stations, self.write_text("bad.csv", "0, 0\n1, 0.5\nradius\n2, 1\n"))
+		self.assertRaises(ValueError, importer.read_stations, self.write_text("short.csv", "0, 0\n1\n"))
+		self.assertRaises(ValueError, importer.read_stations, self.write_text("one.csv", "x, r\n0, 0\n"))
+		self.assertRaises(ValueError, importer.read_stations, self.write_text("negative.csv", "0, 0\n1, -1\n"))
+		with open(self.path("odd.bin"), "wb") as f:
+			f.write(array.array('d', [0, 0, 1]).tobytes())
+		self.assertRaises(ValueError, importer.read_stations, self.path("odd.bin"))
+		self.assertRaises(ValueError, importer.read_stations, self.path("missing.csv"))
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,37 @@
+#checks what profiles.py works out without sampling a profile against the profile it samples
+#
+#    python -m unittest discover tests
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advancedCones import profiles
+
+#every shape with its default parameters, blunted and not, plus the settings that change the number of stations
+SPECS = [dict(shape=shape, blunted=blunted) for shape in sorted(profiles.SPEC_DEFAULTS) if shape != "imported" for blunted in (False, True)] + [
+	{"shape": "prolate_hemispheroid", "rings": 5},
+	{"shape": "prolate_hemispheroid", "rings": 5, "smoothTip": False},
+	{"shape": "prolate_hemispheroid", "rings": 5, "blunted": True, "sphereRings": 3},
+	{"shape": "tangent_ogive", "ogiveRings": 7, "blunted": True, "sphereRings": 2},
+	{"shape": "tangent_ogive", "adaptive": True},
+	{"shape": "parabolic", "rings": 1},
+	{"shape": "nconic", "n": 0},
+	{"shape": "nconic", "n": 4, "blunted": True, "sphereRings": 4},
+]
+
+class ProfileTest(unittest.TestCase):
+	def test_station_estimate_matches_profile(self):
+		for spec in SPECS:
+			self.assertEqual(profiles.station_estimate(spec), len(profiles.profile_from_spec(spec)), spec)
+
+	def test_station_estimate_is_an_upper_bound_for_skipped_joints(self):
+		#joint 2 is on top of joint 1, so the profile skips it
+		spec = {"shape": "nconic", "n": 3, "length1": 1.0, "radius1": 0.5, "length2": 1.0, "radius2": 0.5}
+		self.assertEqual(len(profiles.profile_from_spec(spec)), 3)
+		self.assertEqual(profiles.station_estimate(spec), 4)
+
+if __name__ == "__main__":
+	unittest.main()
@@ -0,0 +1,75 @@
+#checks the layout of revolved meshes: vertex and face counts, the single pole vertex at a pointed tip, and that the numpy and plain python paths agree
+#
+#    python -m unittest discover tests
+
+import os
+import sys
+import array
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from advancedCones import profiles
+from advancedCones import revolve
+
+#a pointed tip, a blunted tip (which also starts on the axis), and a flat tip closed by an n-gon
+SPECS = [
+	{"shape": "parabolic", "rings": 5},
+	{"shape": "tangent_ogive", "blunted": True, "ogiveRings": 4, "sphereRings": 3},
+	{"shape": "power_series", "n": 0, "rings": 3},
+]
+
+class RevolveTest(unittest.TestCase):
+	def test_counts(self):
+		for spec in SPECS:
+			profile = profiles.profile_from_spec(spec)
+			stations = len(profile)
+			for segments in (3, 8, 17):
+				coords, loops, starts, totals = revolve.revolve(profile, segments)
+				if profile.pole():
+					self.assertEqual(len(coords), 3*((stations-1)*segments + 1))
+					self.assertEqual(list(totals), [3]*segments + [4]*((stations-2)*segments))
+				else:
+					self.assertEqual(len(coords), 3*stations*segments)
+					self.assertEqual(list(totals), [segments] + [4]*((stations-1)*segments))
+				self.assertEqual(len(coords)//3, profile.vertex_count(segments))
+				self.assertEqual(len(totals), profile.face_count(segments))
+				self.assertEqual(list(starts), [sum(totals[:i]) for i in range(len(totals))])
+				self.assertEqual(len(loops), sum(totals))
+
+	def test_pointed_tip_is_one_vertex(self):
+		profile = profiles.profile_from_spec({"shape": "haack_series", "rings": 4})
+		coords, loops, starts, totals = revolve.revolve(profile, 8)
+		top = max(coords[2::3])
+		self.assertEqual(list(coords[0:3]), [0, 0, top])
+		self.assertEqual(list(coords[2::3]).count(top), 1)
+
+		#every tip triangle ends on the pole, and nothing else uses it
+		self.assertEqual([loops[start+2] for start in starts[:8]], [0]*8)
+		self.assertEqual(list(loops).count(0), 8)
+
+	def test_every_vertex_is_used(self):
+		for spec in SPECS:
+			coords, loops, starts, totals = revolve.revolve(profiles.profile_from_spec(spec), 6)
+			self.assertEqual(sorted(set(loops)), list(range(len(coords)//3)))
+
+	@unittest.skipIf(revolve.numpy is None, "needs numpy to compare against")
+	def test_numpy_and_python_paths_agree(self):
+		numpy = revolve.numpy
+		for spec in SPECS:
+			profile = profiles.profile_from_spec(spec)
+			for segments in (3, 8):
+				vertices = revolve.revolve_vertices(profile, segments)
+				faces = revolve.revolve_faces(len(profile), segments, profile.pole())
+				revolve.numpy = None
+				try:
+					pythonVertices = revolve.revolve_vertices(profile, segments)
+					pythonFaces = revolve.revolve_faces(len(profile), segments, profile.pole())
+				finally:
+					revolve.numpy = numpy
+				#as the float32 buffers loaded into the mesh
+				self.assertEqual(array.array('f', vertices.tolist()), array.array('f', pythonVertices), spec)
+				self.assertEqual([list(a) for a in faces], [list(a) for a in pythonFaces], spec)
+
+if __name__ == "__main__":
+	unittest.main()